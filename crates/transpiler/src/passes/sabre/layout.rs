@@ -36,7 +36,10 @@ use crate::target::{Target, TargetCouplingError};
 
 use super::dag::SabreDAG;
 use super::heuristic::Heuristic;
-use super::route::{RoutingProblem, RoutingResult, RoutingTarget, swap_map, swap_map_trial};
+use super::route::{
+    RoutingProblem, RoutingResult, RoutingTarget, SwapBound, bounded_swap_map, swap_map,
+    swap_map_trial,
+};
 
 #[allow(clippy::too_many_arguments)]
 #[pyfunction]
@@ -149,6 +152,7 @@ pub fn sabre_layout_and_routing(
             starting_layouts.extend(partial_layouts);
             add_heuristic_layouts(&mut starting_layouts, problem, allow_parallel);
             let num_layout_trials = starting_layouts.len();
+            let bound = SwapBound::default();
             let (_, result) = CondIterator::new(
                 seeds(num_layout_trials),
                 allow_parallel && num_layout_trials > 1,
@@ -164,11 +168,13 @@ pub fn sabre_layout_and_routing(
                         num_swap_trials,
                         allow_parallel && num_swap_trials > 1,
                         &starting_layouts[index],
+                        &bound,
                     ),
                 )
             })
-            .min_by_key(|(index, result)| (result.swap_count(), *index))
+            .min_by_key(|(index, result)| (trial_swap_count(result), *index))
             .expect("should have at least one layout trial");
+            let result = result.expect("the layout trial with the fewest swaps is never abandoned");
             let num_swaps = result.swap_count();
             let out = dag.physical_empty_like_with_capacity(
                 num_physical_qubits,
@@ -255,6 +261,7 @@ pub fn sabre_layout_and_routing(
                 }
                 add_heuristic_layouts(&mut starting_layouts, sub_problem, allow_parallel);
                 let num_layout_trials = starting_layouts.len();
+                let bound = SwapBound::default();
                 let (_, result) = CondIterator::new(
                     seeds(num_layout_trials),
                     allow_parallel && num_layout_trials > 1,
@@ -270,11 +277,14 @@ pub fn sabre_layout_and_routing(
                             num_swap_trials,
                             allow_parallel && num_layout_trials == 1,
                             &starting_layouts[index],
+                            &bound,
                         ),
                     )
                 })
-                .min_by_key(|(index, result)| (result.swap_count(), *index))
+                .min_by_key(|(index, result)| (trial_swap_count(result), *index))
                 .expect("should have at least one layout trial");
+                let result =
+                    result.expect("the layout trial with the fewest swaps is never abandoned");
                 for ((_, sub_phys), virt) in result
                     .initial_layout
                     .iter_virtual()
@@ -344,6 +354,20 @@ pub fn sabre_layout_and_routing(
     }
 }
 
+/// The swap count of a layout trial, for choosing the best one, where abandoned trials lose.
+#[inline]
+fn trial_swap_count(result: &Option<RoutingResult>) -> usize {
+    result
+        .as_ref()
+        .map_or(usize::MAX, |result| result.swap_count())
+}
+
+/// Run a single layout trial, and route the circuit from the layout it finds.
+///
+/// The final routing is abandoned, and this returns `None`, if it needs more swaps than `bound`,
+/// which is shared between all the layout trials competing for the best layout.  The iterations
+/// that improve the layout are always run in full, since their swap counts aren't comparable with
+/// those of the final routing.
 fn layout_trial<'a>(
     problem: RoutingProblem<'a>,
     seed: u64,
@@ -351,7 +375,8 @@ fn layout_trial<'a>(
     num_swap_trials: usize,
     run_swap_in_parallel: bool,
     starting_layout: &'_ [Option<PhysicalQubit>],
-) -> RoutingResult<'a> {
+    bound: &SwapBound,
+) -> Option<RoutingResult<'a>> {
     let num_physical_qubits: u32 = problem.target.neighbors.num_qubits().try_into().unwrap();
     let mut rng = Pcg64Mcg::seed_from_u64(seed);
 
@@ -407,12 +432,13 @@ fn layout_trial<'a>(
         }
         NLayout::from_vecs_unchecked(virt_to_phys, phys_to_virt)
     };
-    swap_map(
+    bounded_swap_map(
         problem,
         &initial_layout,
         Some(seed),
         num_swap_trials,
         Some(run_swap_in_parallel),
+        bound,
     )
 }
 
@@ -14,6 +14,7 @@ use std::cmp::Ordering;
 use std::collections::VecDeque;
 use std::convert::Infallible;
 use std::num::NonZero;
+use std::sync::atomic::{self, AtomicUsize};
 
 use numpy::{PyArray2, ToPyArray};
 use pyo3::Python;
@@ -999,6 +1000,32 @@ pub fn sabre_routing(
     result.rebuild().map(|dag| (dag, result.final_layout))
 }
 
+/// The lowest swap count of any completed trial in a set of routing trials that are competing to
+/// produce the fewest swaps.
+///
+/// Trials check their running swap count against the bound as they go, and give up as soon as it
+/// is strictly greater, since swaps are never removed and the trial can no longer be the best.
+/// The trial with the fewest swaps (and the lowest index among those) never exceeds the bound, so
+/// the chosen result does not depend on the order in which parallel trials run and finish.
+#[derive(Debug)]
+pub struct SwapBound(AtomicUsize);
+impl Default for SwapBound {
+    fn default() -> Self {
+        Self(AtomicUsize::new(usize::MAX))
+    }
+}
+impl SwapBound {
+    #[inline]
+    fn is_exceeded_by(&self, num_swaps: usize) -> bool {
+        num_swaps > self.0.load(atomic::Ordering::Relaxed)
+    }
+
+    #[inline]
+    fn record(&self, num_swaps: usize) {
+        self.0.fetch_min(num_swaps, atomic::Ordering::Relaxed);
+    }
+}
+
 /// Run (potentially in parallel) several trials of the Sabre routing algorithm on the given
 /// problem and return the one with fewest swaps.
 pub fn swap_map<'a>(
@@ -1008,6 +1035,29 @@ pub fn swap_map<'a>(
     num_trials: usize,
     run_in_parallel: Option<bool>,
 ) -> RoutingResult<'a> {
+    bounded_swap_map(
+        problem,
+        initial_layout,
+        seed,
+        num_trials,
+        run_in_parallel,
+        &SwapBound::default(),
+    )
+    .expect("the trial with the fewest swaps is never abandoned")
+}
+
+/// Like [swap_map], but abandon any trial that needs more swaps than `bound`, which can be shared
+/// with other sets of trials that are competing with these ones.
+///
+/// Returns `None` if every trial was abandoned.
+pub fn bounded_swap_map<'a>(
+    problem: RoutingProblem<'a>,
+    initial_layout: &'_ NLayout,
+    seed: Option<u64>,
+    num_trials: usize,
+    run_in_parallel: Option<bool>,
+    bound: &SwapBound,
+) -> Option<RoutingResult<'a>> {
     let seeds = match seed {
         Some(seed) => Pcg64Mcg::seed_from_u64(seed),
         None => Pcg64Mcg::try_from_rng(&mut SysRng).unwrap(),
@@ -1021,11 +1071,18 @@ pub fn swap_map<'a>(
         num_trials > 1
             && run_in_parallel.unwrap_or_else(|| getenv_use_multiple_threads() && num_trials > 1),
     )
-    .map(|seed| swap_map_trial(problem, initial_layout, seed))
+    .map(|seed| bounded_swap_map_trial(problem, initial_layout, seed, Some(bound)))
     .enumerate()
-    .min_by_key(|(index, result)| (result.order.swap_count(), *index))
-    .map(|(_, result)| result)
+    .min_by_key(|(index, result)| {
+        (
+            result
+                .as_ref()
+                .map_or(usize::MAX, |result| result.order.swap_count()),
+            *index,
+        )
+    })
     .expect("must have at least one trial")
+    .1
 }
 
 /// Run a single trial of the Sabre routing algorithm.
@@ -1034,7 +1091,22 @@ pub fn swap_map_trial<'a>(
     initial_layout: &NLayout,
     seed: u64,
 ) -> RoutingResult<'a> {
+    bounded_swap_map_trial(problem, initial_layout, seed, None)
+        .expect("unbounded trials always complete")
+}
+
+/// Run a single trial of the Sabre routing algorithm, abandoning it and returning `None` as soon
+/// as it has inserted more swaps than `bound`.
+fn bounded_swap_map_trial<'a>(
+    problem: RoutingProblem<'a>,
+    initial_layout: &NLayout,
+    seed: u64,
+    bound: Option<&SwapBound>,
+) -> Option<RoutingResult<'a>> {
     let (mut state, mut order) = State::begin(problem, initial_layout.clone(), seed);
+    // Every swap in `current_swaps` is attached to a top-level node of `order`, so this matches
+    // `order.swap_count()`.
+    let mut num_swaps = 0;
 
     let mut routable_nodes = Vec::<NodeIndex>::with_capacity(2);
     let mut num_search_steps = 0;
@@ -1079,6 +1151,10 @@ pub fn swap_map_trial<'a>(
             let force_routed = state.force_enable_closest_node(problem, &mut current_swaps);
             routable_nodes.extend(force_routed);
         }
+        num_swaps += current_swaps.len();
+        if bound.is_some_and(|bound| bound.is_exceeded_by(num_swaps)) {
+            return None;
+        }
         state.update_route(problem, &mut order, &routable_nodes, Some(current_swaps));
 
         if problem.heuristic.decay.is_some() {
@@ -1086,10 +1162,13 @@ pub fn swap_map_trial<'a>(
         }
         routable_nodes.clear();
     }
-    RoutingResult {
+    if let Some(bound) = bound {
+        bound.record(num_swaps);
+    }
+    Some(RoutingResult {
         problem,
         order,
         initial_layout: initial_layout.clone(),
         final_layout: state.layout,
-    }
+    })
 }
@@ -18,6 +18,7 @@ import numpy
 
 from qiskit.exceptions import QiskitError
 from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.parameterexpression import OpCode, Parameter, ParameterExpression
 
 
 def _compute_control_matrix(base_mat, num_ctrl_qubits, ctrl_state=None):
@@ -165,3 +166,145 @@ def with_controlled_gate_array(base_array, num_ctrl_qubits, cached_states=None):
         return cls
 
     return decorator
+
+
+def _batched_parameter_values(param, columns, num_bindings: int) -> float | numpy.ndarray:
+    """Evaluate a gate parameter for every binding, giving a scalar if it is constant."""
+    if isinstance(param, Parameter):
+        return columns[param]
+    if isinstance(param, ParameterExpression):
+        if (values := _evaluate_expression(param, columns)) is not None:
+            return numpy.broadcast_to(values.real, (num_bindings,))
+        parameters = list(param.parameters)
+        return numpy.array(
+            [
+                complex(param.bind({p: float(columns[p][i]) for p in parameters}).numeric()).real
+                for i in range(num_bindings)
+            ]
+        )
+    return float(param)
+
+
+_BINARY_UFUNCS = {
+    int(OpCode.ADD): numpy.add,
+    int(OpCode.SUB): numpy.subtract,
+    int(OpCode.MUL): numpy.multiply,
+    int(OpCode.DIV): numpy.true_divide,
+    int(OpCode.POW): numpy.power,
+}
+_REVERSED_UFUNCS = {
+    int(OpCode.RSUB): numpy.subtract,
+    int(OpCode.RDIV): numpy.true_divide,
+    int(OpCode.RPOW): numpy.power,
+}
+_UNARY_UFUNCS = {
+    int(OpCode.SIN): numpy.sin,
+    int(OpCode.COS): numpy.cos,
+    int(OpCode.TAN): numpy.tan,
+    int(OpCode.ASIN): numpy.arcsin,
+    int(OpCode.ACOS): numpy.arccos,
+    int(OpCode.ATAN): numpy.arctan,
+    int(OpCode.EXP): numpy.exp,
+    int(OpCode.LOG): numpy.log,
+    int(OpCode.SIGN): numpy.sign,
+    int(OpCode.CONJ): numpy.conjugate,
+    int(OpCode.ABS): numpy.abs,
+}
+
+
+def _evaluate_expression(expression, columns) -> numpy.ndarray | None:
+    """Evaluate a parameter expression for every binding at once with vectorized arithmetic.
+
+    ``columns`` maps each :class:`.Parameter` to a 1D array of its values.  The expression is
+    rebuilt from its QPY replay in the same way as :func:`.sympify`, but with NumPy ufuncs acting
+    on complex arrays.  Returns ``None`` if the expression contains an operation that cannot be
+    vectorized, such as a gradient.
+    """
+    if isinstance(expression, Parameter):
+        return numpy.asarray(columns[expression], dtype=complex)
+    if expression.is_symbol():
+        return numpy.asarray(columns[next(iter(expression.parameters))], dtype=complex)
+    try:
+        return numpy.asarray(complex(expression.numeric(strict=False)))
+    except TypeError:
+        pass
+
+    # Operands that are ``None`` refer to the results of previous instructions on the stack.  The
+    # op codes are compared as integers, since their instances are not singletons.
+    stack = []
+    with numpy.errstate(all="ignore"):
+        for inst in expression._qpy_replay:
+            for operand in (inst.lhs, inst.rhs):
+                if operand is None:
+                    continue
+                if isinstance(operand, ParameterExpression):
+                    if (operand := _evaluate_expression(operand, columns)) is None:
+                        return None
+                elif not isinstance(operand, (int, float, complex)):
+                    return None
+                stack.append(numpy.asarray(operand, dtype=complex))
+            if (ufunc := _BINARY_UFUNCS.get(int(inst.op))) is not None:
+                rhs = stack.pop()
+                stack.append(ufunc(stack.pop(), rhs))
+            elif (ufunc := _REVERSED_UFUNCS.get(int(inst.op))) is not None:
+                # The operands of reversed operations are already swapped in the replay.
+                rhs = stack.pop()
+                stack.append(ufunc(rhs, stack.pop()))
+            elif (ufunc := _UNARY_UFUNCS.get(int(inst.op))) is not None:
+                stack.append(ufunc(stack.pop()))
+            else:
+                return None
+    return stack.pop()
+
+
+def _batched_standard_gate_matrices(
+    operation, params: list[float | numpy.ndarray], num_bindings: int
+) -> numpy.ndarray:
+    """Get the matrices of a standard gate for every binding of its parameters at once.
+
+    Common single-qubit rotations are computed with vectorized arithmetic; other gates are
+    constructed one binding at a time.
+    """
+    name = operation.name
+    if name == "rz":
+        (theta,) = params
+        phase = numpy.exp(0.5j * numpy.asarray(theta))
+        return _batched_diagonal(phase.conjugate(), phase, num_bindings)
+    if name in ("p", "u1"):
+        (lam,) = params
+        return _batched_diagonal(1.0, numpy.exp(1j * numpy.asarray(lam)), num_bindings)
+    if name in ("rx", "ry", "r", "u", "u3", "u2"):
+        # All of these are exactly equal to a U gate with some choice of angles.
+        if name == "rx":
+            theta, phi, lam = params[0], -0.5 * numpy.pi, 0.5 * numpy.pi
+        elif name == "ry":
+            theta, phi, lam = params[0], 0.0, 0.0
+        elif name == "r":
+            theta, phi, lam = params[0], params[1] - 0.5 * numpy.pi, 0.5 * numpy.pi - params[1]
+        elif name == "u2":
+            theta, phi, lam = 0.5 * numpy.pi, params[0], params[1]
+        else:
+            theta, phi, lam = params
+        cos = numpy.cos(0.5 * numpy.asarray(theta))
+        sin = numpy.sin(0.5 * numpy.asarray(theta))
+        out = numpy.empty((num_bindings, 2, 2), dtype=complex)
+        out[:, 0, 0] = cos
+        out[:, 0, 1] = -numpy.exp(1j * numpy.asarray(lam)) * sin
+        out[:, 1, 0] = numpy.exp(1j * numpy.asarray(phi)) * sin
+        out[:, 1, 1] = numpy.exp(1j * (numpy.asarray(phi) + numpy.asarray(lam))) * cos
+        return out
+    # Anything else is evaluated one binding at a time.
+    gate_class = type(operation)
+    return numpy.array(
+        [
+            gate_class(*(p if numpy.ndim(p) == 0 else p[i] for p in params)).to_matrix()
+            for i in range(num_bindings)
+        ]
+    )
+
+
+def _batched_diagonal(first, second, num_bindings: int) -> numpy.ndarray:
+    out = numpy.zeros((num_bindings, 2, 2), dtype=complex)
+    out[:, 0, 0] = first
+    out[:, 1, 1] = second
+    return out
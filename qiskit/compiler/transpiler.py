@@ -16,14 +16,14 @@
 import logging
 import os
 from time import time
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 from collections.abc import Callable
 
 from qiskit import user_config
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.providers.backend import Backend
-from qiskit.transpiler import Layout, CouplingMap, PropertySet
+from qiskit.transpiler import Layout, CouplingMap, PropertySet, TranspileCache
 from qiskit.transpiler.basepasses import BasePass
 from qiskit.transpiler.exceptions import TranspilerError, CircuitTooWideForTarget
 from qiskit.transpiler.passes.synthesis.high_level_synthesis import HLSConfig
@@ -60,6 +60,8 @@ def transpile(
     ignore_backend_supplied_default_methods: bool = False,
     num_processes: int | None = None,
     qubits_initially_zero: bool = True,
+    parallel_mode: Literal["process", "thread"] = "process",
+    cache: TranspileCache | None = None,
 ) -> _CircuitT:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
@@ -250,6 +252,14 @@ def transpile(
             environment variable. If set to ``None`` the system default or local user configuration
             will be used.
         qubits_initially_zero: Indicates whether the input circuit is zero-initialized.
+        parallel_mode: How to transpile multiple circuits in parallel.  The default ``"process"``
+            uses separate processes if parallel execution is enabled.  ``"thread"`` instead uses up
+            to ``num_processes`` threads within this process, which avoids serializing the circuits
+            and the :class:`.Target`.  See :meth:`.PassManager.run` for more detail.
+        cache: A :class:`.TranspileCache` to look up and store the transpiled circuits in.  Circuits
+            that have previously been transpiled with the same target and options are returned
+            from the cache without running the transpiler.  Caching is skipped if ``callback`` is
+            set, or if any option cannot be fingerprinted.
 
     Returns:
         The transpiled circuit(s).
@@ -299,32 +309,50 @@ def transpile(
     coupling_map = _parse_coupling_map(coupling_map)
     _check_circuits_coupling_map(circuits, coupling_map, backend)
 
-    # Edge cases require using the old model (loose constraints) instead of building a target,
-    # but we don't populate the passmanager config with loose constraints unless it's one of
-    # the known edge cases to control the execution path.
-    pm = generate_preset_pass_manager(
-        optimization_level,
-        target=target,
-        backend=backend,
-        basis_gates=basis_gates,
-        coupling_map=coupling_map,
-        initial_layout=initial_layout,
-        layout_method=layout_method,
-        routing_method=routing_method,
-        translation_method=translation_method,
-        scheduling_method=scheduling_method,
-        approximation_degree=approximation_degree,
-        seed_transpiler=seed_transpiler,
-        unitary_synthesis_method=unitary_synthesis_method,
-        unitary_synthesis_plugin_config=unitary_synthesis_plugin_config,
-        hls_config=hls_config,
-        init_method=init_method,
-        optimization_method=optimization_method,
-        dt=dt,
-        qubits_initially_zero=qubits_initially_zero,
-    )
-
-    out_circuits = pm.run(circuits, callback=callback, num_processes=num_processes)
+    pm_options = {
+        "basis_gates": basis_gates,
+        "coupling_map": coupling_map,
+        "initial_layout": initial_layout,
+        "layout_method": layout_method,
+        "routing_method": routing_method,
+        "translation_method": translation_method,
+        "scheduling_method": scheduling_method,
+        "approximation_degree": approximation_degree,
+        "seed_transpiler": seed_transpiler,
+        "unitary_synthesis_method": unitary_synthesis_method,
+        "unitary_synthesis_plugin_config": unitary_synthesis_plugin_config,
+        "hls_config": hls_config,
+        "init_method": init_method,
+        "optimization_method": optimization_method,
+        "dt": dt,
+        "qubits_initially_zero": qubits_initially_zero,
+    }
+
+    def run(circuits):
+        # Edge cases require using the old model (loose constraints) instead of building a target,
+        # but we don't populate the passmanager config with loose constraints unless it's one of
+        # the known edge cases to control the execution path.
+        pm = generate_preset_pass_manager(
+            optimization_level, target=target, backend=backend, **pm_options
+        )
+        return pm.run(
+            circuits, callback=callback, num_processes=num_processes, parallel_mode=parallel_mode
+        )
+
+    cache_config = None
+    if cache is not None and callback is None:
+        cache_config = cache._transpile_config(
+            target if target is not None else getattr(backend, "target", None),
+            {
+                "optimization_level": optimization_level,
+                "backend": None if backend is None else backend.name,
+                **pm_options,
+            },
+        )
+    if cache_config is None:
+        out_circuits = run(circuits)
+    else:
+        out_circuits = cache._run(circuits, cache_config, run)
 
     for name, circ in zip(output_name, out_circuits):
         circ.name = name
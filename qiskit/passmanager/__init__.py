@@ -237,6 +237,7 @@ Pass managers
 
    BasePassManager
    MultiStagePassManager
+   PassManagerExecutor
 
 Flow controllers
 ----------------
@@ -249,6 +250,15 @@ Flow controllers
    ConditionalController
    DoWhileController
 
+Profiling
+---------
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   PassManagerProfiler
+   PassExecutionRecord
+
 Compilation state
 -----------------
 
@@ -267,6 +277,8 @@ Exceptions
 
 from .passmanager import BasePassManager
 from .multistage_passmanager import MultiStagePassManager
+from .executor import PassManagerExecutor
+from .profiler import PassManagerProfiler, PassExecutionRecord
 from .flow_controllers import (
     FlowControllerLinear,
     ConditionalController,
@@ -284,7 +296,10 @@ __all__ = [
     "FlowControllerLinear",
     "GenericPass",
     "MultiStagePassManager",
+    "PassExecutionRecord",
     "PassManagerError",
+    "PassManagerExecutor",
+    "PassManagerProfiler",
     "PassManagerState",
     "PropertySet",
     "Task",
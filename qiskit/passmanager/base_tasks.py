@@ -21,6 +21,7 @@ from collections.abc import Iterable, Callable, Generator
 from typing import Any, TypeVar, Generic, TypeAlias
 
 from .compilation_status import RunState, PassManagerState, PropertySet
+from .profiler import _WORKFLOW_RECORDER
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,8 @@ class GenericPass(Task[IR, IR_OUT], ABC):
         run_state = None
         ret = None
         start_time = time.time()
+        recorder = _WORKFLOW_RECORDER.get()
+        profile_token = None if recorder is None else recorder.start(passmanager_ir)
         try:
             if self not in state.workflow_status.completed_passes:
                 ret = self.run(passmanager_ir)
@@ -110,6 +113,8 @@ class GenericPass(Task[IR, IR_OUT], ABC):
             ret = passmanager_ir if ret is None else ret
             if run_state != RunState.SKIP:
                 running_time = time.time() - start_time
+                if recorder is not None:
+                    recorder.finish(profile_token, self.name(), ret)
                 logger.info("Pass: %s - %.5f (ms)", self.name(), running_time * 1000)
                 if callback is not None:
                     callback(
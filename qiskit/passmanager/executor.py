@@ -0,0 +1,400 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Long-lived worker pools for running a pass manager over many batches of programs."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextvars
+import copy
+import os
+import threading
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Generic, Literal, TYPE_CHECKING
+
+import dill
+
+from qiskit.utils.parallel import (
+    default_num_processes,
+    should_run_in_parallel,
+    _IN_PARALLEL_FORBID_PARALLELISM,
+)
+from .base_tasks import IR, Callback
+from .exceptions import PassManagerError
+from .profiler import _active_profiler, _call_with_profile
+
+if TYPE_CHECKING:
+    from .passmanager import BasePassManager
+
+
+# The pass manager owned by the current worker process.  This is set exactly once per worker by
+# `_initialize_worker`, and then reused for every program that the worker is sent.
+_WORKER_PASS_MANAGER = None
+
+
+def _initialize_worker(pass_manager_bin: bytes) -> None:
+    """Deserialize the pass manager into a freshly started worker process."""
+    global _WORKER_PASS_MANAGER  # noqa: PLW0603
+
+    # Forbid nested process-based parallelism from inside the worker.  This has to be set in the
+    # worker itself, since the pool may start its processes lazily at any later point.
+    os.environ["QISKIT_IN_PARALLEL"] = _IN_PARALLEL_FORBID_PARALLELISM
+    should_run_in_parallel.cache_clear()
+    _WORKER_PASS_MANAGER = dill.loads(pass_manager_bin)  # noqa: S301 Only used for IPC
+
+
+def _run_workflow_in_worker(
+    program: Any,
+    callback: bytes | None,
+    initial_property_set: dict[str, object] | None,
+    kwargs: dict[str, Any],
+    profile: bool,
+) -> Any:
+    """Run a single program through the pass manager owned by this worker process."""
+    # Imported here to avoid the circular import with `passmanager.py`, which imports this module.
+    from .passmanager import _run_workflow
+
+    return _call_with_profile(
+        profile,
+        _run_workflow,
+        program=program,
+        pass_manager=_WORKER_PASS_MANAGER,
+        initial_property_set=initial_property_set,
+        callback=None if callback is None else dill.loads(callback),  # noqa: S301 Only for IPC
+        **kwargs,
+    )
+
+
+class PassManagerExecutor(Generic[IR]):
+    """A reusable pool of workers that each hold a copy of a pass manager.
+
+    :meth:`.BasePassManager.run` serializes the pass manager and starts a new process pool every
+    time it is called with more than one program.  When a pass manager is used to process many
+    small batches, this fixed cost can exceed the cost of the compilation itself.  This executor
+    instead serializes the pass manager once, sends it to each worker process once when the worker
+    starts, and then only sends the input programs for each call to :meth:`run`.
+
+    Instances of this class are typically created by :meth:`.BasePassManager.executor`, and should
+    be used as a context manager so that the worker processes are shut down after use::
+
+        with pass_manager.executor(num_processes=8) as executor:
+            for batch in batches:
+                outputs = executor.run(batch)
+
+    The pass manager is captured when the executor is constructed.  Later modifications to the
+    pass manager are not seen by the workers; create a new executor to pick them up.
+
+    If :func:`.should_run_in_parallel` returns ``False`` for the requested number of processes, no
+    worker processes are started, and programs are run in serial in the calling process, exactly as
+    :meth:`.BasePassManager.run` would.
+
+    With ``mode="thread"``, the workers are instead threads within the calling process.  Input and
+    output programs are then never serialized, and large read-only objects that the pass manager
+    declares as shareable (such as the :class:`.Target` of the preset transpiler pipelines) are
+    shared between all the workers rather than duplicated.  Each thread still runs its own copy of
+    the passes, since passes hold per-run state.  This mode is only faster than running in serial
+    when the bulk of the work is done in compiled code that releases the GIL, or on a free-threaded
+    Python build, but it does not depend on the :mod:`multiprocessing` start method, and has no
+    start-up cost.  A ``callback`` used in thread mode is called concurrently from several threads.
+    """
+
+    def __init__(
+        self,
+        pass_manager: BasePassManager[IR],
+        num_processes: int | None = None,
+        *,
+        mode: Literal["process", "thread"] = "process",
+    ):
+        """
+        Args:
+            pass_manager: The pass manager to run.
+            num_processes: The maximum number of workers to use.  If ``None``, the return value of
+                :func:`.default_num_processes` is used.
+            mode: Either ``"process"`` to run the workers in separate processes, or ``"thread"`` to
+                run them in threads of the calling process.
+
+        Raises:
+            ValueError: if ``mode`` is not one of the allowed values.
+        """
+        if mode not in ("process", "thread"):
+            raise ValueError(f"unknown executor mode '{mode}'; must be 'process' or 'thread'")
+        self._pass_manager = pass_manager
+        self._num_processes = (
+            default_num_processes() if num_processes is None else max(num_processes, 1)
+        )
+        self._mode = mode
+        self._pool = None
+        self._closed = False
+        if mode == "thread":
+            if self._num_processes > 1:
+                # The threads copy from this snapshot rather than the live pass manager, both to
+                # match the semantics of the process mode and so that the copies are never taken
+                # while the pass manager is being run in the calling thread.
+                self._snapshot = copy.deepcopy(
+                    pass_manager, {id(obj): obj for obj in pass_manager._thread_shared_objects()}
+                )
+                self._thread_state = threading.local()
+                self._pool = ThreadPoolExecutor(max_workers=self._num_processes)
+        elif should_run_in_parallel(self._num_processes):
+            # Pass manager may contain callable and we need to serialize through dill rather than
+            # pickle.  The workers are started lazily by the pool, so the serialization is the only
+            # up-front cost of creating an executor.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._num_processes,
+                initializer=_initialize_worker,
+                initargs=(dill.dumps(pass_manager),),
+            )
+
+    @property
+    def pass_manager(self) -> BasePassManager[IR]:
+        """The pass manager this executor was created from."""
+        return self._pass_manager
+
+    @property
+    def num_processes(self) -> int:
+        """The maximum number of workers this executor uses."""
+        return self._num_processes
+
+    @property
+    def mode(self) -> str:
+        """Whether the workers are separate processes (``"process"``) or threads (``"thread"``)."""
+        return self._mode
+
+    @property
+    def parallel(self) -> bool:
+        """Whether this executor runs programs in parallel workers, rather than in serial."""
+        return self._pool is not None
+
+    def run(
+        self,
+        in_programs: Any | list[Any],
+        callback: Callback[IR] | None = None,
+        *,
+        property_set: dict[str, object] | None = None,
+        **kwargs,
+    ) -> Any:
+        """Run all the passes of the pass manager on the specified ``in_programs``.
+
+        This method can be called any number of times, and the worker processes will be reused
+        between calls.
+
+        Args:
+            in_programs: Input programs to transform via all the registered passes.
+                A single input object cannot be a Python builtin list object.
+                A list object is considered as multiple input objects to optimize.
+            callback: A callback function that will be called after each pass execution, with the
+                same arguments as described in :meth:`.BasePassManager.run`.  When running in
+                parallel, the callback is invoked within the workers.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline.  See :meth:`.BasePassManager.run`.
+            kwargs: Arbitrary arguments passed to the compiler frontend and backend.
+
+        Returns:
+            The transformed program(s).
+
+        Raises:
+            PassManagerError: if the executor has already been shut down.
+        """
+        if self._closed:
+            raise PassManagerError("Cannot run programs on an executor that has been shut down.")
+        if not self._pass_manager._tasks and not kwargs and callback is None:
+            return in_programs
+
+        is_list = True
+        if not isinstance(in_programs, list):
+            in_programs = [in_programs]
+            is_list = False
+
+        if self._pool is None or len(in_programs) == 1:
+            out = list(self._run_serial(in_programs, callback, property_set, kwargs))
+        else:
+            profiler = _active_profiler()
+            callback = self._prepare_callback(callback)
+            futures = [
+                self._submit(program, callback, property_set, kwargs, profiler)
+                for program in in_programs
+            ]
+            out = [self._collect(future, profiler) for future in futures]
+        if not is_list:
+            return out[0]
+        return out
+
+    def run_iter(
+        self,
+        in_programs: Iterable[Any],
+        callback: Callback[IR] | None = None,
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        property_set: dict[str, object] | None = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Lazily run all the passes of the pass manager on each of ``in_programs``.
+
+        This is a streaming form of :meth:`run`.  The input programs are consumed from the iterable
+        only as workers become free, and each output is yielded as soon as it is available, so at
+        most ``max_in_flight`` programs are held by the executor at any one time.  This lets the
+        caller start processing outputs (for example, writing them to a file) while later inputs
+        are still being compiled, without holding the entire batch in memory.
+
+        Args:
+            in_programs: Any iterable of input programs, including a generator.
+            callback: A callback function that will be called after each pass execution, with the
+                same arguments as described in :meth:`.BasePassManager.run`.
+            ordered: If ``True`` (the default), the outputs are yielded in the same order as the
+                inputs.  If ``False``, each output is yielded as soon as it is complete, in
+                arbitrary order, which may give better throughput when programs take very different
+                times to compile.
+            max_in_flight: The maximum number of programs that have been submitted to the workers
+                but whose outputs have not yet been yielded.  Defaults to twice the number of
+                worker processes.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline.  See :meth:`.BasePassManager.run`.
+            kwargs: Arbitrary arguments passed to the compiler frontend and backend.
+
+        Yields:
+            The transformed programs.
+
+        Raises:
+            PassManagerError: if the executor has already been shut down.
+        """
+        if self._closed:
+            raise PassManagerError("Cannot run programs on an executor that has been shut down.")
+        if not self._pass_manager._tasks and not kwargs and callback is None:
+            yield from in_programs
+            return
+        if self._pool is None:
+            yield from self._run_serial(in_programs, callback, property_set, kwargs)
+            return
+
+        max_in_flight = 2 * self._num_processes if max_in_flight is None else max(max_in_flight, 1)
+        profiler = _active_profiler()
+        callback = self._prepare_callback(callback)
+        programs = iter(in_programs)
+        pending = collections.deque() if ordered else set()
+        add_pending = pending.append if ordered else pending.add
+
+        def submit_next():
+            try:
+                program = next(programs)
+            except StopIteration:
+                return False
+            add_pending(self._submit(program, callback, property_set, kwargs, profiler))
+            return True
+
+        for _ in range(max_in_flight):
+            if not submit_next():
+                break
+        try:
+            if ordered:
+                while pending:
+                    out = self._collect(pending.popleft(), profiler)
+                    # Refill the queue before handing control back to the caller, so the workers
+                    # stay busy while the caller handles the output.
+                    submit_next()
+                    yield out
+            else:
+                while pending:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    pending.difference_update(done)
+                    for _ in done:
+                        submit_next()
+                    for future in done:
+                        yield self._collect(future, profiler)
+        finally:
+            # If the caller stops consuming early (or a program failed), don't leave queued work
+            # running in the pool.
+            for future in pending:
+                future.cancel()
+
+    def _prepare_callback(self, callback):
+        if callback is None or self._mode == "thread":
+            return callback
+        # The callback may be a closure, so needs `dill` rather than `pickle`.
+        return dill.dumps(callback)
+
+    def _submit(self, program, callback, property_set, kwargs, profiler):
+        if self._mode == "thread":
+            # Run in a copy of the submitting context, so an active profiler is seen by the thread.
+            return self._pool.submit(
+                contextvars.copy_context().run,
+                self._run_workflow_in_thread,
+                program,
+                callback,
+                property_set,
+                kwargs,
+            )
+        return self._pool.submit(
+            _run_workflow_in_worker, program, callback, property_set, kwargs, profiler is not None
+        )
+
+    def _collect(self, future, profiler):
+        out = future.result()
+        if profiler is None or self._mode == "thread":
+            return out
+        # Worker processes send back their profile records along with the output.
+        out, records = out
+        profiler._extend(records)
+        return out
+
+    def _run_workflow_in_thread(self, program, callback, property_set, kwargs):
+        # Local import to avoid the cycle with `passmanager.py`.
+        from .passmanager import _run_workflow
+
+        if (pass_manager := getattr(self._thread_state, "pass_manager", None)) is None:
+            memo = {id(obj): obj for obj in self._snapshot._thread_shared_objects()}
+            pass_manager = self._thread_state.pass_manager = copy.deepcopy(self._snapshot, memo)
+        return _run_workflow(
+            program=program,
+            pass_manager=pass_manager,
+            callback=callback,
+            initial_property_set=property_set,
+            **kwargs,
+        )
+
+    def _run_serial(self, in_programs, callback, property_set, kwargs):
+        # Local import to avoid the cycle with `passmanager.py`.
+        from .passmanager import _run_workflow
+
+        for program in in_programs:
+            yield _run_workflow(
+                program=program,
+                pass_manager=self._pass_manager,
+                callback=callback,
+                initial_property_set=property_set,
+                **kwargs,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the workers of this executor.
+
+        After this is called, :meth:`run` can no longer be used.  It is safe to call this method
+        more than once.
+
+        Args:
+            wait: Whether to block until all the workers have exited.
+        """
+        self._closed = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
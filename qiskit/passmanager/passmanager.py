@@ -16,15 +16,17 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from itertools import chain
-from typing import Any, Generic
+from typing import Any, Generic, Literal
 
 import dill
 
 from qiskit.utils.parallel import parallel_map, should_run_in_parallel
 from .base_tasks import Task, IR, Callback
 from .exceptions import PassManagerError
+from .executor import PassManagerExecutor
+from .profiler import _WORKFLOW_RECORDER, _WorkflowRecorder, _active_profiler, _call_with_profile
 from .flow_controllers import FlowControllerLinear
 from .compilation_status import PropertySet, WorkflowStatus, PassManagerState
 
@@ -177,6 +179,7 @@ class BasePassManager(Generic[IR], ABC):
         num_processes: int | None = None,
         *,
         property_set: dict[str, object] | None = None,
+        parallel_mode: Literal["process", "thread"] = "process",
         **kwargs,
     ) -> Any:
         """Run all the passes on the specified ``in_programs``.
@@ -219,19 +222,39 @@ class BasePassManager(Generic[IR], ABC):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            parallel_mode: How to run multiple programs in parallel.  The default ``"process"``
+                uses separate processes, subject to :func:`.should_run_in_parallel`.  ``"thread"``
+                uses up to ``num_processes`` threads in this process, sharing read-only data between
+                them rather than serializing it; see :class:`.PassManagerExecutor` for details.
             kwargs: Arbitrary arguments passed to the compiler frontend and backend.
 
         Returns:
             The transformed program(s).
+
+        Raises:
+            ValueError: if ``parallel_mode`` is not one of the allowed values.
         """
         if not self._tasks and not kwargs and callback is None:
             return in_programs
 
+        if parallel_mode not in ("process", "thread"):
+            raise ValueError(
+                f"unknown parallel mode '{parallel_mode}'; must be 'process' or 'thread'"
+            )
+
         is_list = True
         if not isinstance(in_programs, list):
             in_programs = [in_programs]
             is_list = False
 
+        if parallel_mode == "thread" and len(in_programs) > 1:
+            # Use the base executor, since subclasses' executors may re-process ``callback`` and
+            # the ``kwargs``, which the subclass ``run`` has already done.
+            with PassManagerExecutor(self, num_processes, mode="thread") as executor:
+                return executor.run(
+                    in_programs, callback=callback, property_set=property_set, **kwargs
+                )
+
         # If we're not going to run in parallel, we want to avoid spending time `dill` serializing
         # ourselves, since that can be quite expensive.
         if len(in_programs) == 1 or not should_run_in_parallel(num_processes):
@@ -253,16 +276,131 @@ class BasePassManager(Generic[IR], ABC):
         # See https://github.com/Qiskit/qiskit-terra/pull/3290
         # Note that serialized object is deserialized as a different object.
         # Thus, we can reuse the same manager without state collision, without building it per thread.
-        return parallel_map(
+        profiler = _active_profiler()
+        out = parallel_map(
             _run_workflow_in_new_process,
             values=in_programs,
             task_kwargs={
                 "pass_manager_bin": dill.dumps(self),
                 "callback": dill.dumps(callback),
                 "initial_property_set": property_set,
+                "profile": profiler is not None,
             },
             num_processes=num_processes,
         )
+        if profiler is None:
+            return out
+        # Gather up the records made in the worker processes.
+        programs = []
+        for program, records in out:
+            programs.append(program)
+            profiler._extend(records)
+        return programs
+
+    def run_iter(
+        self,
+        in_programs: Iterable[Any],
+        callback: Callback[IR] | None = None,
+        num_processes: int | None = None,
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        property_set: dict[str, object] | None = None,
+        parallel_mode: Literal["process", "thread"] = "process",
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Lazily run all the passes on each of the programs in ``in_programs``.
+
+        This is a streaming form of :meth:`run`.  Instead of taking a list and returning a list once
+        every program is complete, this takes any iterable (such as a generator) and returns an
+        iterator that yields each output program as soon as it is ready.  Inputs are only consumed
+        from ``in_programs`` as worker processes become free, so only a bounded number of programs
+        are in memory at once, and downstream processing can start before the whole batch is done.
+        For example::
+
+            for out_program in pass_manager.run_iter(program_generator):
+                handle(out_program)
+
+        The worker processes are shut down when the returned iterator is exhausted or closed.  To
+        share workers between several calls, use :meth:`.PassManagerExecutor.run_iter` on an
+        executor returned by :meth:`executor`.
+
+        Args:
+            in_programs: Any iterable of input programs.
+            callback: A callback function that will be called after each pass execution.  See
+                :meth:`run` for the arguments it is called with.
+            num_processes: The maximum number of parallel processes to launch if parallel
+                execution is enabled.  See :meth:`run`.
+            ordered: If ``True`` (the default), the outputs are yielded in the same order as the
+                inputs.  If ``False``, outputs are yielded in the order they complete.
+            max_in_flight: The maximum number of programs being worked on that have not yet been
+                yielded.  Defaults to twice the number of worker processes.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline.  See :meth:`run`.
+            parallel_mode: Whether to use worker processes or threads.  See :meth:`run`.
+            kwargs: Arbitrary arguments passed to the compiler frontend and backend.
+
+        Yields:
+            The transformed programs.
+        """
+        with self.executor(num_processes=num_processes, mode=parallel_mode) as executor:
+            yield from executor.run_iter(
+                in_programs,
+                callback,
+                ordered=ordered,
+                max_in_flight=max_in_flight,
+                property_set=property_set,
+                **kwargs,
+            )
+
+    def executor(
+        self,
+        num_processes: int | None = None,
+        *,
+        mode: Literal["process", "thread"] = "process",
+    ) -> PassManagerExecutor[IR]:
+        """Create a reusable pool of worker processes to run this pass manager.
+
+        Each call to :meth:`run` with more than one program serializes this pass manager and starts
+        a new pool of processes.  The returned :class:`.PassManagerExecutor` instead ships the pass
+        manager to its workers only once, and then reuses them for every call to
+        :meth:`.PassManagerExecutor.run`.  This is worthwhile when running many small batches of
+        programs through the same pass manager::
+
+            with pass_manager.executor(num_processes=8) as executor:
+                for batch in batches:
+                    outputs = executor.run(batch)
+
+        The executor captures the pass manager as it is at the time of this call.
+
+        Args:
+            num_processes: The maximum number of workers to use.  This has the same meaning as the
+                same argument to :meth:`run`.
+            mode: Whether the workers are processes (``"process"``) or threads (``"thread"``).  See
+                :class:`.PassManagerExecutor` for the differences.
+
+        Returns:
+            An executor, which should be shut down after use, for example by using it as a context
+            manager.
+        """
+        return PassManagerExecutor(self, num_processes=num_processes, mode=mode)
+
+    def _passmanager_ir_size(self, passmanager_ir: IR) -> int | None:
+        """A measure of the size of the pass manager IR, used by :class:`.PassManagerProfiler`.
+
+        Subclasses can override this to make the sizes available in profiles.  The default
+        implementation returns ``None``, meaning the size is not measured.
+        """
+        return None
+
+    def _thread_shared_objects(self) -> Iterable[Any]:
+        """Objects held by the tasks of this pass manager that are never mutated while running.
+
+        When the pass manager is copied for each worker thread of a thread-based
+        :class:`.PassManagerExecutor`, these objects are shared between the copies rather than being
+        duplicated.  Subclasses can override this to declare their large read-only data.
+        """
+        return ()
 
     def to_flow_controller(self) -> FlowControllerLinear[IR, IR]:
         """Linearize this manager into a single :class:`.FlowControllerLinear`,
@@ -300,6 +438,28 @@ def _run_workflow(
     Returns:
         Optimized program.
     """
+    if (profiler := _active_profiler()) is None:
+        return _run_workflow_unprofiled(
+            program, pass_manager, initial_property_set=initial_property_set, **kwargs
+        )
+    recorder_token = _WORKFLOW_RECORDER.set(
+        _WorkflowRecorder(profiler, pass_manager._passmanager_ir_size)
+    )
+    try:
+        return _run_workflow_unprofiled(
+            program, pass_manager, initial_property_set=initial_property_set, **kwargs
+        )
+    finally:
+        _WORKFLOW_RECORDER.reset(recorder_token)
+
+
+def _run_workflow_unprofiled(
+    program: Any,
+    pass_manager: BasePassManager,
+    *,
+    initial_property_set: dict[str, object] | None = None,
+    **kwargs,
+) -> Any:
     flow_controller = pass_manager.to_flow_controller()
     initial_status = WorkflowStatus()
 
@@ -341,6 +501,7 @@ def _run_workflow_in_new_process(
     *,
     initial_property_set: dict[str, object] | None,
     callback: bytes,
+    profile: bool = False,
 ) -> Any:
     """Run single program optimization in new process.
 
@@ -351,11 +512,16 @@ def _run_workflow_in_new_process(
             property set in the pass manager with.
         callback: An optional callable that will be called after each pass
             executes.
+        profile: Whether to profile the passes.  If so, the profile records are returned alongside
+            the optimized program.
 
     Returns:
-          Optimized program.
+          Optimized program, or a 2-tuple of the optimized program and the profile records if
+          ``profile`` is set.
     """
-    return _run_workflow(
+    return _call_with_profile(
+        profile,
+        _run_workflow,
         program=program,
         pass_manager=dill.loads(pass_manager_bin),  # noqa: S301 Only used for IPC
         initial_property_set=initial_property_set,
@@ -0,0 +1,304 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Opt-in instrumentation of the passes run by pass managers."""
+
+from __future__ import annotations
+
+import contextvars
+import dataclasses
+import json
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # Not available on Windows.
+    resource = None
+
+
+# The profiler that is currently collecting records, as set up by `PassManagerProfiler.__enter__`.
+_ACTIVE_PROFILER: contextvars.ContextVar[PassManagerProfiler | None] = contextvars.ContextVar(
+    "qiskit_passmanager_profiler", default=None
+)
+# The recorder of the pass-manager workflow currently running in this context.  This is only set
+# while a profiler is active, so un-profiled runs pay just the cost of one context-variable lookup
+# per pass.
+_WORKFLOW_RECORDER: contextvars.ContextVar[_WorkflowRecorder | None] = contextvars.ContextVar(
+    "qiskit_passmanager_workflow_recorder", default=None
+)
+
+# `ru_maxrss` is in kibibytes on Linux and the BSDs, but in bytes on macOS.
+_MAXRSS_SCALE = 1 if sys.platform == "darwin" else 1024
+
+
+def _peak_rss() -> int | None:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * _MAXRSS_SCALE
+
+
+@dataclasses.dataclass(frozen=True)
+class PassExecutionRecord:
+    """Measurements of a single execution of a pass, recorded by a :class:`.PassManagerProfiler`."""
+
+    name: str
+    """The name of the pass, as returned by :meth:`.GenericPass.name`."""
+
+    start: float
+    """The wall-clock time the pass started at, in seconds since the epoch."""
+
+    duration: float
+    """The wall-clock time taken by the pass, in seconds."""
+
+    size_before: int | None
+    """The size of the pass manager IR before the pass, if the pass manager can measure it.  For
+    :class:`.PassManager`, this is the number of operations in the :class:`.DAGCircuit`."""
+
+    size_after: int | None
+    """The size of the pass manager IR after the pass."""
+
+    peak_rss_delta: int | None
+    """How much the peak resident-set size of the process grew during the pass, in bytes, or
+    ``None`` if this cannot be measured on this platform.  The peak only ever increases, so this is
+    zero for passes whose memory use stayed below the previous peak."""
+
+    process: int
+    """The identifier of the process that ran the pass."""
+
+    thread: int
+    """The identifier of the thread that ran the pass."""
+
+
+class _WorkflowRecorder:
+    """Per-workflow state of a profiler, used by :meth:`.GenericPass.execute`."""
+
+    __slots__ = ("ir_size", "profiler")
+
+    def __init__(self, profiler: PassManagerProfiler, ir_size: Callable[[Any], int | None]):
+        self.profiler = profiler
+        self.ir_size = ir_size
+
+    def start(self, passmanager_ir: Any) -> tuple:
+        """Mark the start of a pass, returning a token to pass to :meth:`finish`."""
+        return (
+            time.time(),
+            time.perf_counter(),
+            self.ir_size(passmanager_ir),
+            _peak_rss(),
+        )
+
+    def finish(self, token: tuple, name: str, passmanager_ir: Any) -> None:
+        """Record the completion of the pass started by the call to :meth:`start` that returned
+        ``token``."""
+        end = time.perf_counter()
+        start, perf_start, size_before, rss_before = token
+        rss_after = _peak_rss()
+        self.profiler._add(
+            PassExecutionRecord(
+                name=name,
+                start=start,
+                duration=end - perf_start,
+                size_before=size_before,
+                size_after=self.ir_size(passmanager_ir),
+                peak_rss_delta=(
+                    None if rss_before is None or rss_after is None else rss_after - rss_before
+                ),
+                process=os.getpid(),
+                thread=threading.get_ident(),
+            )
+        )
+
+
+class PassManagerProfiler:
+    """Collect timing and memory measurements for every pass run by pass managers.
+
+    Profiling is enabled by using an instance of this class as a context manager.  Every pass
+    executed by any pass manager within the context is then recorded, including passes run as
+    requirements of other passes, and once for each iteration of a :class:`.DoWhileController`.
+    This also covers calls to :func:`.transpile`, and parallel execution in both worker processes
+    and threads; records from worker processes are sent back to the calling process along with the
+    output programs.
+
+    .. code-block:: python
+
+        from qiskit.passmanager import PassManagerProfiler
+
+        profiler = PassManagerProfiler()
+        with profiler:
+            pass_manager.run(circuits)
+
+        for name, stats in profiler.summary().items():
+            print(name, stats["count"], stats["total_time"])
+        with open("trace.json", "w") as fd:
+            json.dump(profiler.to_chrome_trace(), fd)
+
+    The records can be exported either as aggregated statistics with :meth:`summary`, as plain
+    data with :meth:`to_dict` (suitable for :func:`json.dump`), or in the Trace Event format used by
+    the Chrome and Perfetto trace viewers with :meth:`to_chrome_trace`.
+
+    A profiler can be entered any number of times, and accumulates records across all of them.
+    """
+
+    def __init__(self):
+        self._records: list[PassExecutionRecord] = []
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    @property
+    def records(self) -> list[PassExecutionRecord]:
+        """All the pass executions recorded so far, in the order they were received."""
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """Discard all the records collected so far."""
+        with self._lock:
+            self._records.clear()
+
+    def _add(self, record: PassExecutionRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def _extend(self, records: Iterable[PassExecutionRecord]) -> None:
+        with self._lock:
+            self._records.extend(records)
+
+    def __enter__(self):
+        self._tokens.append(_ACTIVE_PROFILER.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _ACTIVE_PROFILER.reset(self._tokens.pop())
+
+    def summary(self) -> dict[str, dict[str, float | int | None]]:
+        """Aggregate the records by pass name.
+
+        Returns:
+            A dictionary mapping each pass name to a dictionary of statistics, with the keys:
+
+            * ``count``: the number of times the pass was executed.
+            * ``total_time``: the total wall-clock time spent in the pass, in seconds.
+            * ``mean_time``: the mean wall-clock time per execution, in seconds.
+            * ``max_time``: the longest single execution, in seconds.
+            * ``size_change``: the total change in IR size caused by the pass, or ``None`` if the
+              size could not be measured.
+            * ``max_peak_rss_delta``: the largest growth in peak resident-set size during a single
+              execution, in bytes, or ``None`` if this could not be measured.
+
+            The pass names are in order of their first execution.
+        """
+        out = {}
+        for record in self.records:
+            if (stats := out.get(record.name)) is None:
+                stats = out[record.name] = {
+                    "count": 0,
+                    "total_time": 0.0,
+                    "mean_time": 0.0,
+                    "max_time": 0.0,
+                    "size_change": 0,
+                    "max_peak_rss_delta": 0,
+                }
+            stats["count"] += 1
+            stats["total_time"] += record.duration
+            stats["max_time"] = max(stats["max_time"], record.duration)
+            if record.size_before is None or record.size_after is None:
+                stats["size_change"] = None
+            elif stats["size_change"] is not None:
+                stats["size_change"] += record.size_after - record.size_before
+            if record.peak_rss_delta is None:
+                stats["max_peak_rss_delta"] = None
+            elif stats["max_peak_rss_delta"] is not None:
+                stats["max_peak_rss_delta"] = max(
+                    stats["max_peak_rss_delta"], record.peak_rss_delta
+                )
+        for stats in out.values():
+            stats["mean_time"] = stats["total_time"] / stats["count"]
+        return out
+
+    def to_dict(self) -> dict[str, Any]:
+        """Export the records and their summary as plain Python data.
+
+        The output contains only built-in types, so can be written out directly with
+        :func:`json.dump`.
+
+        Returns:
+            A dictionary with the key ``"records"``, containing a list of dictionaries with the
+            fields of :class:`.PassExecutionRecord`, and the key ``"summary"`` containing the
+            output of :meth:`summary`.
+        """
+        return {
+            "records": [dataclasses.asdict(record) for record in self.records],
+            "summary": self.summary(),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """Export the output of :meth:`to_dict` as a JSON string.
+
+        Args:
+            kwargs: Keyword arguments passed on to :func:`json.dumps`.
+
+        Returns:
+            The JSON document.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export the records in the Trace Event format.
+
+        The output can be written to a file with :func:`json.dump`, and then loaded into the trace
+        viewers of Chrome (``chrome://tracing``) or `Perfetto <https://ui.perfetto.dev>`__.  Each
+        pass execution is a complete ("X") event on the track of the process and thread that ran
+        it.
+
+        Returns:
+            The trace, as a dictionary with a ``"traceEvents"`` key.
+        """
+        events = []
+        for record in self.records:
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": "pass",
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": record.duration * 1e6,
+                    "pid": record.process,
+                    "tid": record.thread,
+                    "args": {
+                        "size_before": record.size_before,
+                        "size_after": record.size_after,
+                        "peak_rss_delta": record.peak_rss_delta,
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _active_profiler() -> PassManagerProfiler | None:
+    """Get the :class:`.PassManagerProfiler` that is active in the current context, if any."""
+    return _ACTIVE_PROFILER.get()
+
+
+def _call_with_profile(profile: bool, function: Callable, /, **kwargs) -> Any:
+    """Call ``function``, and if ``profile`` is set, profile it with a new profiler and return the
+    records alongside the output.  This is used to collect profiles within worker processes."""
+    if not profile:
+        return function(**kwargs)
+    with PassManagerProfiler() as profiler:
+        out = function(**kwargs)
+    return out, profiler.records
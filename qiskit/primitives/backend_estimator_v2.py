@@ -22,6 +22,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from qiskit.circuit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit.quantumcircuitdata import CircuitInstruction
 from qiskit.exceptions import QiskitError
 from qiskit.providers import BackendV2
 from qiskit.quantum_info import Pauli, PauliList
@@ -167,6 +168,71 @@ class _PreprocessedData:
     """The pub's observable array broadcast to the shape of the pub."""
 
 
+@dataclass
+class _MeasurementGroup:
+    """Internal data structure for a set of Pauli terms that are measured by the same circuit."""
+
+    orig_paulis: PauliList
+    """The Pauli terms measured by the circuit."""
+
+    meas_paulis: PauliList
+    """The Pauli terms restricted to the measured qubits, in the order of the clbits."""
+
+    circuit: QuantumCircuit
+    """The transpiled basis change and measurements, to be appended to a bound circuit."""
+
+
+class _MeasurementCache:
+    """The measurement circuits needed by the pubs of a single call to
+    :meth:`.BackendEstimatorV2.run`.
+
+    The grouping of each distinct set of Pauli terms into measurement bases is only done once,
+    and the measurement circuit of each distinct basis is only transpiled once, however many
+    parameter sets and pubs need it.
+    """
+
+    def __init__(self, passmanager: PassManager, abelian_grouping: bool):
+        self._passmanager = passmanager
+        self._abelian_grouping = abelian_grouping
+        self._groups: dict[tuple[int, tuple[str, ...]], list[_MeasurementGroup]] = {}
+        self._circuits: dict[tuple[int, str], tuple[QuantumCircuit, np.ndarray]] = {}
+
+    def groups(self, num_qubits: int, pauli_strings: tuple[str, ...]) -> list[_MeasurementGroup]:
+        """Get the measurement groups for a sorted tuple of Pauli terms."""
+        key = (num_qubits, pauli_strings)
+        if (groups := self._groups.get(key)) is not None:
+            return groups
+
+        observable = PauliList(pauli_strings)
+        if self._abelian_grouping:
+            bases = []
+            group_paulis = observable.group_commuting(qubit_wise=True)
+            for obs in group_paulis:
+                bases.append(Pauli((np.logical_or.reduce(obs.z), np.logical_or.reduce(obs.x))))
+        else:
+            bases = list(observable)
+            group_paulis = [PauliList(basis) for basis in bases]
+
+        labels = [basis.to_label() for basis in bases]
+        new = {}
+        for basis, label in zip(bases, labels):
+            if (num_qubits, label) not in self._circuits and label not in new:
+                new[label] = _measurement_circuit(num_qubits, basis)
+        if new:
+            # unroll basis gates
+            circuits = self._passmanager.run([circuit for circuit, _ in new.values()])
+            for (label, (_, indices)), circuit in zip(new.items(), circuits):
+                self._circuits[num_qubits, label] = (circuit, indices)
+
+        groups = []
+        for label, obs in zip(labels, group_paulis):
+            circuit, indices = self._circuits[num_qubits, label]
+            paulis = PauliList.from_symplectic(obs.z[:, indices], obs.x[:, indices], obs.phase)
+            groups.append(_MeasurementGroup(obs, paulis, circuit))
+        self._groups[key] = groups
+        return groups
+
+
 class BackendEstimatorV2(BaseEstimatorV2):
     r"""Evaluates expectation values for provided quantum circuit and observable combinations.
 
@@ -279,21 +345,27 @@ class BackendEstimatorV2(BaseEstimatorV2):
             shots = math.ceil(1.0 / pub.precision**2)
             pub_dict[shots].append(i)
 
+        # share measurement circuits between all the pubs
+        cache = _MeasurementCache(self._passmanager, self._options.abelian_grouping)
         results = [None] * len(pubs)
         for shots, lst in pub_dict.items():
             # run pubs with the same number of shots at once
-            pub_results = self._run_pubs([pubs[i] for i in lst], shots)
+            pub_results = self._run_pubs([pubs[i] for i in lst], shots, cache)
             # reconstruct the result of pubs
             for i, pub_result in zip(lst, pub_results):
                 results[i] = pub_result
         return PrimitiveResult(results, metadata={"version": 2})
 
-    def _run_pubs(self, pubs: list[EstimatorPub], shots: int) -> list[PubResult]:
+    def _run_pubs(
+        self, pubs: list[EstimatorPub], shots: int, cache: _MeasurementCache | None = None
+    ) -> list[PubResult]:
         """Compute results for pubs that all require the same value of ``shots``."""
+        if cache is None:
+            cache = _MeasurementCache(self._passmanager, self._options.abelian_grouping)
         preprocessed_data = []
         flat_circuits = []
         for pub in pubs:
-            data = self._preprocess_pub(pub)
+            data = self._preprocess_pub(pub, cache)
             preprocessed_data.append(data)
             flat_circuits.extend(data.circuits)
 
@@ -311,7 +383,9 @@ class BackendEstimatorV2(BaseEstimatorV2):
             results.append(self._postprocess_pub(pub, expval_map, data, shots))
         return results
 
-    def _preprocess_pub(self, pub: EstimatorPub) -> _PreprocessedData:
+    def _preprocess_pub(
+        self, pub: EstimatorPub, cache: _MeasurementCache | None = None
+    ) -> _PreprocessedData:
         """Converts a pub into a list of bound circuits necessary to estimate all its observables.
 
         The circuits contain metadata explaining which bindings array index they are with respect to,
@@ -319,6 +393,7 @@ class BackendEstimatorV2(BaseEstimatorV2):
 
         Args:
             pub: The pub to preprocess.
+            cache: The measurement circuits shared with the other pubs of the same run.
 
         Returns:
             The values ``(circuits, bc_param_ind, bc_obs)`` where ``circuits`` are the circuits to
@@ -339,7 +414,11 @@ class BackendEstimatorV2(BaseEstimatorV2):
             param_index = bc_param_ind[index]
             param_obs_map[param_index].update(bc_obs[index])
 
-        bound_circuits = self._bind_and_add_measurements(circuit, parameter_values, param_obs_map)
+        if cache is None:
+            cache = _MeasurementCache(self._passmanager, self._options.abelian_grouping)
+        bound_circuits = self._bind_and_add_measurements(
+            circuit, parameter_values, param_obs_map, cache
+        )
         return _PreprocessedData(bound_circuits, bc_param_ind, bc_obs)
 
     def _postprocess_pub(
@@ -384,6 +463,7 @@ class BackendEstimatorV2(BaseEstimatorV2):
         circuit: QuantumCircuit,
         parameter_values: BindingsArray,
         param_obs_map: dict[tuple[int, ...], set[str]],
+        cache: _MeasurementCache,
     ) -> list[QuantumCircuit]:
         """Bind the given circuit against each parameter value set, and add necessary measurements
         to each.
@@ -393,21 +473,56 @@ class BackendEstimatorV2(BaseEstimatorV2):
             parameter_values: An array of parameter value sets that can be applied to the circuit.
             param_obs_map: A mapping from locations in ``parameter_values`` to a sets of
                 Pauli terms whose expectation values are required in those locations.
+            cache: The cache of measurement circuits to use.
 
         Returns:
             A flat list of circuits sufficient to measure all Pauli terms in the ``param_obs_map``
             values at the corresponding ``parameter_values`` location, where requisite
             book-keeping is stored as circuit metadata.
         """
+        creg_names = {creg.name for creg in circuit.cregs}
+        # the measurement instructions of each group, on the qubits of `circuit`
+        suffixes: dict[int, tuple[list[CircuitInstruction], float]] = {}
         circuits = []
         for param_index, pauli_strings in param_obs_map.items():
-            bound_circuit = parameter_values.bind(circuit, param_index)
             # sort pauli_strings so that the order is deterministic
-            meas_paulis = PauliList(sorted(pauli_strings))
-            new_circuits = self._create_measurement_circuits(
-                bound_circuit, meas_paulis, param_index
-            )
-            circuits.extend(new_circuits)
+            groups = cache.groups(circuit.num_qubits, tuple(sorted(pauli_strings)))
+            bound_circuit = parameter_values.bind(circuit, param_index)
+            for i, group in enumerate(groups):
+                meas_circuit = group.circuit
+                # meas_circuit is supposed to have a classical register whose name is different
+                # from those of the transpiled_circuit
+                clbits = meas_circuit.cregs[0]
+                if clbits.name in creg_names:
+                    raise QiskitError(
+                        "Classical register for measurements conflict with those of the input "
+                        f"circuit: {clbits}. "
+                        "Recommended to avoid register names starting with '__'."
+                    )
+                if (suffix := suffixes.get(id(meas_circuit))) is None:
+                    qubit_map = dict(zip(meas_circuit.qubits, circuit.qubits))
+                    suffix = suffixes[id(meas_circuit)] = (
+                        [
+                            instruction.replace(
+                                qubits=tuple(qubit_map[q] for q in instruction.qubits)
+                            )
+                            for instruction in meas_circuit.data
+                        ],
+                        meas_circuit.global_phase,
+                    )
+                # the last group can take the bound circuit itself rather than a copy
+                new_circuit = bound_circuit if i == len(groups) - 1 else bound_circuit.copy()
+                new_circuit.add_register(clbits)
+                instructions, global_phase = suffix
+                for instruction in instructions:
+                    new_circuit._append(instruction)
+                new_circuit.global_phase += global_phase
+                new_circuit.metadata = {
+                    "orig_paulis": group.orig_paulis,
+                    "meas_paulis": group.meas_paulis,
+                    "param_index": param_index,
+                }
+                circuits.append(new_circuit)
         return circuits
 
     def _calc_expval_map(
@@ -437,78 +552,6 @@ class BackendEstimatorV2(BaseEstimatorV2):
                 expval_map[param_index, pauli.to_label()] = (expval, variance)
         return expval_map
 
-    def _create_measurement_circuits(
-        self, circuit: QuantumCircuit, observable: PauliList, param_index: tuple[int, ...]
-    ) -> list[QuantumCircuit]:
-        """Generate a list of circuits sufficient to estimate each of the given Paulis.
-
-        Paulis are divided into qubitwise-commuting subsets to reduce the total circuit count.
-        Metadata is attached to circuits in order to remember what each one measures, and
-        where it belongs in the output.
-
-        Args:
-            circuit: The circuit of interest.
-            observable: Which Pauli terms we would like to observe.
-            param_index: Where to put the data we estimate (only passed to metadata).
-
-        Returns:
-            A list of circuits sufficient to estimate each of the given Paulis.
-        """
-        meas_circuits: list[QuantumCircuit] = []
-        if self._options.abelian_grouping:
-            for obs in observable.group_commuting(qubit_wise=True):
-                basis = Pauli((np.logical_or.reduce(obs.z), np.logical_or.reduce(obs.x)))
-                meas_circuit, indices = _measurement_circuit(circuit.num_qubits, basis)
-                paulis = PauliList.from_symplectic(
-                    obs.z[:, indices],
-                    obs.x[:, indices],
-                    obs.phase,
-                )
-                meas_circuit.metadata = {
-                    "orig_paulis": obs,
-                    "meas_paulis": paulis,
-                    "param_index": param_index,
-                }
-                meas_circuits.append(meas_circuit)
-        else:
-            for basis in observable:
-                meas_circuit, indices = _measurement_circuit(circuit.num_qubits, basis)
-                obs = PauliList(basis)
-                paulis = PauliList.from_symplectic(
-                    obs.z[:, indices],
-                    obs.x[:, indices],
-                    obs.phase,
-                )
-                meas_circuit.metadata = {
-                    "orig_paulis": obs,
-                    "meas_paulis": paulis,
-                    "param_index": param_index,
-                }
-                meas_circuits.append(meas_circuit)
-
-        # unroll basis gates
-        meas_circuits = self._passmanager.run(meas_circuits)
-
-        # combine measurement circuits
-        preprocessed_circuits = []
-        for meas_circuit in meas_circuits:
-            circuit_copy = circuit.copy()
-            # meas_circuit is supposed to have a classical register whose name is different from
-            # those of the transpiled_circuit
-            clbits = meas_circuit.cregs[0]
-            for creg in circuit_copy.cregs:
-                if clbits.name == creg.name:
-                    raise QiskitError(
-                        "Classical register for measurements conflict with those of the input "
-                        f"circuit: {clbits}. "
-                        "Recommended to avoid register names starting with '__'."
-                    )
-            circuit_copy.add_register(clbits)
-            circuit_copy.compose(meas_circuit, clbits=clbits, inplace=True)
-            circuit_copy.metadata = meas_circuit.metadata
-            preprocessed_circuits.append(circuit_copy)
-        return preprocessed_circuits
-
 
 def _measurement_circuit(num_qubits: int, pauli: Pauli):
     # Note: if pauli is I for all qubits, this function generates a circuit to measure only
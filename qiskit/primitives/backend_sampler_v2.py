@@ -69,9 +69,11 @@ class _MeasureInfo:
     start: int
 
 
-ResultMemory = list[str] | list[list[float]] | list[list[list[float]]]
+ResultMemory = list[str] | NDArray[np.uint8] | list[list[float]] | list[list[list[float]]]
 """Type alias for possible level 2 and level 1 result memory formats. For level
-2, the format is a list of bit strings. For level 1, format can be either a
+2, the format is a list of hexadecimal strings, or an array of unsigned 8-bit integers of
+shape ``(shots, bytes)`` holding the big-endian packed bytes of each shot (with clbit 0 as the
+least significant bit of the last byte). For level 1, format can be either a
 list of I/Q pairs (list with two floats) for each memory slot if using
 ``meas_return=avg`` or a list of lists of I/Q pairs if using
 ``meas_return=single`` with the outer list indexing shot number and the inner
@@ -241,19 +243,12 @@ class BackendSamplerV2(BaseSamplerV2):
         complex numpy array.
         """
         if meas_level == 2 or meas_level is None:
-            arrays = {
-                item.creg_name: np.zeros(shape + (shots, item.num_bytes), dtype=np.uint8)
-                for item in meas_info
-            }
-            memory_array = _memory_array(result_memory, max_num_bytes)
-
-            for samples, index in zip(memory_array, np.ndindex(*shape)):
-                for item in meas_info:
-                    ary = _samples_to_packed_array(samples, item.num_bits, item.start)
-                    arrays[item.creg_name][index] = ary
-
+            memory_array = _memory_array(result_memory, shots, max_num_bytes)
+            memory_array = memory_array.reshape(shape + memory_array.shape[1:])
             meas = {
-                item.creg_name: BitArray(arrays[item.creg_name], item.num_bits)
+                item.creg_name: BitArray(
+                    _register_bytes(memory_array, item.start, item.num_bits), item.num_bits
+                )
                 for item in meas_info
             }
         elif meas_level == 1:
@@ -305,36 +300,88 @@ def _prepare_memory(results: list[Result]) -> list[ResultMemory]:
     return lst
 
 
-def _memory_array(results: list[list[str]], num_bytes: int) -> NDArray[np.uint8]:
-    """Converts the memory data into an array in an unpacked way."""
-    lst = []
-    for memory in results:
-        if num_bytes > 0:
-            data = b"".join(int(i, 16).to_bytes(num_bytes, "big") for i in memory)
-            data = np.frombuffer(data, dtype=np.uint8).reshape(-1, num_bytes)
+def _memory_array(results: list[ResultMemory], num_shots: int, num_bytes: int) -> NDArray[np.uint8]:
+    """Converts the memory data of each circuit into packed bytes.
+
+    Args:
+        results: The memory of each circuit, either as a list of hexadecimal strings, one per shot,
+            or as an array of unsigned 8-bit integers with shape ``(shots, bytes)`` that already
+            holds the big-endian packed bytes of each shot.
+        num_shots: The number of shots of each circuit.
+        num_bytes: The number of bytes needed to hold all the clbits of the circuits.
+
+    Returns:
+        An array of shape ``(len(results), num_shots, num_bytes)`` of big-endian bytes, in which
+        the least significant bit of the last byte is clbit 0.
+    """
+    out = np.zeros((len(results), num_shots, num_bytes), dtype=np.uint8)
+    for memory, data in zip(results, out):
+        if isinstance(memory, np.ndarray) and memory.dtype == np.uint8:
+            # pre-packed bytes; align them to the right of the output
+            width = min(num_bytes, memory.shape[-1])
+            if width:
+                data[:, num_bytes - width :] = memory[:, memory.shape[-1] - width :]
         else:
-            # no measure in a circuit
-            data = np.zeros((len(memory), num_bytes), dtype=np.uint8)
-        lst.append(data)
-    ary = np.asarray(lst)
-    return np.unpackbits(ary, axis=-1, bitorder="big")
-
-
-def _samples_to_packed_array(
-    samples: NDArray[np.uint8], num_bits: int, start: int
-) -> NDArray[np.uint8]:
-    """Converts an unpacked array of the memory data into a packed array."""
-    # samples of `Backend.run(memory=True)` will be the order of
-    # clbit_last, ..., clbit_1, clbit_0
-    # place samples in the order of clbit_start+num_bits-1, ..., clbit_start+1, clbit_start
-    if start == 0:
-        ary = samples[:, -start - num_bits :]
+            data[...] = _hex_to_bytes(memory, num_bytes)
+    return out
+
+
+# The value of each hexadecimal digit, indexed by its ASCII code, and 255 for other characters.
+_HEX_VALUES = np.full(256, 255, dtype=np.uint8)
+_HEX_VALUES[np.frombuffer(b"0123456789", dtype=np.uint8)] = np.arange(10)
+_HEX_VALUES[np.frombuffer(b"abcdef", dtype=np.uint8)] = np.arange(10, 16)
+_HEX_VALUES[np.frombuffer(b"ABCDEF", dtype=np.uint8)] = np.arange(10, 16)
+
+
+def _hex_to_bytes(memory: list[str], num_bytes: int) -> NDArray[np.uint8]:
+    """Converts hexadecimal strings into an array of big-endian bytes with shape
+    ``(len(memory), num_bytes)``, without converting each string separately."""
+    num_shots = len(memory)
+    if num_shots == 0 or num_bytes == 0:
+        return np.zeros((num_shots, num_bytes), dtype=np.uint8)
+    strings = np.array(memory, dtype=np.bytes_)
+    lengths = np.char.str_len(strings)
+    width = strings.dtype.itemsize
+    digits = _HEX_VALUES[strings.view(np.uint8).reshape(num_shots, width)]
+    if width >= 2:
+        chars = strings.view(np.uint8).reshape(num_shots, width)
+        prefixed = (lengths >= 2) & (chars[:, 0] == ord("0")) & (chars[:, 1] | 0x20 == ord("x"))
+        digits[prefixed, :2] = 0
+    if np.any(digits[np.arange(width) < lengths[:, None]] > 15):
+        raise QiskitError("The memory of the result contains a string that is not hexadecimal.")
+    # Align the digits of each shot to the right of a field of `2 * num_bytes` digits.
+    columns = lengths[:, None] + np.arange(-2 * num_bytes, 0)
+    nibbles = np.take_along_axis(digits, np.clip(columns, 0, width - 1), axis=1)
+    nibbles[columns < 0] = 0
+    return (nibbles[:, 0::2] << 4) | nibbles[:, 1::2]
+
+
+def _register_bytes(memory: NDArray[np.uint8], start: int, num_bits: int) -> NDArray[np.uint8]:
+    """Extracts the packed bytes of a classical register from the packed bytes of all the clbits.
+
+    Args:
+        memory: Big-endian packed bytes of all the clbits, with any leading shape.
+        start: The index of the first clbit of the register.
+        num_bits: The number of clbits in the register.
+
+    Returns:
+        The big-endian packed bytes of the register's clbits, as for :class:`.BitArray`.
+    """
+    num_bytes = _min_num_bytes(num_bits)
+    if num_bytes == 0:
+        return np.zeros(memory.shape[:-1] + (0,), dtype=np.uint8)
+    byte_shift, bit_shift = divmod(start, 8)
+    # drop the bytes of the clbits below the register, and keep those that overlap it
+    data = memory[..., : max(memory.shape[-1] - byte_shift, 0)]
+    needed = num_bytes + (bit_shift > 0)
+    if data.shape[-1] < needed:
+        pad = [(0, 0)] * (data.ndim - 1) + [(needed - data.shape[-1], 0)]
+        data = np.pad(data, pad)
+    data = data[..., data.shape[-1] - needed :]
+    if bit_shift:
+        out = (data[..., 1:] >> bit_shift) | (data[..., :-1] << (8 - bit_shift))
     else:
-        ary = samples[:, -start - num_bits : -start]
-    # pad 0 in the left to align the number to be mod 8
-    # since np.packbits(bitorder='big') pads 0 to the right.
-    pad_size = -num_bits % 8
-    ary = np.pad(ary, ((0, 0), (pad_size, 0)), constant_values=0)
-    # pack bits in big endian order
-    ary = np.packbits(ary, axis=-1, bitorder="big")
-    return ary
+        out = data.copy()
+    if num_bits % 8:
+        out[..., 0] &= (1 << (num_bits % 8)) - 1
+    return out
@@ -23,7 +23,8 @@ from itertools import chain, islice
 import numpy as np
 from numpy.typing import ArrayLike
 
-from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.circuit import Parameter, ParameterExpression, QuantumCircuit
+from qiskit.circuit._utils import _batched_parameter_values
 
 from .shape import ShapedMixin, ShapeInput, shape_tuple
 
@@ -248,10 +249,64 @@ class BindingsArray(ShapedMixin):
             An object array of the same shape containing all bound circuits.
         """
         arr = np.empty(self.shape, dtype=object)
+        parameters = circuit.parameters
+        if self.num_parameters == len(parameters):
+            try:
+                values = self.as_array(parameters)
+            except ValueError:
+                pass
+            else:
+                # Binding a sequence in the order of the circuit's parameters skips building and
+                # resolving a mapping of parameters for every set of values.
+                for idx in np.ndindex(self.shape):
+                    arr[idx] = circuit.assign_parameters(values[idx].tolist())
+                return arr
         for idx in np.ndindex(self.shape):
             arr[idx] = self.bind(circuit, idx)
         return arr
 
+    def evaluate_parameters(
+        self, circuit: QuantumCircuit
+    ) -> tuple[np.ndarray, dict[tuple[int, int], np.ndarray]]:
+        """Evaluate the parameterized values of a circuit for every set of values at once.
+
+        Every parameter expression in ``circuit`` is evaluated for all the sets of values in this
+        array with vectorized arithmetic, without binding any copies of the circuit.  This gives
+        the values that a bound circuit would hold, in a form that simulators can consume directly
+        for a whole sweep.  Parameters inside the blocks of control-flow operations are not
+        evaluated.
+
+        Args:
+            circuit: The circuit whose parameters this array binds.
+
+        Returns:
+            A tuple ``(global_phase, values)``.  ``global_phase`` is an array of the same shape
+            as this bindings array holding the global phase of each bound circuit.  ``values``
+            maps a pair ``(instruction, index)`` to an array of the same shape holding the bound
+            value of ``circuit.data[instruction].params[index]``, for every parameterized entry.
+
+        Raises:
+            ValueError: If the parameters of this array do not match those of ``circuit``.
+        """
+        parameters = list(circuit.parameters)
+        values = self.as_array(parameters).reshape(self.size, len(parameters))
+        columns = {param: values[:, index] for index, param in enumerate(parameters)}
+
+        def evaluate(param):
+            return np.broadcast_to(
+                _batched_parameter_values(param, columns, self.size), (self.size,)
+            ).reshape(self.shape)
+
+        # Bound global phases are normalized in the same way as by `QuantumCircuit`.
+        global_phase = evaluate(circuit.global_phase) % (2 * np.pi)
+        bound = {
+            (instruction, index): evaluate(param)
+            for instruction, circuit_instruction in enumerate(circuit.data)
+            for index, param in enumerate(circuit_instruction.params)
+            if isinstance(param, ParameterExpression)
+        }
+        return global_phase, bound
+
     def ravel(self) -> BindingsArray:
         """Return a new :class:`~BindingsArray` with one dimension.
 
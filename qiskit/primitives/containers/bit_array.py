@@ -16,21 +16,26 @@ BitArray
 
 from __future__ import annotations
 
+import os
 from collections import defaultdict
 from functools import partial
 from itertools import chain, repeat
 from typing import Literal
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 
 import numpy as np
 from numpy.typing import NDArray
 
-from qiskit.exceptions import QiskitError
-from qiskit.result import Counts, sampled_expectation_value
+from qiskit.quantum_info import SparseObservable
+from qiskit.result import Counts
 
 from .observables_array import ObservablesArray, ObservablesArrayLike
 from .shape import ShapedMixin, ShapeInput, shape_tuple
 
+# The number of packed bytes that the streaming reductions process at a time.  Bit arrays backed
+# by a :class:`numpy.memmap` are only ever read into memory one chunk of shots at a time.
+_CHUNK_BYTES = 1 << 24
+
 
 def _min_num_bytes(num_bits: int) -> int:
     """Return the minimum number of bytes needed to store ``num_bits``."""
@@ -54,6 +59,126 @@ def _pack(arr: NDArray[np.uint8]) -> tuple[NDArray[np.uint8], int]:
     return arr, num_bits
 
 
+def _rows(array: NDArray[np.uint8]) -> NDArray[np.uint8]:
+    """Flatten all but the last axis of ``array``, which is a view for C-contiguous data."""
+    return array.reshape(-1, array.shape[-1])
+
+
+def _chunks(rows: NDArray[np.uint8]) -> Iterable[tuple[int, NDArray[np.uint8]]]:
+    """Yield ``(start, chunk)`` pairs of consecutive blocks of ``rows``."""
+    step = max(1, _CHUNK_BYTES // max(1, rows.shape[-1]))
+    for start in range(0, rows.shape[0], step):
+        yield start, rows[start : start + step]
+
+
+def _count_rows(rows: NDArray[np.uint8], num_bits: int) -> dict[int, int]:
+    """Count the integer outcomes of packed ``rows``, one chunk at a time."""
+    counts = defaultdict(int)
+    num_bytes = rows.shape[-1]
+    excess = num_bits % 8
+    for _, chunk in _chunks(rows):
+        chunk = np.array(chunk, dtype=np.uint8)
+        if excess > 0:
+            chunk[:, 0] &= np.uint8((1 << excess) - 1)
+        if num_bytes <= 8:
+            padded = np.zeros((len(chunk), 8), dtype=np.uint8)
+            padded[:, 8 - num_bytes :] = chunk
+            keys, key_counts = np.unique(padded.view(">u8")[:, 0], return_counts=True)
+            for key, count in zip(keys.tolist(), key_counts.tolist()):
+                counts[key] += count
+        else:
+            keys, key_counts = np.unique(
+                chunk.view(np.dtype((np.void, num_bytes)))[:, 0], return_counts=True
+            )
+            data = keys.tobytes()
+            for i, count in enumerate(key_counts.tolist()):
+                counts[int.from_bytes(data[i * num_bytes : (i + 1) * num_bytes], "big")] += count
+    return dict(counts)
+
+
+def _diagonal_terms(
+    observables: Sequence[SparseObservable], num_words: int
+) -> tuple[NDArray[np.uint64], NDArray[np.uint64], NDArray[np.uint64]]:
+    """Convert the terms of diagonal observables to word masks over packed shots.
+
+    Returns the masks of the qubits with a ``Z``, of the qubits with a projector, and of the
+    qubits projected onto ``1``, each with shape ``(num_terms, num_words)``.
+    """
+    num_bytes = 8 * num_words
+    z_masks, projector_masks, one_masks = [], [], []
+    for observable in observables:
+        bit_terms = np.asarray(observable.bit_terms)
+        indices = np.asarray(observable.indices, dtype=np.intp)
+        is_z = bit_terms == SparseObservable.BitTerm.Z
+        is_one = bit_terms == SparseObservable.BitTerm.ONE
+        is_projector = is_one | (bit_terms == SparseObservable.BitTerm.ZERO)
+        if not (is_z | is_projector).all():
+            label = next(
+                label
+                for label in ObservablesArray._obs_to_dict(observable)
+                if set(label).difference("IZ01")
+            )
+            raise ValueError(f"Input operator {label} is not diagonal")
+        num_terms = len(observable.coeffs)
+        terms = np.repeat(np.arange(num_terms), np.diff(observable.boundaries).astype(np.intp))
+        columns = num_bytes - 1 - indices // 8
+        bits = np.left_shift(1, indices % 8).astype(np.uint8)
+        for masks, selected in (
+            (z_masks, is_z),
+            (projector_masks, is_projector),
+            (one_masks, is_one),
+        ):
+            mask = np.zeros((num_terms, num_bytes), dtype=np.uint8)
+            np.bitwise_or.at(mask, (terms[selected], columns[selected]), bits[selected])
+            masks.append(mask)
+    return tuple(
+        np.concatenate(masks).view(np.uint64) for masks in (z_masks, projector_masks, one_masks)
+    )
+
+
+def _diagonal_expectation_values(
+    array: NDArray[np.uint8], num_bits: int, observables: Sequence[SparseObservable]
+) -> NDArray[np.float64]:
+    """Estimate diagonal observables from the packed shots ``array`` of shape ``(shots, bytes)``.
+
+    Each chunk of shots is reduced to its distinct outcomes, and every term of every observable is
+    then evaluated on them at once: a ``Z`` term contributes the parity of the popcount of the
+    masked outcome, and projectors contribute whether the masked outcome matches.
+    """
+    num_bytes = array.shape[-1]
+    num_words = -(-num_bytes // 8)
+    z_masks, projector_masks, one_masks = _diagonal_terms(observables, num_words)
+    num_terms = len(z_masks)
+    totals = np.zeros(num_terms, dtype=float)
+    step = max(1, _CHUNK_BYTES // (8 * num_words * max(1, num_terms)))
+    excess = num_bits % 8
+    for _, chunk in _chunks(array):
+        chunk = np.array(chunk, dtype=np.uint8)
+        if excess > 0:
+            chunk[:, 0] &= np.uint8((1 << excess) - 1)
+        outcomes, counts = np.unique(
+            chunk.view(np.dtype((np.void, num_bytes)))[:, 0], return_counts=True
+        )
+        words = np.zeros((len(outcomes), 8 * num_words), dtype=np.uint8)
+        words[:, 8 * num_words - num_bytes :] = np.frombuffer(
+            outcomes.tobytes(), dtype=np.uint8
+        ).reshape(-1, num_bytes)
+        words = words.view(np.uint64)[:, None, :]
+        for start in range(0, len(outcomes), step):
+            block = words[start : start + step]
+            parity = np.bitwise_count(block & z_masks).sum(axis=-1, dtype=np.uint64) & 1
+            matches = ((block & projector_masks) == one_masks).all(axis=-1)
+            values = np.where(matches, 1.0 - 2.0 * parity, 0.0)
+            totals += counts[start : start + step] @ values
+    coeffs = np.concatenate([np.real(observable.coeffs) for observable in observables])
+    observable_of_term = np.repeat(
+        np.arange(len(observables)), [len(observable.coeffs) for observable in observables]
+    )
+    return np.bincount(
+        observable_of_term, weights=coeffs * totals / array.shape[0], minlength=len(observables)
+    )
+
+
 class BitArray(ShapedMixin):
     """Stores an array of bit values.
 
@@ -79,6 +204,11 @@ class BitArray(ShapedMixin):
     (``a:b``) or Numpy arrays for each dimension, and use a tuple of items to slice multiple
     dimensions at once. The indexing syntax cannot be used to slice along the "shots" or "bits"
     axes; for these, use :meth:`slice_shots` and :meth:`slice_bits`, respectively.
+
+    The data array may be a :class:`numpy.memmap`, for example one created by :meth:`from_file`.
+    The reductions :meth:`bitcount`, :meth:`get_counts`, :meth:`get_int_counts`,
+    :meth:`expectation_values` and :meth:`slice_bits` stream over fixed-size chunks of shots, so
+    they can be used on sampled data that does not fit in memory.
     """
 
     def __init__(self, array: NDArray[np.uint8], num_bits: int):
@@ -184,19 +314,9 @@ class BitArray(ShapedMixin):
         val = int.from_bytes(data, "big") & mask
         return bin(val)[2:].zfill(num_bits)
 
-    @staticmethod
-    def _bytes_to_int(data: bytes, mask: int) -> int:
-        return int.from_bytes(data, "big") & mask
-
-    def _get_counts(
-        self, *, loc: int | tuple[int, ...] | None, converter: Callable[[bytes], str | int]
-    ) -> dict[str, int] | dict[int, int]:
-        arr = self._array.reshape(-1, self._array.shape[-1]) if loc is None else self._array[loc]
-
-        counts = defaultdict(int)
-        for shot_row in arr:
-            counts[converter(shot_row.tobytes())] += 1
-        return dict(counts)
+    def _get_int_counts(self, loc: int | tuple[int, ...] | None) -> dict[int, int]:
+        arr = self._array if loc is None else self._array[loc]
+        return _count_rows(_rows(arr), self.num_bits)
 
     def bitcount(self) -> NDArray[np.uint64]:
         """Compute the number of ones appearing in the binary representation of each shot.
@@ -204,11 +324,15 @@ class BitArray(ShapedMixin):
         Returns:
             A ``numpy.uint64``-array with shape ``(*shape, num_shots)``.
         """
-        result = np.bitwise_count(self._array).sum(axis=-1)
+        rows = _rows(self._array)
+        result = np.empty(rows.shape[0], dtype=np.uint64)
         excess = self.num_bits % 8
-        if excess > 0:
-            result -= np.bitwise_count(self._array[..., 0] >> np.uint8(excess))
-        return result
+        for start, chunk in _chunks(rows):
+            out = result[start : start + len(chunk)]
+            np.bitwise_count(chunk).sum(axis=-1, dtype=np.uint64, out=out)
+            if excess > 0:
+                out -= np.bitwise_count(chunk[:, 0] >> np.uint8(excess))
+        return result.reshape(self._array.shape[:-1])
 
     @staticmethod
     def from_bool_array(
@@ -335,6 +459,67 @@ class BitArray(ShapedMixin):
         array = np.frombuffer(data, dtype=np.uint8, count=len(data))
         return BitArray(array.reshape(-1, num_bytes), num_bits)
 
+    @staticmethod
+    def from_file(
+        filename: str | os.PathLike,
+        num_bits: int,
+        shape: ShapeInput = (),
+        num_shots: int | None = None,
+        mode: Literal["r", "r+", "c"] = "r",
+        offset: int = 0,
+    ) -> BitArray:
+        """Construct a new bit array backed by a memory-mapped file.
+
+        The file holds the raw packed bytes of the :attr:`~array` in C order, as written by
+        :meth:`to_file`.  The data is not read into memory; reductions such as
+        :meth:`get_counts` or :meth:`bitcount` read it one chunk of shots at a time.
+
+        Args:
+            filename: The file to map.
+            num_bits: The number of bits per shot.
+            shape: The shape of the bit array, excluding the shots and bits axes.
+            num_shots: The number of shots per entry.  If unset, it is inferred from the size
+                of the file.
+            mode: The :class:`numpy.memmap` mode to open the file with.
+            offset: The offset in bytes at which the data starts in the file.
+
+        Returns:
+            A new bit array whose :attr:`~array` is a :class:`numpy.memmap`.
+
+        Raises:
+            ValueError: If ``num_shots`` is unset and the file size is not a whole number of shots.
+        """
+        shape = shape_tuple(shape)
+        num_bytes = _min_num_bytes(num_bits)
+        if num_shots is None:
+            shot_bytes = int(np.prod(shape, dtype=int)) * num_bytes
+            size = os.path.getsize(filename) - offset
+            if shot_bytes == 0 or size % shot_bytes:
+                raise ValueError(
+                    f"A file of {size} bytes does not hold a whole number of shots of shape "
+                    f"{shape} and {num_bits} bits."
+                )
+            num_shots = size // shot_bytes
+        array = np.memmap(
+            filename, dtype=np.uint8, mode=mode, offset=offset, shape=(*shape, num_shots, num_bytes)
+        )
+        return BitArray(array, num_bits)
+
+    def to_file(self, filename: str | os.PathLike, append: bool = False):
+        """Write the packed bytes of this bit array to a file, one chunk of shots at a time.
+
+        The file can be memory-mapped again with :meth:`from_file`.  Appending bit arrays with
+        shape ``()`` to the same file concatenates their shots, so sampled data can be written out
+        in chunks and analyzed afterwards without ever holding all of the shots in memory.
+
+        Args:
+            filename: The file to write to.
+            append: Whether to append to the end of the file rather than overwriting it.
+        """
+        with open(filename, "ab" if append else "wb") as file:
+            for _, chunk in _chunks(_rows(self._array)):
+                file.write(np.ascontiguousarray(chunk).tobytes())
+
     def to_bool_array(self, order: Literal["big", "little"] = "big") -> NDArray[np.bool_]:
         """Convert this :class:`~BitArray` to a boolean array.
 
@@ -368,9 +553,8 @@ class BitArray(ShapedMixin):
         Returns:
             A dictionary mapping bitstrings to the number of occurrences of that bitstring.
         """
-        mask = 2**self.num_bits - 1
-        converter = partial(self._bytes_to_bitstring, num_bits=self.num_bits, mask=mask)
-        return self._get_counts(loc=loc, converter=converter)
+        counts = self._get_int_counts(loc)
+        return {bin(value)[2:].zfill(self.num_bits): count for value, count in counts.items()}
 
     def get_int_counts(self, loc: int | tuple[int, ...] | None = None) -> dict[int, int]:
         r"""Return a counts dictionary, where bitstrings are stored as ``int``\s.
@@ -383,8 +567,7 @@ class BitArray(ShapedMixin):
             A dictionary mapping ``ints`` to the number of occurrences of that ``int``.
 
         """
-        converter = partial(self._bytes_to_int, mask=2**self.num_bits - 1)
-        return self._get_counts(loc=loc, converter=converter)
+        return self._get_int_counts(loc)
 
     def get_bitstrings(self, loc: int | tuple[int, ...] | None = None) -> list[str]:
         """Return a list of bitstrings.
@@ -488,13 +671,16 @@ class BitArray(ShapedMixin):
                 raise IndexError(
                     f"index {index} is out of bounds for the number of bits {self.num_bits}."
                 )
-        # This implementation introduces a temporary 8x memory overhead due to bit
-        # unpacking. This could be fixed using bitwise functions, at the expense of a
-        # more complicated implementation.
-        arr = _unpack(self)
-        arr = arr[..., indices]
-        arr, num_bits = _pack(arr)
-        return BitArray(arr, num_bits)
+        # Bits are unpacked one chunk of shots at a time, which bounds the temporary 8x memory
+        # overhead of unpacking by the chunk size rather than the size of the whole array.
+        num_bits = len(indices)
+        columns = [-1 - index for index in indices]
+        rows = _rows(self._array)
+        arr = np.empty((rows.shape[0], _min_num_bytes(num_bits)), dtype=np.uint8)
+        for start, chunk in _chunks(rows):
+            unpacked = np.unpackbits(chunk, axis=-1, bitorder="big")[:, columns]
+            arr[start : start + len(chunk)] = _pack(unpacked)[0]
+        return BitArray(arr.reshape(self._array.shape[:-1] + arr.shape[-1:]), num_bits)
 
     def slice_shots(self, indices: int | Sequence[int]) -> BitArray:
         """Return a bit array sliced along the shots axis of some indices of interest.
@@ -617,9 +803,12 @@ class BitArray(ShapedMixin):
         .. note::
 
             This method returns the real part of the expectation value even if
-            the operator has complex coefficients due to the specification of
+            the operator has complex coefficients, matching the specification of
             :func:`~.sampled_expectation_value`.
 
+        All terms of the observables paired with an entry of this bit array are evaluated together
+        directly on the packed shots, without building a counts dictionary.
+
         Args:
             observables: The observable(s) to take the expectation value of.
                 Must have a shape broadcastable with this bit array and
@@ -639,19 +828,25 @@ class BitArray(ShapedMixin):
         """
         observables = ObservablesArray.coerce(observables)
         arr_indices = np.fromiter(np.ndindex(self.shape), dtype=object).reshape(self.shape)
-        bc_indices, bc_obs = np.broadcast_arrays(arr_indices, observables)
-        counts = {}
-        arr = np.zeros_like(bc_indices, dtype=float)
+        bc_indices, bc_obs = np.broadcast_arrays(
+            arr_indices, observables.sparse_observables_array()
+        )
+        if bc_obs.size and observables.num_qubits != self.num_bits:
+            raise ValueError(
+                f"One or more operators not same length ({self.num_bits}) as input bitstrings"
+            )
+        # Group the broadcast positions by entry of this array, so that all the observables paired
+        # with one entry are evaluated in a single pass over its shots.
+        positions = defaultdict(list)
         for index in np.ndindex(bc_indices.shape):
-            loc = bc_indices[index]
-            for pauli, coeff in bc_obs[index].items():
-                if loc not in counts:
-                    counts[loc] = self.get_counts(loc)
-                try:
-                    expval = sampled_expectation_value(counts[loc], pauli)
-                except QiskitError as ex:
-                    raise ValueError(ex.message) from ex
-                arr[index] += expval * coeff
+            positions[bc_indices[index]].append(index)
+        arr = np.zeros(bc_indices.shape, dtype=float)
+        for loc, indices in positions.items():
+            expvals = _diagonal_expectation_values(
+                self._array[loc], self.num_bits, [bc_obs[index] for index in indices]
+            )
+            for index, expval in zip(indices, expvals):
+                arr[index] = expval
         return arr
 
     @staticmethod
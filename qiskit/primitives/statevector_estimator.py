@@ -16,6 +16,7 @@ Statevector Estimator V2 class
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import Executor
 
 import numpy as np
 
@@ -25,7 +26,16 @@ from .base import BaseEstimatorV2
 from .containers import DataBin, EstimatorPubLike, PrimitiveResult, PubResult
 from .containers.estimator_pub import EstimatorPub
 from .primitive_job import PrimitiveJob
-from .utils import _statevector_from_circuit
+from .utils import (
+    _batched_statevectors,
+    _leading_axis_slices,
+    _map_concurrently,
+    _observables_to_paulis,
+    _pauli_expectation_values,
+    _slice_leading_axis,
+    _statevector_from_circuit,
+    _unique_parameter_values,
+)
 
 
 class StatevectorEstimator(BaseEstimatorV2):
@@ -112,16 +122,37 @@ class StatevectorEstimator(BaseEstimatorV2):
     """
 
     def __init__(
-        self, *, default_precision: float = 0.0, seed: np.random.Generator | int | None = None
+        self,
+        *,
+        default_precision: float = 0.0,
+        seed: np.random.Generator | int | None = None,
+        executor: Executor | None = None,
+        max_parallel_slices: int = 1,
     ):
         """
         Args:
             default_precision: The default precision for the estimator if not specified during run.
             seed: The seed or Generator object for random number generation.
                 If None, a random seeded default RNG will be used.
+            executor: An optional :class:`~concurrent.futures.Executor`, such as a
+                :class:`~concurrent.futures.ThreadPoolExecutor`, to run the pubs of a job on
+                concurrently.  If None, the pubs are run one after another.  The executor is not
+                shut down by the estimator.
+            max_parallel_slices: When ``executor`` is given, the number of slices along the
+                leading axis of its shape that each pub is split into, to be run as separate
+                tasks.  With the default of 1, each pub is a single task.
+
+        .. note::
+            With an executor, results are only reproducible if ``seed`` is an integer, since a
+            shared :class:`~numpy.random.Generator` is drawn from in whatever order the tasks run
+            in.  The random draws of a pub also depend on how it is split into slices.
         """
+        if max_parallel_slices < 1:
+            raise ValueError(f"max_parallel_slices must be at least 1, not {max_parallel_slices}")
         self._default_precision = default_precision
         self._seed = seed
+        self._executor = executor
+        self._max_parallel_slices = max_parallel_slices
 
     @property
     def default_precision(self) -> float:
@@ -133,6 +164,22 @@ class StatevectorEstimator(BaseEstimatorV2):
         """Return the seed or Generator object for random number generation."""
         return self._seed
 
+    @property
+    def executor(self) -> Executor | None:
+        """Return the executor that pubs are run on, if any."""
+        return self._executor
+
+    @property
+    def max_parallel_slices(self) -> int:
+        """Return the number of slices each pub is split into when run on an executor."""
+        return self._max_parallel_slices
+
+    def __getstate__(self):
+        # Executors cannot be pickled, and are not needed to run a pub in a worker process.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
     def run(
         self, pubs: Iterable[EstimatorPubLike], *, precision: float | None = None
     ) -> PrimitiveJob[PrimitiveResult[PubResult]]:
@@ -145,10 +192,88 @@ class StatevectorEstimator(BaseEstimatorV2):
         return job
 
     def _run(self, pubs: list[EstimatorPub]) -> PrimitiveResult[PubResult]:
-        return PrimitiveResult([self._run_pub(pub) for pub in pubs], metadata={"version": 2})
+        num_slices = 1 if self._executor is None else self._max_parallel_slices
+        tasks = [
+            [_slice_pub(pub, index) for index in _leading_axis_slices(pub.shape, num_slices)]
+            for pub in pubs
+        ]
+        results = iter(
+            _map_concurrently(
+                self._executor, self._run_pub, [task for pub_tasks in tasks for task in pub_tasks]
+            )
+        )
+        return PrimitiveResult(
+            [_join_pub_results([next(results) for _ in pub_tasks]) for pub_tasks in tasks],
+            metadata={"version": 2},
+        )
 
     def _run_pub(self, pub: EstimatorPub) -> PubResult:
         rng = np.random.default_rng(self._seed)
+        evs = self._batched_expectation_values(pub)
+        if evs is None:
+            evs = self._elementwise_expectation_values(pub, rng)
+        elif pub.precision != 0:
+            evs = rng.normal(evs, pub.precision, size=evs.shape)
+        stds = np.zeros_like(evs)
+        data = DataBin(evs=evs, stds=stds, shape=evs.shape)
+        return PubResult(
+            data,
+            metadata={"target_precision": pub.precision, "circuit_metadata": pub.circuit.metadata},
+        )
+
+    @staticmethod
+    def _batched_expectation_values(pub: EstimatorPub) -> np.ndarray | None:
+        """Compute the exact expectation values of a pub with batched simulation.
+
+        Each distinct set of parameter values is simulated once, with the sets simulated together
+        in chunks, and every distinct Pauli term across all the observables is evaluated against
+        each chunk of states before the next one is simulated.  Returns ``None`` if the circuit
+        cannot be simulated in batches.
+        """
+        circuit = pub.circuit
+        parameter_values = pub.parameter_values
+        parameters, values, parameter_index = _unique_parameter_values(circuit, parameter_values)
+        chunks = _batched_statevectors(circuit, parameters, values)
+        if chunks is None:
+            return None
+        observables = pub.observables.sparse_observables_array()
+        x, z, pointers, terms, coeffs = _observables_to_paulis(observables.ravel())
+        pauli_evs = np.empty((len(x), len(values)))
+        for start, states in chunks:
+            pauli_evs[:, start : start + len(states)] = _pauli_expectation_values(states, x, z)
+
+        # Find the distinct pairs of observable and parameter set that appear in the broadcast.
+        shape = np.broadcast_shapes(parameter_values.shape, observables.shape)
+        parameter_index = np.broadcast_to(parameter_index, shape).ravel()
+        observable_index = np.broadcast_to(
+            np.arange(observables.size).reshape(observables.shape), shape
+        ).ravel()
+        pairs, pair_index = np.unique(
+            observable_index * len(values) + parameter_index, return_inverse=True
+        )
+        pair_observables, pair_parameters = np.divmod(pairs, len(values))
+
+        # Sum the terms of each pair's observable.
+        lengths = pointers[pair_observables + 1] - pointers[pair_observables]
+        offsets = np.cumsum(lengths) - lengths
+        positions = np.arange(lengths.sum()) + np.repeat(
+            pointers[pair_observables] - offsets, lengths
+        )
+        contributions = (
+            coeffs[positions] * pauli_evs[terms[positions], np.repeat(pair_parameters, lengths)]
+        )
+        pair_evs = np.bincount(
+            np.repeat(np.arange(len(pairs)), lengths), weights=contributions, minlength=len(pairs)
+        )
+        return pair_evs[pair_index.ravel()].reshape(shape)
+
+    @staticmethod
+    def _elementwise_expectation_values(pub: EstimatorPub, rng: np.random.Generator) -> np.ndarray:
+        """Compute the expectation values of a pub by simulating each element separately.
+
+        This handles circuits with non-unitary operations, such as resets, that make the final
+        state stochastic.
+        """
         circuit = pub.circuit
         observables = pub.observables
         parameter_values = pub.parameter_values
@@ -156,7 +281,6 @@ class StatevectorEstimator(BaseEstimatorV2):
         bound_circuits = parameter_values.bind_all(circuit)
         bc_circuits, bc_obs = np.broadcast_arrays(bound_circuits, observables)
         evs = np.zeros_like(bc_circuits, dtype=np.float64)
-        stds = np.zeros_like(bc_circuits, dtype=np.float64)
         for index in np.ndindex(*bc_circuits.shape):
             bound_circuit = bc_circuits[index]
             observable = bc_obs[index]
@@ -169,8 +293,27 @@ class StatevectorEstimator(BaseEstimatorV2):
                     raise ValueError("Given operator is not Hermitian and noise cannot be added.")
                 expectation_value = rng.normal(expectation_value, precision)
             evs[index] = expectation_value
+        return evs
 
-        data = DataBin(evs=evs, stds=stds, shape=evs.shape)
-        return PubResult(
-            data, metadata={"target_precision": precision, "circuit_metadata": pub.circuit.metadata}
-        )
+
+def _slice_pub(pub: EstimatorPub, index: slice) -> EstimatorPub:
+    """Get the part of a pub in a slice of the leading axis of its shape."""
+    if index == slice(None):
+        return pub
+    ndim = len(pub.shape)
+    return EstimatorPub(
+        pub.circuit,
+        _slice_leading_axis(pub.observables, ndim, index),
+        _slice_leading_axis(pub.parameter_values, ndim, index),
+        pub.precision,
+        validate=False,
+    )
+
+
+def _join_pub_results(results: list[PubResult]) -> PubResult:
+    """Join the results of the slices of a pub along the leading axis."""
+    if len(results) == 1:
+        return results[0]
+    evs = np.concatenate([result.data.evs for result in results])
+    stds = np.concatenate([result.data.stds for result in results])
+    return PubResult(DataBin(evs=evs, stds=stds, shape=evs.shape), metadata=results[0].metadata)
@@ -18,9 +18,9 @@ from __future__ import annotations
 import warnings
 from dataclasses import dataclass
 from collections.abc import Iterable
+from concurrent.futures import Executor
 
 import numpy as np
-from numpy.typing import NDArray
 
 from qiskit import ClassicalRegister, QiskitError, QuantumCircuit
 from qiskit.quantum_info import Statevector
@@ -28,6 +28,7 @@ from qiskit.quantum_info import Statevector
 from .base import BaseSamplerV2
 from .base.validation_v1 import _has_measure
 from .containers import (
+    BindingsArray,
     BitArray,
     DataBin,
     PrimitiveResult,
@@ -37,7 +38,13 @@ from .containers import (
 from .containers.sampler_pub import SamplerPub
 from .containers.bit_array import _min_num_bytes
 from .primitive_job import PrimitiveJob
-from .utils import bound_circuit_to_instruction
+from .utils import (
+    _batched_statevectors,
+    _leading_axis_slices,
+    _map_concurrently,
+    _unique_parameter_values,
+    bound_circuit_to_instruction,
+)
 
 
 @dataclass
@@ -133,15 +140,38 @@ class StatevectorSampler(BaseSamplerV2):
 
     """
 
-    def __init__(self, *, default_shots: int = 1024, seed: np.random.Generator | int | None = None):
+    def __init__(
+        self,
+        *,
+        default_shots: int = 1024,
+        seed: np.random.Generator | int | None = None,
+        executor: Executor | None = None,
+        max_parallel_slices: int = 1,
+    ):
         """
         Args:
             default_shots: The default shots for the sampler if not specified during run.
             seed: The seed or Generator object for random number generation.
                 If None, a random seeded default RNG will be used.
+            executor: An optional :class:`~concurrent.futures.Executor`, such as a
+                :class:`~concurrent.futures.ThreadPoolExecutor`, to run the pubs of a job on
+                concurrently.  If None, the pubs are run one after another.  The executor is not
+                shut down by the sampler.
+            max_parallel_slices: When ``executor`` is given, the number of slices along the
+                leading axis of its shape that each pub is split into, to be run as separate
+                tasks.  With the default of 1, each pub is a single task.
+
+        .. note::
+            With an executor, results are only reproducible if ``seed`` is an integer, since a
+            shared :class:`~numpy.random.Generator` is drawn from in whatever order the tasks run
+            in.
         """
+        if max_parallel_slices < 1:
+            raise ValueError(f"max_parallel_slices must be at least 1, not {max_parallel_slices}")
         self._default_shots = default_shots
         self._seed = seed
+        self._executor = executor
+        self._max_parallel_slices = max_parallel_slices
 
     @property
     def default_shots(self) -> int:
@@ -153,6 +183,22 @@ class StatevectorSampler(BaseSamplerV2):
         """Return the seed or Generator object for random number generation."""
         return self._seed
 
+    @property
+    def executor(self) -> Executor | None:
+        """Return the executor that pubs are run on, if any."""
+        return self._executor
+
+    @property
+    def max_parallel_slices(self) -> int:
+        """Return the number of slices each pub is split into when run on an executor."""
+        return self._max_parallel_slices
+
+    def __getstate__(self):
+        # Executors cannot be pickled, and are not needed to run a pub in a worker process.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
     def run(
         self, pubs: Iterable[SamplerPubLike], *, shots: int | None = None
     ) -> PrimitiveJob[PrimitiveResult[SamplerPubResult]]:
@@ -171,29 +217,42 @@ class StatevectorSampler(BaseSamplerV2):
         return job
 
     def _run(self, pubs: Iterable[SamplerPub]) -> PrimitiveResult[SamplerPubResult]:
-        results = [self._run_pub(pub) for pub in pubs]
-        return PrimitiveResult(results, metadata={"version": 2})
+        num_slices = 1 if self._executor is None else self._max_parallel_slices
+        tasks = [
+            [_slice_pub(pub, index) for index in _leading_axis_slices(pub.shape, num_slices)]
+            for pub in pubs
+        ]
+        results = iter(
+            _map_concurrently(
+                self._executor, self._run_pub, [task for pub_tasks in tasks for task in pub_tasks]
+            )
+        )
+        return PrimitiveResult(
+            [_join_pub_results([next(results) for _ in pub_tasks]) for pub_tasks in tasks],
+            metadata={"version": 2},
+        )
 
     def _run_pub(self, pub: SamplerPub) -> SamplerPubResult:
         circuit, qargs, meas_info = _preprocess_circuit(pub.circuit)
-        bound_circuits = pub.parameter_values.bind_all(circuit)
+        shape = pub.parameter_values.shape
         arrays = {
-            item.creg_name: np.zeros(
-                bound_circuits.shape + (pub.shots, item.num_bytes), dtype=np.uint8
-            )
+            item.creg_name: np.zeros(shape + (pub.shots, item.num_bytes), dtype=np.uint8)
             for item in meas_info
         }
-        for index, bound_circuit in np.ndenumerate(bound_circuits):
-            final_state = Statevector(bound_circuit_to_instruction(bound_circuit))
-            final_state.seed(self._seed)
+        if qargs:
+            probabilities, state_index = _final_probabilities(circuit, qargs, pub.parameter_values)
+        for index in np.ndindex(shape):
             if qargs:
-                samples = final_state.sample_memory(shots=pub.shots, qargs=qargs)
+                # This draws the same samples as `Statevector.sample_memory` with the same seed, but
+                # as integer outcomes rather than bitstrings.
+                probs = probabilities[state_index[index]]
+                outcomes = _rng(self._seed).choice(len(probs), p=probs, size=pub.shots)
             else:
-                samples = [""] * pub.shots
-            samples_array = np.array([np.fromiter(sample, dtype=np.uint8) for sample in samples])
+                outcomes = np.zeros(pub.shots, dtype=np.int64)
             for item in meas_info:
-                ary = _samples_to_packed_array(samples_array, item.num_bits, item.qreg_indices)
-                arrays[item.creg_name][index] = ary
+                _pack_outcomes(
+                    outcomes, item.qreg_indices, len(qargs), arrays[item.creg_name][index]
+                )
 
         meas = {
             item.creg_name: BitArray(arrays[item.creg_name], item.num_bits) for item in meas_info
@@ -204,6 +263,90 @@ class StatevectorSampler(BaseSamplerV2):
         )
 
 
+def _slice_pub(pub: SamplerPub, index: slice) -> SamplerPub:
+    """Get the part of a pub in a slice of the leading axis of its shape."""
+    if index == slice(None):
+        return pub
+    return SamplerPub(pub.circuit, pub.parameter_values[index], pub.shots, validate=False)
+
+
+def _join_pub_results(results: list[SamplerPubResult]) -> SamplerPubResult:
+    """Join the results of the slices of a pub along the leading axis."""
+    if len(results) == 1:
+        return results[0]
+    first = results[0].data
+    shape = (sum(result.data.shape[0] for result in results),) + first.shape[1:]
+    meas = {name: BitArray.concatenate([result.data[name] for result in results]) for name in first}
+    return SamplerPubResult(DataBin(**meas, shape=shape), metadata=results[0].metadata)
+
+
+def _rng(seed: np.random.Generator | int | None) -> np.random.Generator:
+    """Get the generator that :meth:`.Statevector.seed` would use for ``seed``."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def _final_probabilities(
+    circuit: QuantumCircuit, qargs: list[int], parameter_values: BindingsArray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Compute the outcome probabilities of the measured qubits once for each distinct set of
+    parameter values.
+
+    Returns:
+        A tuple ``(probabilities, index)``, where ``probabilities`` is a 2D array of the
+        probabilities of each distinct final state over the outcomes of ``qargs``, and ``index`` is
+        an integer array of the shape of ``parameter_values`` that gives the row of
+        ``probabilities`` to use for each element.
+    """
+    parameters, values, index = _unique_parameter_values(circuit, parameter_values)
+    chunks = _batched_statevectors(circuit, parameters, values)
+    if chunks is None:
+        probabilities = np.array(
+            [
+                Statevector(
+                    bound_circuit_to_instruction(
+                        circuit.assign_parameters(dict(zip(parameters, row.tolist())))
+                    )
+                ).probabilities(qargs)
+                for row in values
+            ]
+        )
+        return probabilities, index
+    num_qubits = circuit.num_qubits
+    # Qubit `q` is axis `num_qubits - q` of the tensor; summing out the unmeasured qubits leaves
+    # the measured ones in descending order, which flattens to little-endian outcome indices.
+    unmeasured = tuple(num_qubits - qubit for qubit in range(num_qubits) if qubit not in qargs)
+    probabilities = np.empty((len(values), 1 << (num_qubits - len(unmeasured))))
+    # Each chunk of states is reduced to its marginal probabilities before the next is simulated.
+    for start, states in chunks:
+        tensor = (np.abs(states) ** 2).reshape((len(states),) + (2,) * num_qubits)
+        probabilities[start : start + len(states)] = tensor.sum(axis=unmeasured).reshape(
+            len(states), -1
+        )
+    return probabilities, index
+
+
+def _pack_outcomes(
+    outcomes: np.ndarray, indices: list[int], num_measured: int, out: np.ndarray
+) -> None:
+    """Pack the bits of integer outcomes into the big-endian bytes of a :class:`.BitArray`.
+
+    Args:
+        outcomes: The sampled outcomes, as indices into the probabilities of the measured qubits.
+        indices: For each clbit of the register, the position of the bit in the outcomes that it
+            holds.  Positions of ``num_measured`` or more are for clbits that are not measured.
+        num_measured: The number of measured qubits.
+        out: The array to write the packed bytes to, with shape ``(shots, num_bytes)``.
+    """
+    num_bytes = out.shape[-1]
+    for clbit, position in enumerate(indices):
+        if position >= num_measured:
+            continue
+        bits = ((outcomes >> position) & 1).astype(np.uint8)
+        out[:, num_bytes - 1 - clbit // 8] |= bits << (clbit % 8)
+
+
 def _preprocess_circuit(circuit: QuantumCircuit):
     num_bits_dict = {creg.name: creg.size for creg in circuit.cregs}
     mapping = _final_measurement_mapping(circuit)
@@ -214,7 +357,7 @@ def _preprocess_circuit(circuit: QuantumCircuit):
         raise QiskitError("StatevectorSampler cannot handle ControlFlowOp")
     if _has_measure(circuit):
         raise QiskitError("StatevectorSampler cannot handle mid-circuit measurements")
-    # num_qubits is used as sentinel to fill 0 in _samples_to_packed_array
+    # num_qubits is used as sentinel for clbits that are not measured
     sentinel = len(qargs)
     indices = {key: [sentinel] * val for key, val in num_bits_dict.items()}
     for key, qreg in mapping.items():
@@ -232,25 +375,6 @@ def _preprocess_circuit(circuit: QuantumCircuit):
     return circuit, qargs, meas_info
 
 
-def _samples_to_packed_array(
-    samples: NDArray[np.uint8], num_bits: int, indices: list[int]
-) -> NDArray[np.uint8]:
-    # samples of `Statevector.sample_memory` will be in the order of
-    # qubit_last, ..., qubit_1, qubit_0.
-    # reverse the sample order into qubit_0, qubit_1, ..., qubit_last and
-    # pad 0 in the rightmost to be used for the sentinel introduced by _preprocess_circuit.
-    ary = np.pad(samples[:, ::-1], ((0, 0), (0, 1)), constant_values=0)
-    # place samples in the order of clbit_last, ..., clbit_1, clbit_0
-    ary = ary[:, indices[::-1]]
-    # pad 0 in the left to align the number to be mod 8
-    # since np.packbits(bitorder='big') pads 0 to the right.
-    pad_size = -num_bits % 8
-    ary = np.pad(ary, ((0, 0), (pad_size, 0)), constant_values=0)
-    # pack bits in big endian order
-    ary = np.packbits(ary, axis=-1)
-    return ary
-
-
 def _final_measurement_mapping(circuit: QuantumCircuit) -> dict[tuple[ClassicalRegister, int], int]:
     """Return the final measurement mapping for the circuit.
 
@@ -14,10 +14,22 @@ Utility functions for primitives
 """
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor
+from typing import Any
+
 import numpy as np
 
-from qiskit.circuit import Instruction, QuantumCircuit
-from qiskit.quantum_info import Statevector
+from qiskit.circuit import Instruction, Parameter, QuantumCircuit
+from qiskit.circuit._utils import _batched_parameter_values, _batched_standard_gate_matrices
+from qiskit.exceptions import QiskitError
+from qiskit.quantum_info import Operator, SparseObservable, Statevector
+
+from .containers.bindings_array import BindingsArray
+
+# The largest number of amplitudes held at once by the batched simulation, across all batch
+# elements.  Larger batches are split into chunks.
+_MAX_BATCH_AMPLITUDES = 1 << 22
 
 
 def _statevector_from_circuit(
@@ -70,3 +82,223 @@ def bound_circuit_to_instruction(circuit: QuantumCircuit) -> Instruction:
     )
     inst.definition = circuit
     return inst
+
+
+def _unique_parameter_values(
+    circuit: QuantumCircuit, parameter_values: BindingsArray
+) -> tuple[list[Parameter], np.ndarray, np.ndarray]:
+    """Find the distinct sets of parameter values in a bindings array.
+
+    Returns:
+        A tuple ``(parameters, values, index)``, where ``values`` is a 2D array of the distinct
+        sets of values, with columns in the order of ``parameters``, and ``index`` is an integer
+        array of the shape of ``parameter_values`` giving the row of ``values`` for each element.
+    """
+    parameters = list(circuit.parameters)
+    if not parameters:
+        return parameters, np.empty((1, 0)), np.zeros(parameter_values.shape, dtype=int)
+    values = parameter_values.as_array(parameters).reshape(-1, len(parameters))
+    values, index = np.unique(values, axis=0, return_inverse=True)
+    return parameters, values, index.reshape(parameter_values.shape)
+
+
+def _batched_statevectors(
+    circuit: QuantumCircuit, parameters: Sequence[Parameter], values: np.ndarray
+) -> Iterator[tuple[int, np.ndarray]] | None:
+    """Simulate a parametrized circuit for many sets of parameter values at once.
+
+    The state carries a leading batch dimension over the parameter sets, so each instruction is
+    applied to every state with a single vectorized operation, and gates without parameters are
+    only converted to matrices once.  Global phases are ignored.
+
+    The parameter sets are simulated in chunks of at most ``_MAX_BATCH_AMPLITUDES`` amplitudes as
+    the returned iterator is consumed, so callers that reduce each chunk before moving on to the
+    next only ever hold one chunk of statevectors in memory.
+
+    Args:
+        circuit: The circuit to simulate.
+        parameters: The parameters of the circuit, in the order of the columns of ``values``.
+        values: A 2D array of parameter values, indexed by batch element then parameter.
+
+    Returns:
+        An iterator of ``(start, states)`` pairs, where ``states`` is a 2D array of the final
+        statevectors of the rows of ``values`` from ``start`` onwards, indexed by batch element
+        then basis state.  ``None`` if the circuit contains an instruction that cannot be simulated
+        in batches, such as a reset, in which case the caller should fall back to
+        :class:`.Statevector`.
+    """
+    num_qubits = circuit.num_qubits
+    instructions = _flatten_for_batching(circuit, list(range(num_qubits)))
+    if instructions is None:
+        return None
+    return _simulate_batches(instructions, num_qubits, parameters, values)
+
+
+def _simulate_batches(
+    instructions: list, num_qubits: int, parameters: Sequence[Parameter], values: np.ndarray
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Simulate flattened instructions for chunks of parameter sets; see
+    :func:`_batched_statevectors`."""
+    chunk = max(1, _MAX_BATCH_AMPLITUDES >> num_qubits)
+    for start in range(0, len(values), chunk):
+        chunk_values = values[start : start + chunk]
+        batch = len(chunk_values)
+        columns = {param: chunk_values[:, index] for index, param in enumerate(parameters)}
+        states = np.zeros((batch, 1 << num_qubits), dtype=complex)
+        states[:, 0] = 1.0
+        for matrix, instruction, qubits in instructions:
+            if matrix is None:
+                params = [
+                    _batched_parameter_values(param, columns, batch) for param in instruction.params
+                ]
+                matrix = _batched_standard_gate_matrices(instruction.operation, params, batch)
+            states = _apply_batched_matrix(states, matrix, qubits, num_qubits)
+        yield start, states
+
+
+def _flatten_for_batching(circuit: QuantumCircuit, qubit_map: list[int]) -> list | None:
+    """Flatten a circuit into a list of ``(matrix, instruction, qubits)`` to apply, where
+    ``matrix`` is ``None`` for parametrized standard gates, or return ``None`` if the circuit
+    contains something that cannot be batched."""
+    out = []
+    for instruction in circuit.data:
+        if instruction.is_directive() or instruction.name == "delay":
+            continue
+        if instruction.clbits:
+            return None
+        qubits = [qubit_map[circuit.find_bit(qubit).index] for qubit in instruction.qubits]
+        if instruction.is_standard_gate() and instruction.is_parameterized():
+            out.append((None, instruction, qubits))
+            continue
+        matrix = None if instruction.is_parameterized() else instruction.matrix
+        if matrix is None and (definition := instruction.operation.definition) is not None:
+            if (inner := _flatten_for_batching(definition, qubits)) is None:
+                return None
+            out.extend(inner)
+            continue
+        if matrix is None:
+            if instruction.is_parameterized():
+                return None
+            try:
+                matrix = Operator(instruction.operation).data
+            except QiskitError:
+                return None
+        out.append((matrix, instruction, qubits))
+    return out
+
+
+def _apply_batched_matrix(
+    states: np.ndarray, matrix: np.ndarray, qubits: list[int], num_qubits: int
+) -> np.ndarray:
+    """Apply a matrix, or a batch of matrices, to the given qubits of a batch of states."""
+    batch = states.shape[0]
+    num_targets = len(qubits)
+    # Axis 0 is the batch, and qubit ``q`` is axis ``num_qubits - q`` in the C-ordered tensor.
+    source = [num_qubits - qubit for qubit in reversed(qubits)]
+    destination = list(range(num_qubits + 1 - num_targets, num_qubits + 1))
+    tensor = np.moveaxis(states.reshape((batch,) + (2,) * num_qubits), source, destination)
+    shape = tensor.shape
+    flat = tensor.reshape(batch, -1, 1 << num_targets)
+    flat = flat @ (matrix.T if matrix.ndim == 2 else matrix.transpose(0, 2, 1))
+    return np.moveaxis(flat.reshape(shape), destination, source).reshape(batch, -1)
+
+
+def _observables_to_paulis(
+    observables: Sequence[SparseObservable],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Decompose observables into a shared table of distinct Pauli terms.
+
+    Returns:
+        A tuple ``(x, z, pointers, terms, coeffs)``.  ``x`` and ``z`` are the bitmasks of the
+        distinct Paulis.  The terms of observable ``i`` are ``terms[pointers[i]:pointers[i + 1]]``,
+        which index into ``x`` and ``z``, with coefficients ``coeffs[pointers[i]:pointers[i + 1]]``.
+    """
+    x_masks, z_masks, coeffs, pointers = [], [], [], [0]
+    for observable in observables:
+        observable = observable.as_paulis()
+        bit_terms = np.asarray(observable.bit_terms, dtype=np.int64)
+        indices = np.asarray(observable.indices, dtype=np.int64)
+        boundaries = np.asarray(observable.boundaries, dtype=np.int64)
+        for bits, masks in ((bit_terms & 1, z_masks), ((bit_terms >> 1) & 1, x_masks)):
+            # The qubits within a term are distinct, so summing the bits gives their union.
+            cumulative = np.concatenate(([0], np.cumsum(bits << indices)))
+            masks.append(cumulative[boundaries[1:]] - cumulative[boundaries[:-1]])
+        coeffs.append(np.real(observable.coeffs))
+        pointers.append(pointers[-1] + len(observable.coeffs))
+    paulis, terms = np.unique(
+        np.stack([np.concatenate(x_masks), np.concatenate(z_masks)], axis=1),
+        axis=0,
+        return_inverse=True,
+    )
+    return paulis[:, 0], paulis[:, 1], np.array(pointers), terms.ravel(), np.concatenate(coeffs)
+
+
+def _pauli_expectation_values(states: np.ndarray, x: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """Compute the expectation values of many Paulis for a batch of statevectors.
+
+    Paulis with the same X component share the work of pairing up the amplitudes, and the
+    Z components are then applied as a single matrix product.
+
+    Args:
+        states: A 2D array of statevectors, indexed by batch element then basis state.
+        x: The X bitmasks of the Paulis.
+        z: The Z bitmasks of the Paulis.
+
+    Returns:
+        A 2D array of expectation values, indexed by Pauli then batch element.
+    """
+    basis = np.arange(states.shape[1], dtype=np.int64)
+    out = np.empty((len(x), len(states)))
+    chunk = max(1, _MAX_BATCH_AMPLITUDES // states.shape[1])
+    for x_mask in np.unique(x):
+        if x_mask == 0:
+            paired = np.abs(states) ** 2
+        else:
+            paired = states.conj() * states[:, basis ^ x_mask]
+        selected = np.flatnonzero(x == x_mask)
+        for start in range(0, len(selected), chunk):
+            part = selected[start : start + chunk]
+            signs = 1 - 2 * (np.bitwise_count(basis[:, None] & z[part]) & 1).astype(np.int8)
+            # A Pauli with bitmasks (x, z) is (-i)^|x & z| Z^z X^x.
+            phases = (-1j) ** np.bitwise_count(x_mask & z[part])
+            out[part] = np.real((paired @ signs) * phases).T
+    return out
+
+
+def _map_concurrently(
+    executor: Executor | None, function: Callable[[Any], Any], items: Sequence[Any]
+) -> list:
+    """Apply ``function`` to each of ``items``, on ``executor`` if given, keeping the order.
+
+    If any call raises, the calls that have not started yet are cancelled and the exception is
+    re-raised.
+    """
+    if executor is None or len(items) <= 1:
+        return [function(item) for item in items]
+    futures = [executor.submit(function, item) for item in items]
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+
+def _leading_axis_slices(shape: tuple[int, ...], num_slices: int) -> list[slice]:
+    """Split the leading axis of ``shape`` into at most ``num_slices`` contiguous slices of
+    near-equal length."""
+    if not shape or num_slices <= 1 or shape[0] <= 1:
+        return [slice(None)]
+    bounds = np.linspace(0, shape[0], min(num_slices, shape[0]) + 1).astype(int)
+    return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _slice_leading_axis(array, ndim: int, index: slice):
+    """Slice the leading axis of a broadcast of ``ndim`` dimensions out of a shaped ``array``.
+
+    Arrays that broadcast along the leading axis, because they have fewer dimensions or a length
+    of one there, are returned whole.
+    """
+    if array.ndim < ndim or array.shape[0] == 1:
+        return array
+    return array[index]
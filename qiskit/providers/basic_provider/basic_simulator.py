@@ -32,7 +32,6 @@ field, which is a result of measurements for each shot.
 
 from __future__ import annotations
 
-import math
 import uuid
 import time
 import logging
@@ -111,8 +110,8 @@ class BasicSimulator(BackendV2):
         self._target = target
 
         # Internal simulator variables
-        self._classical_memory = 0
         self._statevector = 0
+        self._scratch = None
         self._number_of_cmembits = 0
         self._number_of_qubits = 0
         self._local_rng = None
@@ -229,48 +228,114 @@ class BasicSimulator(BackendV2):
             use_clifford_optimization=False,
         )
 
-    def _add_unitary(self, gate: np.ndarray, qubits: list[int]) -> None:
-        """Apply an N-qubit unitary matrix.
+    def _apply_matrix(self, gate_tensor: np.ndarray, indexes: str) -> None:
+        """Apply a gate tensor compiled by :meth:`_compile_circuit`, writing the result into the
+        scratch buffer and swapping it with the statevector."""
+        np.einsum(indexes, gate_tensor, self._statevector, out=self._scratch, casting="no")
+        self._statevector, self._scratch = self._scratch, self._statevector
 
-        Args:
-            gate (matrix_like): an N-qubit unitary matrix
-            qubits (list): the list of N-qubits.
-        """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(
-            indexes, gate_tensor, self._statevector, dtype=complex, casting="no"
-        )
-
-    def _get_measure_outcome(self, qubit: int) -> tuple[str, int]:
-        """Simulate the outcome of measurement of a qubit.
+    def _compile_circuit(self, circuit: QuantumCircuit) -> tuple[list[tuple], complex]:
+        """Compile a circuit into a list of simulation steps.
 
-        Args:
-            qubit: index indicating the qubit to measure
+        Qubit and clbit indices and gate matrices are resolved once, rather than once per shot.
+        Runs of gates that together act on at most two qubits are fused into a single matrix,
+        and diagonal matrices are stored as arrays that broadcast against the statevector, so
+        they can be applied in place.
 
         Returns:
-            pair (outcome, probability) where outcome is '0' or '1' and
-            probability is the probability of the returned outcome.
+            The list of steps, and the global phase factor of the circuit.  Each step is one of
+            ``("matrix", gate_tensor, einsum_indexes)``, ``("diagonal", factors)``,
+            ``("reset", qubit)`` or ``("measure", qubit, cmembit)``.
+
+        Raises:
+            BasicProviderError: if the circuit contains an unsupported operation.
         """
-        # Axis for numpy.sum to compute probabilities
-        axis = list(range(self._number_of_qubits))
-        axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
-        # Compute einsum index string for 1-qubit matrix multiplication
-        random_number = self._local_rng.random()
-        if random_number < probabilities[0]:
-            return "0", probabilities[0]
-        # Else outcome was '1'
-        return "1", probabilities[1]
+        qubit_indices = {bit: index for index, bit in enumerate(circuit.qubits)}
+        clbit_indices = {bit: index for index, bit in enumerate(circuit.clbits)}
+        plan = []
+        phase = np.exp(1j * circuit.global_phase)
+        # The pending fused block of gates: the qubits it acts on, and its matrix.
+        block_qubits = []
+        block_matrix = None
+
+        def flush():
+            nonlocal block_qubits, block_matrix
+            if block_matrix is not None:
+                plan.append(self._compile_matrix(block_matrix, block_qubits))
+            block_qubits, block_matrix = [], None
+
+        for operation in circuit.data:
+            name = operation.name
+            if name in ("id", "u0", "delay", "barrier"):
+                continue
+            qubits = [qubit_indices[bit] for bit in operation.qubits]
+            if name == "unitary":
+                gate = operation.operation.params[0]
+            elif name == "global_phase":
+                gate = GlobalPhaseGate(*operation.params).to_matrix()
+            elif name in SINGLE_QUBIT_GATES:
+                gate = single_gate_matrix(name, operation.params)
+            elif name in TWO_QUBIT_GATES_WITH_PARAMETERS:
+                gate = TWO_QUBIT_GATES_WITH_PARAMETERS[name](*operation.params).to_matrix()
+            elif name in TWO_QUBIT_GATES:
+                gate = TWO_QUBIT_GATES[name]
+            elif name in THREE_QUBIT_GATES:
+                gate = THREE_QUBIT_GATES[name]
+            elif name == "reset":
+                flush()
+                plan.append(("reset", qubits[0]))
+                continue
+            elif name == "measure":
+                flush()
+                plan.append(("measure", qubits[0], clbit_indices[operation.clbits[0]]))
+                continue
+            else:
+                backend = self.name
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicProviderError(err_msg.format(backend, name))
+
+            gate = np.asarray(gate, dtype=complex)
+            if not qubits:
+                phase *= gate[0, 0]
+                continue
+            union = block_qubits + [qubit for qubit in qubits if qubit not in block_qubits]
+            if len(union) > 2:
+                flush()
+                if len(qubits) > 2:
+                    plan.append(self._compile_matrix(gate, qubits))
+                    continue
+                union = qubits
+            if block_matrix is None:
+                block_matrix = _embed_matrix(gate, qubits, union)
+            else:
+                block_matrix = _embed_matrix(gate, qubits, union) @ _embed_matrix(
+                    block_matrix, block_qubits, union
+                )
+            block_qubits = union
+        flush()
+        return plan, phase
+
+    def _compile_matrix(self, matrix: np.ndarray, qubits: list[int]) -> tuple:
+        """Compile the application of a matrix to some qubits into a simulation step."""
+        num_qubits = len(qubits)
+        diagonal = np.diagonal(matrix)
+        if np.count_nonzero(matrix - np.diag(diagonal)) == 0:
+            # Statevector axis ``n - 1 - q`` is qubit ``q``, and axis ``i`` of the reshaped
+            # diagonal is ``qubits[num_qubits - 1 - i]``.
+            order = sorted(qubits, reverse=True)
+            factors = np.reshape(diagonal, num_qubits * [2]).transpose(
+                [num_qubits - 1 - qubits.index(qubit) for qubit in order]
+            )
+            shape = self._number_of_qubits * [1]
+            for qubit in qubits:
+                shape[self._number_of_qubits - 1 - qubit] = 2
+            return ("diagonal", np.reshape(factors, shape))
+        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
+        return ("matrix", np.reshape(matrix, num_qubits * [2, 2]), indexes)
 
     def _add_sample_measure(
         self, measure_params: list[tuple[int, int]], num_samples: int
-    ) -> list[hex]:
+    ) -> dict[str, dict[str, int] | list[str]]:
         """Generate memory samples from current statevector.
 
         Args:
@@ -279,7 +344,8 @@ class BasicSimulator(BackendV2):
             num_samples: The number of memory samples to generate.
 
         Returns:
-            A list of memory values in hex format.
+            The result data of the samples, with the counts of the memory values in hex format,
+            and the memory of each shot if it was requested.
         """
         # Get unique qubits that are actually measured and sort in
         # ascending order
@@ -299,60 +365,121 @@ class BasicSimulator(BackendV2):
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
-        samples = self._local_rng.choice(range(2**num_measured), num_samples, p=probabilities)
-        # Convert the ints to bitstrings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for qubit, cmembit in measure_params:
-                pos = measured_qubits.index(qubit)
-                qubit_outcome = int((sample & (1 << pos)) >> pos)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
-        return memory
-
-    def _add_measure(self, qubit: int, cmembit: int) -> None:
-        """Apply a measure instruction to a qubit.
+        samples = self._local_rng.choice(2**num_measured, num_samples, p=probabilities)
+        values, inverse = np.unique(samples, return_inverse=True)
+        # Later measurements into the same clbit overwrite earlier ones.
+        positions = {qubit: pos for pos, qubit in enumerate(measured_qubits)}
+        bit_map = {cmembit: positions[qubit] for qubit, cmembit in measure_params}
+        return self._sampled_data(values.tolist(), inverse, bit_map)
+
+    def _sampled_data(
+        self, values: list[int], inverse: np.ndarray, bit_map: dict[int, int]
+    ) -> dict[str, dict[str, int] | list[str]]:
+        """Build the result data of sampled measurement outcomes.
+
+        The classical memory value of each distinct outcome is computed once, with vectorized bit
+        operations, and the per-shot memory is only built if it was requested.
 
         Args:
-            qubit: index of the qubit measured.
-            cmembit: index of the classical memory bit to store outcome in.
+            values: The distinct sampled outcomes, as integers.
+            inverse: The index into ``values`` of the outcome of each shot.
+            bit_map: A mapping of each classical memory bit that is written to the position of the
+                bit in the outcomes that it takes.
+
+        Returns:
+            The result data, with the counts and, optionally, the memory in hex format.
         """
-        # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
-        # update classical state
-        membit = 1 << cmembit
-        self._classical_memory = (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
-
-        # update quantum state
-        if outcome == "0":
-            update_diag = [[1 / math.sqrt(probability), 0], [0, 0]]
-        else:
-            update_diag = [[0, 0], [0, 1 / math.sqrt(probability)]]
-        # update classical state
-        self._add_unitary(update_diag, [qubit])
+        # Values wider than an int64 fall back to Python integers.
+        wide = self._number_of_cmembits > 62 or (values and max(values) >= 1 << 62)
+        dtype = object if wide else np.int64
+        outcomes = np.array(values, dtype=dtype)
+        # Classical memory bits that no measurement writes to read as 0.
+        memory_values = np.zeros(len(values), dtype=dtype)
+        for cmembit, position in bit_map.items():
+            memory_values |= ((outcomes >> position) & 1) << cmembit
+        hex_values = [hex(value) for value in memory_values.tolist()]
+
+        counts = {}
+        for key, count in zip(hex_values, np.bincount(inverse, minlength=len(values)).tolist()):
+            counts[key] = counts.get(key, 0) + count
+        data = {"counts": counts}
+        if self._memory:
+            data["memory"] = np.array(hex_values, dtype=object)[inverse].tolist()
+        return data
 
-    def _add_reset(self, qubit: int) -> None:
-        """Apply a reset instruction to a qubit.
+    def _run_trajectories(self, plan: list[tuple], shots: int) -> Counter:
+        """Simulate all the shots of a compiled circuit that contains mid-circuit measurements or
+        resets, starting from the current statevector.
+
+        Rather than simulating the circuit once per shot, the shots are split between the two
+        outcomes of each measurement or reset, with a binomial draw using the outcome
+        probabilities.  Each outcome that receives shots becomes a branch that is simulated once
+        for all of its shots, so the statevector is only evolved once per distinct trajectory,
+        of which there are at most ``min(shots, 2**k)`` after ``k`` measurements and resets.
+        The branches are simulated depth first, so at most one statevector per pending branch is
+        held in memory.
 
         Args:
-            qubit: the qubit being reset
+            plan: the circuit steps, as returned by :meth:`_compile_circuit`.
+            shots: the number of shots to simulate.
 
-        This is done by simulating a measurement
-        outcome and projecting onto the outcome state while
-        renormalizing.
+        Returns:
+            A counter of the number of shots that ended with each classical memory value.
         """
-        # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
-        # update quantum state
-        if outcome == "0":
-            update = [[1 / math.sqrt(probability), 0], [0, 0]]
-            self._add_unitary(update, [qubit])
-        else:
-            update = [[0, 1 / math.sqrt(probability)], [0, 0]]
-            self._add_unitary(update, [qubit])
+        outcomes = Counter()
+        # Each pending branch is the index of its next step, its statevector, its classical
+        # memory, and its number of shots.
+        branches = [(0, self._statevector, 0, shots)]
+        while branches:
+            start, self._statevector, classical_memory, branch_shots = branches.pop()
+            for index in range(start, len(plan)):
+                step = plan[index]
+                kind = step[0]
+                if kind == "matrix":
+                    self._apply_matrix(step[1], step[2])
+                    continue
+                if kind == "diagonal":
+                    self._statevector *= step[1]
+                    continue
+                qubit = step[1]
+                probabilities = self._qubit_probabilities(qubit)
+                ones = self._local_rng.binomial(branch_shots, probabilities[1])
+                split = [
+                    (outcome, count)
+                    for outcome, count in ((0, branch_shots - ones), (1, ones))
+                    if count
+                ]
+                for outcome, count in split:
+                    state = self._collapse(qubit, outcome, probabilities[outcome], kind == "reset")
+                    memory = classical_memory
+                    if kind == "measure":
+                        membit = 1 << step[2]
+                        memory = (memory & ~membit) | (outcome << step[2])
+                    branches.append((index + 1, state, memory, count))
+                break
+            else:
+                outcomes[classical_memory] += branch_shots
+        return outcomes
+
+    def _qubit_probabilities(self, qubit: int) -> np.ndarray:
+        """Get the normalized probabilities of measuring a qubit as 0 and 1."""
+        # Axis for numpy.sum to compute probabilities
+        axis = list(range(self._number_of_qubits))
+        axis.remove(self._number_of_qubits - 1 - qubit)
+        probabilities = np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
+        return probabilities / np.sum(probabilities)
+
+    def _collapse(self, qubit: int, outcome: int, probability: float, reset: bool) -> np.ndarray:
+        """Get the renormalized statevector after measuring ``outcome`` on a qubit.
+
+        If ``reset`` is true, the qubit is then returned to the 0 state.
+        """
+        axis = self._number_of_qubits - 1 - qubit
+        out = np.zeros_like(self._statevector)
+        np.moveaxis(out, axis, 0)[0 if reset else outcome] = np.moveaxis(
+            self._statevector, axis, 0
+        )[outcome] / np.sqrt(probability)
+        return out
 
     def _validate_initial_statevector(self) -> None:
         """Validate an initial statevector"""
@@ -463,7 +590,9 @@ class BasicSimulator(BackendV2):
                 * "shots": int. Number of shots used in the simulation.
 
                 * "memory": bool. If True, the result will contain the results
-                  of every individual shot simulation.
+                  of every individual shot simulation.  If only the counts are needed,
+                  setting this to False avoids building the per-shot memory when the
+                  measurements can be sampled.
 
                 * "use_clifford_optimization": bool. If True, enables Clifford
                   circuit optimization using stabilizer formalism. Default: False.
@@ -552,7 +681,9 @@ class BasicSimulator(BackendV2):
                 measure_ops.append((qubit, clbit))
 
         # Sample measurements
-        memory = []
+        data = {"counts": {}}
+        if self._memory:
+            data["memory"] = []
         if measure_ops:
             # Create StabilizerState once
             stab_state = StabilizerState(clifford_obj, validate=False)
@@ -563,24 +694,12 @@ class BasicSimulator(BackendV2):
 
             # Sample ALL shots at once (much faster than per-shot loop!)
             samples = stab_state.sample_memory(self._shots)
-
-            # Process each sample
-            for sample in samples:
-                # Map measured qubits to classical bits
-                classical_memory = 0
-                for qubit, clbit in measure_ops:
-                    bit_val = int(sample[-(qubit + 1)])
-                    membit = 1 << clbit
-                    classical_memory = (classical_memory & (~membit)) | (bit_val << clbit)
-
-                # Convert to hex format
-                outcome = bin(classical_memory)[2:]
-                memory.append(hex(int(outcome, 2)))
-
-        # Build result data
-        data = {"counts": dict(Counter(memory))}
-        if self._memory:
-            data["memory"] = memory
+            bitstrings, inverse = np.unique(samples, return_inverse=True)
+            # Later measurements into the same clbit overwrite earlier ones.
+            bit_map = {clbit: qubit for qubit, clbit in measure_ops}
+            data = self._sampled_data(
+                [int(bitstring, 2) for bitstring in bitstrings.tolist()], inverse, bit_map
+            )
 
         end = time.time()
 
@@ -660,7 +779,6 @@ class BasicSimulator(BackendV2):
         self._number_of_qubits = circuit.num_qubits
         self._number_of_cmembits = circuit.num_clbits
         self._statevector = 0
-        self._classical_memory = 0
 
         # Validate the dimension of initial statevector if set
         self._validate_initial_statevector()
@@ -668,103 +786,41 @@ class BasicSimulator(BackendV2):
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(circuit)
 
-        # List of final counts for all shots
-        memory = []
-        # Check if we can sample measurements, if so we only perform 1 shot
+        plan, phase = self._compile_circuit(circuit)
+        self._initialize_statevector()
+        # apply global_phase
+        self._statevector *= phase
+        # Gates write into this buffer, which is then swapped with the statevector, so that
+        # no new statevector is allocated per gate.
+        self._scratch = np.empty_like(self._statevector)
+        # Check if we can sample measurements, if so we only simulate the circuit once
         # and sample all outcomes from the final state vector
         if self._sample_measure:
-            shots = 1
             # Store (qubit, cmembit) pairs for all measure ops in circuit to
             # be sampled
             measure_sample_ops = []
-        else:
-            shots = self._shots
-
-        for _ in range(shots):
-            self._initialize_statevector()
-            # apply global_phase
-            self._statevector *= np.exp(1j * circuit.global_phase)
-            # Initialize classical memory to all 0
-            self._classical_memory = 0
-
-            for operation in circuit.data:
-                if operation.name == "unitary":
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    gate = operation.operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in ("id", "u0", "delay"):
-                    pass
-                elif operation.name == "global_phase":
-                    params = getattr(operation, "params", None)
-                    gate = GlobalPhaseGate(*params).to_matrix()
-                    self._add_unitary(gate, [])
-                # Check if single qubit gate
-                elif operation.name in SINGLE_QUBIT_GATES:
-                    params = getattr(operation, "params", None)
-                    qubit = next(circuit.find_bit(bit).index for bit in operation.qubits)
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                elif operation.name in TWO_QUBIT_GATES_WITH_PARAMETERS:
-                    params = getattr(operation, "params", None)
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit0 = qubits[0]
-                    qubit1 = qubits[1]
-                    gate = TWO_QUBIT_GATES_WITH_PARAMETERS[operation.name](*params).to_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
-                elif operation.name in ("id", "u0"):
-                    pass
-                elif operation.name in TWO_QUBIT_GATES:
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit0 = qubits[0]
-                    qubit1 = qubits[1]
-                    gate = TWO_QUBIT_GATES[operation.name]
-                    self._add_unitary(gate, [qubit0, qubit1])
-                elif operation.name in THREE_QUBIT_GATES:
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit0 = qubits[0]
-                    qubit1 = qubits[1]
-                    qubit2 = qubits[2]
-                    gate = THREE_QUBIT_GATES[operation.name]
-                    self._add_unitary(gate, [qubit0, qubit1, qubit2])
-                # Check if reset
-                elif operation.name == "reset":
-                    qubits = [circuit.find_bit(bit).index for bit in operation.qubits]
-                    qubit = qubits[0]
-                    self._add_reset(qubit)
-                # Check if barrier
-                elif operation.name == "barrier":
-                    pass
-                # Check if measure
-                elif operation.name == "measure":
-                    qubit = next(circuit.find_bit(bit).index for bit in operation.qubits)
-                    cmembit = next(circuit.find_bit(bit).index for bit in operation.clbits)
-                    if self._sample_measure:
-                        # If sampling measurements record the qubit and cmembit
-                        # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
-                    else:
-                        # If not sampling perform measurement as normal
-                        self._add_measure(qubit, cmembit)
+            for step in plan:
+                if step[0] == "matrix":
+                    self._apply_matrix(step[1], step[2])
+                elif step[0] == "diagonal":
+                    self._statevector *= step[1]
                 else:
-                    backend = self.name
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicProviderError(err_msg.format(backend, operation.name))
-
-            # Add final creg data to memory list
+                    measure_sample_ops.append((step[1], step[2]))
+            data = self._add_sample_measure(measure_sample_ops, self._shots)
+        else:
+            outcomes = self._run_trajectories(plan, self._shots)
+            data = {"counts": {}}
             if self._number_of_cmembits > 0:
-                if self._sample_measure:
-                    # If sampling we generate all shot samples from the final statevector
-                    memory = self._add_sample_measure(measure_sample_ops, self._shots)
-                else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
-
-        # Add counts to result data
-        data = {"counts": dict(Counter(memory))}
-        # Optionally, add memory list to result data
-        if self._memory:
-            data["memory"] = memory
+                data["counts"] = {hex(value): count for value, count in outcomes.items()}
+            if self._memory:
+                memory = []
+                if self._number_of_cmembits > 0:
+                    for value, count in outcomes.items():
+                        memory.extend([hex(value)] * count)
+                    # The trajectories are grouped by outcome, so put the shots in a random order.
+                    memory = [memory[index] for index in self._local_rng.permutation(len(memory))]
+                data["memory"] = memory
+        self._scratch = None
         end = time.time()
 
         # Define header to be used by Result class to interpret counts
@@ -808,3 +864,19 @@ class BasicSimulator(BackendV2):
                     f"Number of qubits {circuit.num_qubits} is greater than maximum ({max_qubits}) "
                     f'for "{self.name}".'
                 )
+
+
+def _embed_matrix(matrix: np.ndarray, qubits: list[int], block: list[int]) -> np.ndarray:
+    """Extend a matrix on ``qubits`` to one on ``block``, a superset of them, with the identity on
+    the other qubits.  In both, the first qubit of the list is the least significant."""
+    if qubits == block:
+        return matrix
+    num_qubits = len(block)
+    order = list(qubits) + [qubit for qubit in block if qubit not in qubits]
+    full = np.kron(np.eye(2 ** (num_qubits - len(qubits)), dtype=complex), matrix)
+    axes = [num_qubits - 1 - order.index(qubit) for qubit in reversed(block)]
+    return (
+        full.reshape((2 * num_qubits) * [2])
+        .transpose(axes + [num_qubits + axis for axis in axes])
+        .reshape(2**num_qubits, 2**num_qubits)
+    )
@@ -101,6 +101,13 @@ API documentation
 .. autofunction:: dump
 .. autofunction:: get_qpy_version
 
+Files holding many circuits can also be read lazily, deserializing only the circuits that are
+accessed, with :func:`qiskit.qpy.open`:
+
+.. autofunction:: open
+.. autoclass:: QpyReader
+    :members: qpy_version, closed, close
+
 These functions will raise a custom subclass of :exc:`.QiskitError` if they encounter problems
 during serialization or deserialization.
 
@@ -2238,6 +2245,7 @@ References
 
 from .exceptions import QpyError, UnsupportedFeatureForVersion, QPYLoadingDeprecatedFeatureWarning
 from .interface import dump, load, get_qpy_version
+from .reader import QpyReader, open  # pylint: disable=redefined-builtin
 
 # For backward compatibility. Provide, Runtime, Experiment call these private functions.
 # ruff: disable[F401]
@@ -2258,8 +2266,10 @@ __all__ = [
     "QPY_VERSION",
     "QPYLoadingDeprecatedFeatureWarning",
     "QpyError",
+    "QpyReader",
     "UnsupportedFeatureForVersion",
     "dump",
     "get_qpy_version",
     "load",
+    "open",
 ]
@@ -0,0 +1,287 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Random-access reader for QPY files."""
+
+from __future__ import annotations
+
+import builtins
+import io
+import mmap
+import operator
+import os
+import struct
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from json import JSONDecoder
+from typing import TYPE_CHECKING, BinaryIO, overload
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.exceptions import QiskitError
+from qiskit.qpy import common, formats, type_keys
+from qiskit.qpy.interface import load
+from qiskit._accelerate import qpy as _qpy
+
+if TYPE_CHECKING:
+    from qiskit.circuit import annotation
+
+# The first QPY version whose files have a table of the byte offsets of each program.
+_QPY_CIRCUIT_TABLE_MIN_VERSION = 16
+
+
+class QpyReader(Sequence[QuantumCircuit]):
+    """A read-only sequence of the circuits in a QPY file, which are loaded on demand.
+
+    Create instances of this class with :func:`.qpy.open`.  The file header and table of circuit
+    offsets are read once when the reader is created.  After that, indexing the reader with an
+    integer or a slice deserializes only the requested circuits, so that a few circuits can be
+    retrieved from a large file without reading all the others.  Each access deserializes the
+    circuit again, and returns a new object.
+
+    Files written with QPY versions before 16 do not contain a table of circuit offsets, so the
+    position of a circuit cannot be known without reading every circuit before it.  For these
+    files, all the circuits are loaded the first time any of them is requested.
+
+    The reader should be closed when it is no longer needed, either with :meth:`close` or by
+    using it as a context manager.
+    """
+
+    def __init__(
+        self,
+        data: mmap.mmap | bytes,
+        metadata_deserializer: type[JSONDecoder] | None = None,
+        annotation_factories: Mapping[str, Callable[[], annotation.QPYSerializer]] | None = None,
+        *,
+        start: int = 0,
+        owned: BinaryIO | None = None,
+    ):
+        """
+        Args:
+            data: The content of the QPY file.
+            metadata_deserializer: As for :func:`.qpy.load`.
+            annotation_factories: As for :func:`.qpy.load`.
+            start: The position in ``data`` that the QPY file starts at.
+            owned: A file object that the reader is responsible for closing.
+        """
+        self._data = data
+        self._start = start
+        self._owned = owned
+        self._metadata_deserializer = metadata_deserializer
+        self._annotation_factories = annotation_factories
+        self._loaded: list[QuantumCircuit] | None = None
+
+        if len(data) - start < formats.FILE_HEADER_SIZE:
+            raise QiskitError("Input file is not a valid QPY file")
+        preface, version = struct.unpack("!6sB", data[start : start + 7])
+        if preface.decode(common.ENCODE, errors="replace") != "QISKIT":
+            raise QiskitError("Input file is not a valid QPY file")
+        if version > common.QPY_VERSION:
+            raise QiskitError(
+                f"The QPY format version being read, {version}, isn't supported by this Qiskit "
+                "version. Please upgrade your version of Qiskit to load this QPY payload"
+            )
+        self._qpy_version = version
+
+        if version < _QPY_CIRCUIT_TABLE_MIN_VERSION:
+            header = formats.FILE_HEADER._make(
+                struct.unpack(
+                    formats.FILE_HEADER_PACK, data[start : start + formats.FILE_HEADER_SIZE]
+                )
+            )
+            self._num_programs = header.num_programs
+            self._offsets = None
+            return
+
+        header_end = formats.FILE_HEADER_V10_SIZE + formats.TYPE_KEY_SIZE
+        if len(data) - start < header_end:
+            raise QiskitError("Input file is not a valid QPY file")
+        header = formats.FILE_HEADER_V10._make(
+            struct.unpack(
+                formats.FILE_HEADER_V10_PACK, data[start : start + formats.FILE_HEADER_V10_SIZE]
+            )
+        )
+        type_key = bytes(data[start + formats.FILE_HEADER_V10_SIZE : start + header_end])
+        if type_key == type_keys.Program.SCHEDULE_BLOCK:
+            raise QiskitError(
+                "Payloads of type `ScheduleBlock` cannot be loaded as of Qiskit 2.0. "
+                "Use an earlier version of Qiskit if you want to load `ScheduleBlock` payloads."
+            )
+        if type_key != type_keys.Program.CIRCUIT:
+            raise TypeError(f"Invalid payload format data kind '{type_key}'.")
+        table_end = start + header_end + header.num_programs * formats.CIRCUIT_TABLE_ENTRY_SIZE
+        if len(data) < table_end:
+            raise QiskitError("QPY file is truncated: the circuit table is incomplete")
+        offsets = struct.unpack(f"!{header.num_programs}Q", data[start + header_end : table_end])
+        # The offsets are positions in whatever stream the file was written to, and the first
+        # circuit always immediately follows the table, so shift them to be positions in `data`.
+        shift = table_end - offsets[0] if offsets else 0
+        self._num_programs = header.num_programs
+        self._offsets = [offset + shift for offset in offsets] + [len(data)]
+        # The header of a file holding only one of the circuits, which is placed straight after
+        # its single-entry circuit table.
+        self._single_header = (
+            struct.pack(formats.FILE_HEADER_V10_PACK, *header._replace(num_programs=1))
+            + type_key
+            + struct.pack(
+                formats.CIRCUIT_TABLE_ENTRY_PACK, header_end + formats.CIRCUIT_TABLE_ENTRY_SIZE
+            )
+        )
+
+    @property
+    def qpy_version(self) -> int:
+        """The QPY format version of the file."""
+        return self._qpy_version
+
+    @property
+    def closed(self) -> bool:
+        """Whether the reader has been closed."""
+        return self._data is None
+
+    def close(self) -> None:
+        """Release the file.  Circuits cannot be read after the reader is closed."""
+        if self._data is None:
+            return
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        if self._owned is not None:
+            self._owned.close()
+        self._data = None
+        self._owned = None
+        self._loaded = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self):
+        return self._num_programs
+
+    @overload
+    def __getitem__(self, index: int) -> QuantumCircuit: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[QuantumCircuit]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._read(i) for i in range(*index.indices(self._num_programs))]
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError(
+                f"QPY reader indices must be integers or slices, not {type(index).__name__}"
+            ) from None
+        if index < 0:
+            index += self._num_programs
+        if not 0 <= index < self._num_programs:
+            raise IndexError("QPY reader index out of range")
+        return self._read(index)
+
+    def __iter__(self) -> Iterator[QuantumCircuit]:
+        for index in range(self._num_programs):
+            yield self._read(index)
+
+    def __repr__(self):
+        state = "closed" if self.closed else f"num_circuits={self._num_programs}"
+        return f"<{type(self).__name__} qpy_version={self._qpy_version} {state}>"
+
+    def _read(self, index: int) -> QuantumCircuit:
+        if self._data is None:
+            raise ValueError("I/O operation on closed QPY reader")
+        if self._offsets is None:
+            if self._loaded is None:
+                self._loaded = load(
+                    io.BytesIO(self._data[self._start :]),
+                    metadata_deserializer=self._metadata_deserializer,
+                    annotation_factories=self._annotation_factories,
+                )
+            return self._loaded[index]
+        # Each circuit payload is self-contained, so it can be decoded by the Rust reader as the
+        # only program of a file, without touching the rest of this one.
+        payload = self._single_header + self._data[self._offsets[index] : self._offsets[index + 1]]
+        return _qpy.load(
+            io.BytesIO(payload),
+            self._metadata_deserializer,
+            self._qpy_version,
+            self._annotation_factories,
+        )[0]
+
+
+def open(  # pylint: disable=redefined-builtin
+    file: str | os.PathLike | BinaryIO,
+    metadata_deserializer: type[JSONDecoder] | None = None,
+    annotation_factories: Mapping[str, Callable[[], annotation.QPYSerializer]] | None = None,
+) -> QpyReader:
+    """Open a QPY file for random access to the circuits in it.
+
+    Unlike :func:`.load`, which deserializes every circuit in the file, this returns a
+    :class:`.QpyReader`, which deserializes circuits only when they are accessed.  The file is
+    memory mapped where possible, so only the parts of it that are used are read from disk.
+    For example:
+
+    .. code-block:: python
+
+        from qiskit import qpy
+
+        with qpy.open("transpiled.qpy") as circuits:
+            print(len(circuits))
+            first = circuits[0]
+            last_ten = circuits[-10:]
+
+    Args:
+        file: The path of the QPY file, or a binary file object containing the QPY data.  A file
+            object is not closed by the reader.  File objects that are not backed by a real file,
+            such as a :class:`gzip.GzipFile`, are read into memory.
+        metadata_deserializer: An optional JSONDecoder class that will be used to deserialize the
+            :attr:`.QuantumCircuit.metadata` of the circuits, as in :func:`.load`.
+        annotation_factories: Mapping of namespaces to functions that create new instances of
+            :class:`.annotation.QPYSerializer`, as in :func:`.load`.
+
+    Returns:
+        A sequence-like reader of the circuits in the file.
+
+    Raises:
+        QiskitError: if ``file`` is not a valid QPY file, or has a newer format version than this
+            Qiskit version supports.
+        TypeError: if the file does not contain circuits.
+    """
+    owned = None
+    if isinstance(file, (str, os.PathLike)):
+        file = owned = builtins.open(file, "rb")
+    try:
+        data, start = _map_file(file)
+        return QpyReader(
+            data, metadata_deserializer, annotation_factories, start=start, owned=owned
+        )
+    except BaseException:
+        if owned is not None:
+            owned.close()
+        raise
+
+
+def _map_file(file_obj: BinaryIO) -> tuple[mmap.mmap | bytes, int]:
+    """Memory map a file object if it is backed by a file, and otherwise read its contents.
+
+    Returns the data and the position in it of the current position of the file object.
+    """
+    try:
+        fileno = file_obj.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        fileno = None
+    if fileno is not None:
+        try:
+            return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ), file_obj.tell()
+        except (OSError, ValueError):
+            # For example, an empty file, or a pipe.
+            pass
+    return file_obj.read(), 0
@@ -26,6 +26,7 @@ Core classes
    Result
    ResultError
    Counts
+   ArrayCounts
 
 Marginalization
 ===============
@@ -33,6 +34,12 @@ Marginalization
 .. autofunction:: marginal_counts
 .. autofunction:: marginal_distribution
 .. autofunction:: marginal_memory
+.. autofunction:: marginal_arrays
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   MarginalArrays
 
 Distributions
 =============
@@ -52,22 +59,28 @@ Expectation values
 
 from . import distributions
 
+from .array_counts import ArrayCounts
 from .counts import Counts
 from .distributions import *
 from .exceptions import ResultError
 from .models import MeasLevel, MeasReturnType
 from .result import Result
 from .sampled_expval import sampled_expectation_value
+from .utils import MarginalArrays
+from .utils import marginal_arrays
 from .utils import marginal_counts
 from .utils import marginal_distribution
 from .utils import marginal_memory
 
 __all__ = [
+    "ArrayCounts",
     "Counts",
+    "MarginalArrays",
     "MeasLevel",
     "MeasReturnType",
     "Result",
     "ResultError",
+    "marginal_arrays",
     "marginal_counts",
     "marginal_distribution",
     "marginal_memory",
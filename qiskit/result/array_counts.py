@@ -0,0 +1,430 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""An array-backed container for counts."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.result import postprocess
+from qiskit.result.counts import Counts
+
+if TYPE_CHECKING:
+    from qiskit.primitives.containers import BitArray
+
+
+class ArrayCounts:
+    """Counts of measurement outcomes, stored as sorted arrays rather than a dictionary.
+
+    A :class:`.Counts` object is a dictionary keyed by formatted bitstrings, which for experiments
+    with many bits and many distinct outcomes costs a lot of memory and time to build.  This class
+    instead stores the distinct outcomes in ascending order in a NumPy array, alongside an array of
+    how many times each occurred.  Outcomes of up to 64 bits are stored as ``np.uint64``
+    integers; wider outcomes are stored as rows of big-endian packed bytes, in the same layout as
+    :class:`.BitArray`.
+
+    Merging, marginalization and lookups work directly on the arrays, and bitstrings are only
+    formatted when explicitly requested, for example by :meth:`to_counts` or
+    :meth:`most_frequent`.
+
+    .. code-block:: python
+
+        from qiskit.result import ArrayCounts
+
+        counts = result.get_array_counts(0)
+        total = counts.merge(result.get_array_counts(1))
+        marginal = total.marginalize([0, 3])
+        print(marginal.most_frequent(), marginal.to_counts())
+    """
+
+    __slots__ = ("_counts", "_creg_sizes", "_keys", "_num_bits")
+
+    def __init__(
+        self,
+        outcomes: Sequence[int] | np.ndarray,
+        counts: Sequence[int] | np.ndarray,
+        num_bits: int,
+        creg_sizes: Sequence[tuple[str, int]] | None = None,
+    ):
+        """
+        Args:
+            outcomes: The measured outcomes, as integers whose bit ``i`` is clbit ``i``, or as a
+                2D ``uint8`` array of rows of big-endian packed bytes.  The outcomes need not be
+                sorted or distinct.
+            counts: The number of times each of the ``outcomes`` was measured.
+            num_bits: The number of bits in each outcome.
+            creg_sizes: The names and sizes of the classical registers, which determine where
+                spaces are placed in formatted bitstrings.
+
+        Raises:
+            ValueError: if ``outcomes`` and ``counts`` have different lengths, or an outcome does
+                not fit in ``num_bits`` bits.
+        """
+        self._num_bits = int(num_bits)
+        if self._num_bits < 0:
+            raise ValueError(f"num_bits must be non-negative, not {num_bits}")
+        self._creg_sizes = None if creg_sizes is None else [list(creg) for creg in creg_sizes]
+        keys = self._coerce_keys(outcomes)
+        counts = np.asarray(counts, dtype=np.int64).reshape(-1)
+        if len(keys) != len(counts):
+            raise ValueError(
+                f"The number of outcomes ({len(keys)}) does not match the number of counts "
+                f"({len(counts)})."
+            )
+        self._keys, self._counts = _reduce(keys, counts)
+
+    @classmethod
+    def _from_sorted(cls, keys, counts, num_bits, creg_sizes) -> ArrayCounts:
+        """Construct directly from already sorted and distinct keys."""
+        out = cls.__new__(cls)
+        out._keys = keys
+        out._counts = counts
+        out._num_bits = num_bits
+        out._creg_sizes = creg_sizes
+        return out
+
+    @classmethod
+    def from_counts(
+        cls,
+        counts: Mapping[str | int, int],
+        num_bits: int | None = None,
+        creg_sizes: Sequence[tuple[str, int]] | None = None,
+    ) -> ArrayCounts:
+        """Build from a dictionary of counts.
+
+        Args:
+            counts: A :class:`.Counts` object, or a dictionary keyed by integers, hexadecimal
+                strings or bitstrings, in any of the forms accepted by :class:`.Counts`.
+            num_bits: The number of bits in each outcome.  Defaults to the ``memory_slots`` of a
+                :class:`.Counts` object, or else the length of the longest bitstring key or the
+                bit length of the largest outcome.
+            creg_sizes: The classical register sizes.  Defaults to those of a :class:`.Counts`.
+
+        Returns:
+            The array-backed counts.
+
+        Raises:
+            QiskitError: if a key is not a binary outcome.
+        """
+        width = 0
+        if isinstance(counts, Counts):
+            num_bits = counts.memory_slots if num_bits is None else num_bits
+            creg_sizes = counts.creg_sizes if creg_sizes is None else creg_sizes
+            outcomes = counts.int_outcomes()
+            # The keys of a `Counts` are always formatted bitstrings.
+            width = max((len(key.replace(" ", "")) for key in counts), default=0)
+        else:
+            outcomes = {}
+            for key, value in counts.items():
+                if isinstance(key, str) and not key.startswith(("0x", "0b")):
+                    bits = key.replace(" ", "").replace("_", "")
+                    if not Counts.bitstring_regex.search(bits):
+                        raise QiskitError(f"'{key}' is not a binary outcome")
+                    width = max(width, len(bits))
+                    key = int(bits, 2)
+                elif isinstance(key, str):
+                    key = int(key, 0)
+                outcomes[key] = outcomes.get(key, 0) + value
+        if num_bits is None:
+            num_bits = max(width, max(outcomes, default=0).bit_length())
+        values = list(outcomes)
+        if num_bits <= 64:
+            keys = np.array(values, dtype=np.uint64)
+        else:
+            keys = _ints_to_rows(values, num_bits)
+        return cls(keys, list(outcomes.values()), num_bits, creg_sizes)
+
+    @classmethod
+    def from_bit_array(
+        cls, bit_array: BitArray, loc: int | tuple[int, ...] | None = None
+    ) -> ArrayCounts:
+        """Build from the shots of a :class:`.BitArray`.
+
+        Args:
+            bit_array: The bit array to count the shots of.
+            loc: Which entry of the bit array to count.  If ``None``, the shots of every entry are
+                counted together.
+
+        Returns:
+            The array-backed counts.
+        """
+        array = bit_array.array if loc is None else bit_array.array[loc]
+        rows = array.reshape(-1, array.shape[-1])
+        return cls(rows, np.ones(len(rows), dtype=np.int64), bit_array.num_bits)
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        """The distinct outcomes, in ascending order.
+
+        This is a 1D ``uint64`` array if :attr:`num_bits` is at most 64, and otherwise a 2D
+        ``uint8`` array of rows of big-endian packed bytes.
+        """
+        if self._num_bits <= 64:
+            return self._keys
+        return _void_to_rows(self._keys)
+
+    @property
+    def counts(self) -> np.ndarray:
+        """The number of times each of the :attr:`outcomes` was measured."""
+        return self._counts
+
+    @property
+    def num_bits(self) -> int:
+        """The number of bits in each outcome."""
+        return self._num_bits
+
+    @property
+    def creg_sizes(self) -> list[list] | None:
+        """The names and sizes of the classical registers, if known."""
+        return self._creg_sizes
+
+    def shots(self) -> int:
+        """Return the number of shots."""
+        return int(self._counts.sum())
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} num_outcomes={len(self)}, num_bits={self._num_bits}, "
+            f"shots={self.shots()}>"
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, ArrayCounts):
+            return NotImplemented
+        return (
+            self._num_bits == other._num_bits
+            and np.array_equal(self._keys, other._keys)
+            and np.array_equal(self._counts, other._counts)
+        )
+
+    def __getitem__(self, outcome: int | str) -> int:
+        """Get the number of times an outcome was measured, which may be zero.
+
+        The outcome may be an integer, a hexadecimal string or a (possibly formatted) bitstring.
+        """
+        key = self._coerce_keys([_outcome_to_int(outcome)])[0]
+        index = np.searchsorted(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return int(self._counts[index])
+        return 0
+
+    def merge(self, other: ArrayCounts) -> ArrayCounts:
+        """Combine the counts of two experiments with the same bits.
+
+        Since both sets of outcomes are already sorted, this takes linear time.
+
+        Args:
+            other: The counts to add to these.
+
+        Returns:
+            The combined counts.
+
+        Raises:
+            ValueError: if the two have different numbers of bits.
+        """
+        if other._num_bits != self._num_bits:
+            raise ValueError(
+                f"Cannot merge counts of {self._num_bits} bits with counts of "
+                f"{other._num_bits} bits."
+            )
+        keys = np.concatenate([self._keys, other._keys])
+        counts = np.concatenate([self._counts, other._counts])
+        # A stable sort of two concatenated sorted runs is a linear-time merge.
+        order = np.argsort(keys, kind="stable")
+        keys, counts = _reduce_sorted(keys[order], counts[order])
+        return self._from_sorted(keys, counts, self._num_bits, self._creg_sizes)
+
+    __add__ = merge
+
+    def marginalize(self, indices: Sequence[int]) -> ArrayCounts:
+        """Marginalize over some bits of interest.
+
+        As for :func:`.marginal_counts`, bit ``i`` of each marginal outcome is the ``i``-th
+        smallest of the ``indices``.  The register sizes are adjusted to the remaining bits.
+
+        Args:
+            indices: The bit positions to keep.
+
+        Returns:
+            The marginalized counts.
+
+        Raises:
+            QiskitError: if the indices are out of range.
+        """
+        from qiskit.result.utils import _adjust_creg_sizes, _gather_bits
+
+        indices = sorted(int(index) for index in indices)
+        if not indices or indices[0] < 0 or indices[-1] >= self._num_bits:
+            raise QiskitError(f"indices must be in range [0, {self._num_bits - 1}].")
+        creg_sizes = (
+            None if self._creg_sizes is None else _adjust_creg_sizes(self._creg_sizes, indices)
+        )
+        num_bits = len(indices)
+        if self._num_bits <= 64:
+            keys = _gather_bits(self._keys, indices)
+        else:
+            rows = _void_to_rows(self._keys)
+            width = 8 * rows.shape[1]
+            bits = np.unpackbits(rows, axis=1)[:, [width - 1 - index for index in indices[::-1]]]
+            packed = np.packbits(np.pad(bits, ((0, 0), ((-num_bits) % 8, 0))), axis=1)
+            keys = _rows_to_uint64(packed) if num_bits <= 64 else _rows_to_void(packed)
+        keys, counts = _reduce(keys, self._counts)
+        return self._from_sorted(keys, counts, num_bits, creg_sizes)
+
+    def most_frequent(self) -> str:
+        """Return the most frequent outcome, as a formatted bitstring.
+
+        Raises:
+            QiskitError: when there is more than one outcome with the maximum count, or the
+                object is empty.
+        """
+        if not len(self):
+            raise QiskitError("Can not return a most frequent count on an empty object")
+        maximum = self._counts.max()
+        (indices,) = np.nonzero(self._counts == maximum)
+        if len(indices) != 1:
+            raise QiskitError(
+                "Multiple values have the same maximum counts: "
+                f"{','.join(self._format(index) for index in indices)}."
+            )
+        return self._format(indices[0])
+
+    def int_outcomes(self) -> dict[int, int]:
+        """Return a counts dictionary with integer keys."""
+        return dict(zip(self._int_keys(), self._counts.tolist()))
+
+    def hex_outcomes(self) -> dict[str, int]:
+        """Return a counts dictionary with hexadecimal string keys."""
+        return dict(zip(map(hex, self._int_keys()), self._counts.tolist()))
+
+    def to_counts(self) -> Counts:
+        """Convert to a :class:`.Counts` object, formatting every outcome as a bitstring."""
+        return Counts(self.hex_outcomes(), creg_sizes=self._creg_sizes, memory_slots=self._num_bits)
+
+    def to_bit_array(self) -> BitArray:
+        """Convert to a :class:`.BitArray` of shape ``()``, with one row per shot.
+
+        The shots are in ascending order of outcome.
+        """
+        from qiskit.primitives.containers import BitArray
+
+        num_bytes = (self._num_bits + 7) // 8
+        if self._num_bits <= 64:
+            rows = _uint64_to_rows(self._keys, num_bytes)
+        else:
+            rows = _void_to_rows(self._keys)
+        return BitArray(np.repeat(rows, self._counts, axis=0), self._num_bits)
+
+    def _coerce_keys(self, outcomes) -> np.ndarray:
+        """Convert outcomes to the internal key array: ``uint64`` integers, or a ``void`` view of
+        packed big-endian rows, which sorts in the same order as the integers."""
+        num_bytes = (self._num_bits + 7) // 8
+        if isinstance(outcomes, np.ndarray) and outcomes.ndim == 2:
+            if outcomes.shape[1] != num_bytes:
+                raise ValueError(
+                    f"Expected rows of {num_bytes} bytes for {self._num_bits} bits, "
+                    f"not {outcomes.shape[1]}."
+                )
+            rows = np.asarray(outcomes, dtype=np.uint8)
+            if num_bytes and self._num_bits % 8 and np.any(rows[:, 0] >> (self._num_bits % 8)):
+                raise ValueError(f"An outcome does not fit in {self._num_bits} bits.")
+            return _rows_to_uint64(rows) if self._num_bits <= 64 else _rows_to_void(rows)
+        if self._num_bits > 64:
+            if isinstance(outcomes, np.ndarray) and outcomes.dtype.kind == "V":
+                return outcomes
+            return _rows_to_void(_ints_to_rows([int(value) for value in outcomes], self._num_bits))
+        if not isinstance(outcomes, np.ndarray):
+            # Converting each integer individually avoids NumPy inferring a lossy float dtype for
+            # a list containing values of 2**63 or more.
+            outcomes = np.array([int(value) for value in outcomes], dtype=object)
+        keys = outcomes
+        if keys.dtype == object or keys.dtype.kind not in "ui":
+            if any(int(value) < 0 for value in keys.reshape(-1)):
+                raise ValueError("Outcomes must be non-negative.")
+            keys = np.array([int(value) for value in keys.reshape(-1)], dtype=np.uint64)
+        elif keys.dtype.kind == "i" and np.any(keys < 0):
+            raise ValueError("Outcomes must be non-negative.")
+        keys = keys.astype(np.uint64, copy=False).reshape(-1)
+        if self._num_bits < 64 and np.any(keys >> np.uint64(self._num_bits)):
+            raise ValueError(f"An outcome does not fit in {self._num_bits} bits.")
+        return keys
+
+    def _int_keys(self) -> list[int]:
+        if self._num_bits <= 64:
+            return self._keys.tolist()
+        return [int.from_bytes(key.tobytes(), "big") for key in self._keys]
+
+    def _format(self, index: int) -> str:
+        value = self._int_keys()[index] if self._num_bits > 64 else int(self._keys[index])
+        bitstring = format(value, f"0{self._num_bits}b")
+        if self._creg_sizes:
+            bitstring = postprocess._separate_bitstring(bitstring, self._creg_sizes)
+        return bitstring
+
+
+def _reduce(keys: np.ndarray, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sort keys and sum the counts of duplicates."""
+    order = np.argsort(keys, kind="stable")
+    return _reduce_sorted(keys[order], counts[order])
+
+
+def _reduce_sorted(keys: np.ndarray, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Sum the counts of runs of equal keys in a sorted key array."""
+    if len(keys) == 0:
+        return keys, counts
+    starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+    if len(starts) == len(keys):
+        return keys, counts
+    return keys[starts], np.add.reduceat(counts, starts)
+
+
+def _outcome_to_int(outcome: int | str) -> int:
+    if isinstance(outcome, str):
+        if outcome.startswith(("0x", "0b")):
+            return int(outcome, 0)
+        return int(outcome.replace(" ", "").replace("_", ""), 2)
+    return int(outcome)
+
+
+def _rows_to_uint64(rows: np.ndarray) -> np.ndarray:
+    padded = np.zeros((len(rows), 8), dtype=np.uint8)
+    padded[:, 8 - rows.shape[1] :] = rows
+    return padded.view(">u8")[:, 0].astype(np.uint64)
+
+
+def _uint64_to_rows(keys: np.ndarray, num_bytes: int) -> np.ndarray:
+    return keys.astype(">u8").view(np.uint8).reshape(-1, 8)[:, 8 - num_bytes :]
+
+
+def _rows_to_void(rows: np.ndarray) -> np.ndarray:
+    rows = np.ascontiguousarray(rows, dtype=np.uint8)
+    return rows.view(np.dtype((np.void, rows.shape[1])))[:, 0]
+
+
+def _void_to_rows(keys: np.ndarray) -> np.ndarray:
+    return np.frombuffer(keys.tobytes(), dtype=np.uint8).reshape(len(keys), keys.dtype.itemsize)
+
+
+def _ints_to_rows(values: list[int], num_bits: int) -> np.ndarray:
+    num_bytes = (num_bits + 7) // 8
+    if any(value < 0 or value.bit_length() > num_bits for value in values):
+        raise ValueError(f"An outcome does not fit in {num_bits} bits.")
+    data = b"".join(value.to_bytes(num_bytes, "big") for value in values)
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(values), num_bytes)
@@ -229,6 +229,49 @@ class Result:
                 "or a measurement level 0/1 job."
             ) from ex
 
+    def get_array_counts(self, experiment=None):
+        """Get the histogram data of an experiment as an :class:`.ArrayCounts`.
+
+        Unlike :meth:`get_counts`, this does not format a bitstring for every outcome, so it is
+        much cheaper for experiments with many bits and many distinct outcomes.
+
+        Args:
+            experiment (str or QuantumCircuit or int or None): the index of the
+                experiment, as specified by ``data([experiment])``.
+
+        Returns:
+            ArrayCounts or list[ArrayCounts]: the counts of the experiment, or a list of the counts
+            of every experiment if ``experiment`` is ``None`` and there is more than one.
+
+        Raises:
+            QiskitError: if there are no counts for the experiment.
+        """
+        from qiskit.result.array_counts import ArrayCounts
+
+        if experiment is None:
+            exp_keys = range(len(self.results))
+        else:
+            exp_keys = [experiment]
+
+        counts_list = []
+        for key in exp_keys:
+            exp = self._get_experiment(key)
+            counts = self.data(key).get("counts")
+            if counts is None:
+                raise QiskitError(f'No counts for experiment "{key!r}"')
+            header = getattr(exp, "header", None) or {}
+            counts_list.append(
+                ArrayCounts.from_counts(
+                    counts,
+                    num_bits=header.get("memory_slots"),
+                    creg_sizes=header.get("creg_sizes"),
+                )
+            )
+
+        if len(counts_list) == 1:
+            return counts_list[0]
+        return counts_list
+
     def get_counts(self, experiment=None):
         """Get the histogram data of an experiment.
 
@@ -13,10 +13,13 @@
 
 """Utility functions for working with Results."""
 
+from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from typing import TYPE_CHECKING, NamedTuple
 
 import numpy as np
 
@@ -25,10 +28,12 @@ from qiskit.result.result import Result
 from qiskit.result.counts import Counts
 from qiskit.result.distributions.probability import ProbDistribution
 from qiskit.result.distributions.quasi import QuasiDistribution
-from qiskit.result.postprocess import _bin_to_hex
 
 from qiskit._accelerate import results as results_rs
 
+if TYPE_CHECKING:
+    from qiskit.primitives.containers import BitArray
+
 
 def marginal_counts(
     result: dict | Result,
@@ -65,19 +70,25 @@ def marginal_counts(
     if isinstance(result, Result):
         if not inplace:
             result = deepcopy(result)
+        # The experiments of a result typically share their registers, so each distinct register
+        # layout only needs adjusting once.
+        creg_sizes_cache = {}
         for i, experiment_result in enumerate(result.results):
-            counts = result.get_counts(i)
-            new_counts = _marginalize(counts, indices)
-            new_counts_hex = {}
-            for k, v in new_counts.items():
-                new_counts_hex[_bin_to_hex(k)] = v
-            experiment_result.data.counts = new_counts_hex
+            marginal = _marginal_experiment(experiment_result, i, indices)
+            experiment_result.data.counts = dict(
+                zip(map(hex, marginal.outcomes.tolist()), marginal.counts.tolist())
+            )
 
             if indices is not None:
                 experiment_result.header["memory_slots"] = len(indices)
                 csize = experiment_result.header.get("creg_sizes", None)
                 if csize is not None:
-                    experiment_result.header["creg_sizes"] = _adjust_creg_sizes(csize, indices)
+                    key = tuple((name, size) for name, size in csize)
+                    if key not in creg_sizes_cache:
+                        creg_sizes_cache[key] = _adjust_creg_sizes(csize, indices)
+                    experiment_result.header["creg_sizes"] = [
+                        list(creg) for creg in creg_sizes_cache[key]
+                    ]
 
             if getattr(experiment_result.data, "memory", None) is not None and indices is not None:
                 if marginalize_memory is False:
@@ -99,6 +110,207 @@ def marginal_counts(
         return marg_counts
 
 
+class MarginalArrays(NamedTuple):
+    """The marginalized outcomes of one experiment, as arrays of integers.
+
+    Bit ``i`` of each outcome is the value of the ``i``-th smallest of the marginalized indices,
+    which is the same convention as the bitstrings returned by :func:`marginal_counts`.  The
+    arrays have ``dtype=np.uint64`` if the experiment has at most 64 bits, and otherwise are
+    object arrays of Python integers.
+    """
+
+    outcomes: np.ndarray
+    """The distinct marginal outcomes, in ascending order."""
+    counts: np.ndarray
+    """The number of shots that gave each of the :attr:`outcomes`."""
+    memory: np.ndarray | None
+    """The marginal outcome of each shot, if it was requested and is available."""
+    num_bits: int
+    """The number of bits in each marginal outcome."""
+
+
+def marginal_arrays(
+    result: Result | BitArray,
+    indices: Sequence[int] | Sequence[Sequence[int] | None] | None = None,
+    *,
+    memory: bool = False,
+    max_workers: int | None = 1,
+) -> list[MarginalArrays]:
+    """Marginalize the counts and memory of every experiment in a result at once.
+
+    Unlike :func:`marginal_counts`, the outcomes are returned as arrays of integers rather than
+    dictionaries of bitstrings, so no bitstrings are formatted or parsed except to read the
+    hexadecimal keys of a :class:`.Result`.
+
+    Args:
+        result: The data to marginalize.  Each experiment of a :class:`.Result` gives one output.
+            For a :class:`.BitArray`, each index of its :attr:`~.BitArray.shape` gives one output,
+            in C order.
+        indices: The bit positions to marginalize over.  Either a single list of positions for
+            every experiment, or a sequence with one list (or ``None``) per experiment.  If
+            ``None`` (default), do not marginalize at all.
+        memory: Whether to also return the marginal outcome of each shot.  This is only
+            available for :class:`.Result` experiments that contain level 2 memory, and for
+            :class:`.BitArray` data.
+        max_workers: The number of threads to marginalize experiments in.  If ``None``, use the
+            default of :class:`~concurrent.futures.ThreadPoolExecutor`.
+
+    Returns:
+        The marginalized outcomes and their counts, one per experiment.
+
+    Raises:
+        TypeError: if ``result`` is not a :class:`.Result` or :class:`.BitArray`.
+        QiskitError: if an experiment has no counts, or the indices are invalid.
+        ValueError: if the number of lists of indices does not match the number of experiments.
+    """
+    from qiskit.primitives.containers import BitArray
+
+    if isinstance(result, BitArray):
+        experiments = list(np.ndindex(result.shape))
+    elif isinstance(result, Result):
+        experiments = list(range(len(result.results)))
+    else:
+        raise TypeError(f"Cannot marginalize an object of type {type(result).__name__}")
+
+    if indices is None or all(isinstance(index, (int, np.integer)) for index in indices):
+        indices = [indices] * len(experiments)
+    elif len(indices) != len(experiments):
+        raise ValueError(
+            f"Received {len(indices)} lists of indices for {len(experiments)} experiments."
+        )
+
+    if isinstance(result, BitArray):
+        values = _bit_array_values(result.array, result.num_bits)
+        weights = np.ones(result.num_shots, dtype=np.int64)
+
+        def marginalize(item):
+            location, experiment_indices = item
+            return _marginal_values(
+                values[location], weights, result.num_bits, experiment_indices, memory=memory
+            )
+
+    else:
+
+        def marginalize(item):
+            i, experiment_indices = item
+            experiment_result = result.results[i]
+            marginal = _marginal_experiment(experiment_result, i, experiment_indices)
+            shots_memory = getattr(experiment_result.data, "memory", None)
+            if (
+                memory
+                and isinstance(shots_memory, list)
+                and (not shots_memory or isinstance(shots_memory[0], str))
+            ):
+                if experiment_indices is not None:
+                    # The indices were validated with the counts.
+                    experiment_indices = sorted(map(int, experiment_indices))
+                marginal = marginal._replace(
+                    memory=np.array(
+                        results_rs.marginal_memory(
+                            shots_memory, experiment_indices, return_int=True
+                        ),
+                        dtype=_values_dtype(marginal.num_bits),
+                    )
+                )
+            return marginal
+
+    return _map_threads(marginalize, list(zip(experiments, indices)), max_workers)
+
+
+def _map_threads(function: Callable, items: list, max_workers: int | None) -> list:
+    if max_workers == 1 or len(items) < 2:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(function, items))
+
+
+def _marginal_experiment(experiment_result, key, indices) -> MarginalArrays:
+    """Marginalize the counts of one experiment of a :class:`.Result`."""
+    counts = getattr(experiment_result.data, "counts", None)
+    if counts is None:
+        raise QiskitError(f'No counts for experiment "{key!r}"')
+    outcomes = [_outcome_to_int(outcome) for outcome in counts]
+    header = experiment_result.header or {}
+    num_bits = header.get("memory_slots")
+    if num_bits is None:
+        num_bits = max((outcome.bit_length() for outcome in outcomes), default=0) or 1
+    values = np.array(outcomes, dtype=_values_dtype(num_bits))
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+    return _marginal_values(values, weights, num_bits, indices)
+
+
+def _marginal_values(
+    values: np.ndarray,
+    weights: np.ndarray,
+    num_bits: int,
+    indices: Sequence[int] | None,
+    memory: bool = False,
+) -> MarginalArrays:
+    """Marginalize integer outcomes that each occurred ``weights`` times.
+
+    If ``memory`` is true, each value is taken to be one shot, and the marginal values are
+    returned as the memory.
+    """
+    indices = _sorted_indices(indices, num_bits)
+    if indices is not None:
+        values = _gather_bits(values, indices)
+        num_bits = len(indices)
+    outcomes, inverse = np.unique(values, return_inverse=True)
+    counts = np.zeros(len(outcomes), dtype=np.int64)
+    np.add.at(counts, inverse.ravel(), weights)
+    return MarginalArrays(outcomes, counts, values if memory else None, num_bits)
+
+
+def _sorted_indices(indices: Sequence[int] | None, num_bits: int) -> list[int] | None:
+    """Validate marginalization indices, and sort them.  Returns ``None`` if there is nothing
+    to marginalize."""
+    if indices is None:
+        return None
+    indices = sorted(int(index) for index in indices)
+    if indices == list(range(num_bits)):
+        return None
+    if not indices or indices[0] < 0 or indices[-1] >= num_bits:
+        raise QiskitError(f"indices must be in range [0, {num_bits - 1}].")
+    return indices
+
+
+def _gather_bits(values: np.ndarray, indices: list[int]) -> np.ndarray:
+    """Gather the bits of integers at sorted ``indices`` into the low bits of new integers."""
+    out = np.zeros_like(values)
+    position = 0
+    start = 0
+    # Runs of consecutive indices are moved with a single shift and mask.
+    for end in range(1, len(indices) + 1):
+        if end == len(indices) or indices[end] != indices[end - 1] + 1:
+            length = end - start
+            out |= ((values >> indices[start]) & ((1 << length) - 1)) << position
+            position += length
+            start = end
+    return out
+
+
+def _values_dtype(num_bits: int):
+    return np.uint64 if num_bits <= 64 else object
+
+
+def _outcome_to_int(outcome: str) -> int:
+    if outcome.startswith("0x"):
+        return int(outcome, 16)
+    return int(_remove_space_underscore(outcome), 2)
+
+
+def _bit_array_values(array: np.ndarray, num_bits: int) -> np.ndarray:
+    """Convert the packed big-endian bytes of a :class:`.BitArray` to integers."""
+    if num_bits <= 64:
+        padded = np.zeros(array.shape[:-1] + (8,), dtype=np.uint8)
+        padded[..., 8 - array.shape[-1] :] = array
+        return padded.view(">u8")[..., 0].astype(np.uint64)
+    rows = array.reshape(-1, array.shape[-1])
+    values = np.empty(len(rows), dtype=object)
+    values[:] = [int.from_bytes(row.tobytes(), "big") for row in rows]
+    return values.reshape(array.shape[:-1])
+
+
 def _adjust_creg_sizes(creg_sizes, indices):
     """Helper to reduce creg_sizes to match indices"""
 
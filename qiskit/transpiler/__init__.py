@@ -1499,6 +1499,8 @@ Pass Manager Definition
    generate_preset_pass_manager
    generate_preset_clifford_t_pass_manager
    generate_preset_pbc_pass_manager
+   TranspileCache
+   CompiledTemplate
 
 Layout and Topology
 -------------------
@@ -1583,12 +1585,15 @@ from .preset_passmanagers import (
 from .target import Target
 from .target import InstructionProperties
 from .optimization_metric import OptimizationMetric
+from .transpile_cache import TranspileCache
+from .compiled_template import CompiledTemplate
 
 from . import passes, preset_passmanagers
 
 __all__ = [
     "AnalysisPass",
     "CircuitTooWideForTarget",
+    "CompiledTemplate",
     "ConditionalController",
     "CouplingError",
     "CouplingMap",
@@ -1607,6 +1612,7 @@ __all__ = [
     "StagedPassManager",
     "Target",
     "TransformationPass",
+    "TranspileCache",
     "TranspileLayout",
     "TranspilerAccessError",
     "TranspilerError",
@@ -0,0 +1,335 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Transpile-once, bind-many templates of parametrized circuits."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from qiskit.circuit import Parameter, ParameterExpression, QuantumCircuit
+from qiskit.circuit._utils import _batched_parameter_values, _batched_standard_gate_matrices
+from qiskit.circuit.quantumcircuitdata import CircuitInstruction
+from qiskit.dagcircuit import DAGOpNode
+from .passes.optimization.optimize_1q_decomposition import Optimize1qGatesDecomposition
+from .target import Target
+
+if TYPE_CHECKING:
+    from qiskit.primitives.containers.bindings_array import BindingsArrayLike
+
+
+class CompiledTemplate:
+    """A transpiled parametrized circuit that can be efficiently bound to many parameter values.
+
+    Variational workloads typically transpile a single parametrized circuit and then bind it to
+    many different sets of parameter values.  Transpiler passes cannot simplify across symbolic
+    angles, so a run of single-qubit gates such as ``rz(θ) sx rz(π/2) sx rz(φ)`` is left as is in
+    the transpiled circuit, even though after binding it might collapse to a shorter sequence.
+    Re-transpiling every bound circuit recovers this, but repeats all the expensive layout,
+    routing and two-qubit optimization work for each binding.
+
+    This class fixes the output of a single transpilation as a template.  At construction, it finds
+    each maximal run of single-qubit gates that contains a parametrized gate.  When parameters are
+    bound with :meth:`bind_all` or :meth:`assign_parameters`, the unitaries of these runs are
+    computed for all the bindings at once using vectorized matrix arithmetic, and each is then
+    resynthesized into the target's native single-qubit basis, in the same way as the
+    :class:`.Optimize1qGatesDecomposition` pass.  Everything else in the circuit, including the
+    :attr:`~.QuantumCircuit.layout`, is taken from the template unchanged.
+
+    .. code-block:: python
+
+        from qiskit.transpiler import CompiledTemplate
+
+        template = CompiledTemplate.from_circuit(ansatz, backend, optimization_level=3)
+        bound_circuits = template.bind_all(bindings_array)
+
+    Only the top-level instructions of the circuit are considered for resynthesis; parameters
+    inside control-flow blocks are bound without further optimization.
+    """
+
+    def __init__(
+        self,
+        circuit: QuantumCircuit,
+        target: Target | None = None,
+        *,
+        basis_gates: Sequence[str] | None = None,
+    ):
+        """
+        Args:
+            circuit: A parametrized circuit that has already been transpiled for ``target``.
+            target: The target the circuit was transpiled for.  This determines the single-qubit
+                bases that bound runs are resynthesized into.
+            basis_gates: The basis gates the circuit was transpiled for, if ``target`` is not
+                given.  If neither is given, the runs are resynthesized into whatever Euler basis
+                gives the shortest sequence.
+        """
+        self._circuit = circuit
+        self._parameters = list(circuit.parameters)
+        self._synthesizer = Optimize1qGatesDecomposition(basis=basis_gates, target=target)
+        # Each run is a list of indices into the circuit data, in order, that act on the same qubit.
+        self._runs: list[list[int]] = []
+        self._run_qubits: list[int] = []
+        self._run_starts: dict[int, int] = {}
+
+        open_runs: dict[Any, list[int]] = {}
+        runs: list[tuple[Any, list[int]]] = []
+        for index, instruction in enumerate(circuit.data):
+            if _is_run_candidate(instruction):
+                qubit = instruction.qubits[0]
+                if (run := open_runs.get(qubit)) is None:
+                    run = open_runs[qubit] = []
+                    runs.append((qubit, run))
+                run.append(index)
+            else:
+                for qubit in instruction.qubits:
+                    open_runs.pop(qubit, None)
+        # The error of a run only depends on the names of its gates, so the error of each original
+        # run, which a resynthesis has to improve on to replace it, is the same for every binding.
+        self._run_errors: list[tuple[list[DAGOpNode], Any]] = []
+        data = circuit.data
+        for qubit, run in runs:
+            if any(data[index].is_parameterized() for index in run):
+                self._run_starts[run[0]] = len(self._runs)
+                self._runs.append(run)
+                self._run_qubits.append(qubit_index := circuit.find_bit(qubit).index)
+                nodes = [DAGOpNode(data[index].operation, (qubit,)) for index in run]
+                self._run_errors.append((nodes, self._synthesizer._error(nodes, qubit_index)))
+
+        # The parametrized instructions, which are bound while each output circuit is built.
+        # Standard gates have their parameters evaluated for all bindings at once.  Anything
+        # else is bound through a circuit that contains only that instruction, so that binding
+        # never copies the whole template.
+        column = {param: index for index, param in enumerate(self._parameters)}
+        self._standard_parametrized: list[int] = []
+        self._other_parametrized: dict[int, tuple[QuantumCircuit, list[tuple[Parameter, int]]]] = {}
+        for index, instruction in enumerate(data):
+            if not instruction.is_parameterized():
+                continue
+            if instruction.is_standard_gate():
+                self._standard_parametrized.append(index)
+            else:
+                single = circuit.copy_empty_like()
+                single.global_phase = 0.0
+                single._append(instruction)
+                self._other_parametrized[index] = (
+                    single,
+                    [(param, column[param]) for param in single.parameters],
+                )
+
+    @classmethod
+    def from_circuit(cls, circuit: QuantumCircuit, backend=None, **transpile_options):
+        """Transpile a parametrized circuit, and build a template from the output.
+
+        Args:
+            circuit: The parametrized circuit to transpile.
+            backend: The backend (or :class:`.Target`) to transpile for, as in :func:`.transpile`.
+            transpile_options: Further keyword arguments to :func:`.transpile`.
+
+        Returns:
+            CompiledTemplate: The template of the transpiled circuit.
+        """
+        from qiskit.compiler import transpile
+
+        target = transpile_options.get("target")
+        if target is None:
+            target = backend if isinstance(backend, Target) else getattr(backend, "target", None)
+        transpiled = transpile(circuit, backend, **transpile_options)
+        return cls(transpiled, target, basis_gates=transpile_options.get("basis_gates"))
+
+    @property
+    def circuit(self) -> QuantumCircuit:
+        """The transpiled parametrized circuit."""
+        return self._circuit
+
+    @property
+    def parameters(self) -> list[Parameter]:
+        """The parameters of the template, in the order used by :meth:`assign_parameters`."""
+        return list(self._parameters)
+
+    @property
+    def num_resynthesized_runs(self) -> int:
+        """The number of parametrized single-qubit runs that are resynthesized on binding."""
+        return len(self._runs)
+
+    def assign_parameters(
+        self, parameters: Mapping[Parameter | str, float] | Sequence[float]
+    ) -> QuantumCircuit:
+        """Bind a single set of parameter values.
+
+        Args:
+            parameters: Either a mapping of parameters (or their names) to values, or a sequence
+                of values in the order of :attr:`parameters`.
+
+        Returns:
+            The bound and optimized circuit.
+        """
+        if isinstance(parameters, Mapping):
+            by_name = {_parameter_name(param): value for param, value in parameters.items()}
+            values = [by_name[param.name] for param in self._parameters]
+        else:
+            values = list(parameters)
+            if len(values) != len(self._parameters):
+                raise ValueError(
+                    f"Expected {len(self._parameters)} parameter values but received {len(values)}."
+                )
+        return self._bind(np.asarray(values, dtype=float).reshape(1, -1))[0]
+
+    def bind_all(self, bindings: BindingsArrayLike) -> np.ndarray:
+        """Bind every set of parameter values in a bindings array.
+
+        This is the equivalent of :meth:`.BindingsArray.bind_all` applied to the template, except
+        that each bound circuit has its parametrized single-qubit runs resynthesized.
+
+        Args:
+            bindings: The parameter values to bind, as a :class:`.BindingsArray` or anything that
+                can be coerced to one.
+
+        Returns:
+            An object array with the same shape as the bindings array, containing the bound
+            circuits.
+        """
+        from qiskit.primitives.containers.bindings_array import BindingsArray
+
+        bindings = BindingsArray.coerce(bindings)
+        shape = bindings.shape
+        if self._parameters:
+            values = bindings.as_array(self._parameters).reshape(-1, len(self._parameters))
+        else:
+            values = np.empty((int(np.prod(shape, dtype=int)), 0))
+        out = np.empty(len(values), dtype=object)
+        for index, circuit in enumerate(self._bind(values)):
+            out[index] = circuit
+        return out.reshape(shape)
+
+    def _bind(self, values: np.ndarray) -> list[QuantumCircuit]:
+        """Bind each row of ``values``, a 2D array indexed by binding then parameter.
+
+        Each output circuit is built in a single pass over the template's instructions, which
+        substitutes the bound parameter values and splices in the resynthesized runs.
+        """
+        num_bindings = len(values)
+        columns = {param: values[:, index] for index, param in enumerate(self._parameters)}
+        matrices = [self._run_matrices(run, columns, num_bindings) for run in self._runs]
+        data = self._circuit.data
+        standard_params = {
+            index: [
+                _batched_parameter_values(param, columns, num_bindings)
+                for param in data[index].params
+            ]
+            for index in self._standard_parametrized
+        }
+        global_phase = self._circuit.global_phase
+        if isinstance(global_phase, ParameterExpression):
+            global_phase = _batched_parameter_values(global_phase, columns, num_bindings)
+
+        out = []
+        for row_index, row in enumerate(values):
+            new = self._circuit.copy_empty_like()
+            new.global_phase = (
+                global_phase if np.isscalar(global_phase) else float(global_phase[row_index])
+            )
+            skip = set()
+            for index, instruction in enumerate(data):
+                if index in self._run_starts:
+                    run_index = self._run_starts[index]
+                    if (
+                        replacement := self._resynthesize(
+                            run_index, matrices[run_index][row_index], instruction.qubits
+                        )
+                    ) is not None:
+                        sequence, phase = replacement
+                        for new_instruction in sequence:
+                            new._append(new_instruction)
+                        new.global_phase += phase
+                        skip.update(self._runs[run_index])
+                if index in skip:
+                    continue
+                if (params := standard_params.get(index)) is not None:
+                    new._append(
+                        CircuitInstruction.from_standard(
+                            instruction.operation._standard_gate,
+                            instruction.qubits,
+                            [
+                                param if np.isscalar(param) else float(param[row_index])
+                                for param in params
+                            ],
+                            instruction.label,
+                        )
+                    )
+                elif (single := self._other_parametrized.get(index)) is not None:
+                    circuit, bindings = single
+                    bound = circuit.assign_parameters(
+                        {param: float(row[column]) for param, column in bindings}, inplace=False
+                    )
+                    new._append(bound.data[0])
+                else:
+                    new._append(instruction)
+            out.append(new)
+        return out
+
+    def _resynthesize(
+        self, run_index: int, matrix: np.ndarray, qubits: tuple
+    ) -> tuple[list[CircuitInstruction], float] | None:
+        """Resynthesize the bound unitary of a run, returning the new instructions and global phase
+        if they should replace the run, using the same criteria as
+        :class:`.Optimize1qGatesDecomposition`."""
+        qubit = self._run_qubits[run_index]
+        sequence = self._synthesizer._resynthesize_run(matrix, qubit)
+        if sequence is None:
+            return None
+        instructions = [
+            CircuitInstruction.from_standard(gate, qubits, angles) for gate, angles in sequence
+        ]
+        old_run, old_error = self._run_errors[run_index]
+        new_run = [DAGOpNode(instruction.operation, qubits) for instruction in instructions]
+        if not self._synthesizer._substitution_checks(
+            old_run, new_run, self._synthesizer._basis_gates, qubit, old_error=old_error
+        ):
+            return None
+        return instructions, sequence.global_phase
+
+    def _run_matrices(
+        self, run: list[int], columns: dict[Parameter, np.ndarray], num_bindings: int
+    ) -> np.ndarray:
+        """Compute the unitary of a run for every binding at once."""
+        data = self._circuit.data
+        out = np.broadcast_to(np.eye(2, dtype=complex), (num_bindings, 2, 2))
+        for index in run:
+            instruction = data[index]
+            if instruction.is_parameterized():
+                params = [
+                    _batched_parameter_values(param, columns, num_bindings)
+                    for param in instruction.params
+                ]
+                matrix = _batched_standard_gate_matrices(
+                    instruction.operation, params, num_bindings
+                )
+            else:
+                matrix = instruction.matrix
+            out = np.matmul(matrix, out)
+        return out
+
+
+def _is_run_candidate(instruction: CircuitInstruction) -> bool:
+    return (
+        instruction.is_standard_gate()
+        and len(instruction.qubits) == 1
+        and not instruction.clbits
+        and not instruction.operation.label
+    )
+
+
+def _parameter_name(parameter: Parameter | str) -> str:
+    return parameter if isinstance(parameter, str) else parameter.name
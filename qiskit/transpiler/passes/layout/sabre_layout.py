@@ -109,6 +109,7 @@ class SabreLayout(TransformationPass):
         swap_trials=None,
         layout_trials=None,
         skip_routing=False,
+        time_budget=None,
     ):
         """SabreLayout initializer.
 
@@ -147,10 +148,22 @@ class SabreLayout(TransformationPass):
                 will be set in the property set. This is a tradeoff to run custom
                 routing with multiple layout trials, as using this option will cause
                 SabreLayout to run the routing stage internally but not use that result.
+            time_budget (float): An optional wall-clock budget in seconds for the layout search.
+                If set, then after the first round of ``layout_trials`` trials the pass keeps
+                running further rounds with new random seeds for as long as the next round is
+                expected to finish within the budget, and keeps the result that needs the fewest
+                swap gates.  The search stops early if a round needs no swaps at all.  The first
+                round always runs in full, so the budget can be exceeded if it alone takes longer.
+                As the number of rounds depends on the speed of the machine, the output is only
+                reproducible between runs if ``time_budget`` is not set.  This option is mutually
+                exclusive with the ``routing_pass`` argument and an error will be raised if both
+                are used.
 
         Raises:
             TranspilerError: If both ``routing_pass`` and ``swap_trials`` or
-            both ``routing_pass`` and ``layout_trials`` are specified
+            both ``routing_pass`` and ``layout_trials`` are specified, or if both
+            ``routing_pass`` and ``time_budget`` are specified, or if ``time_budget``
+            is not positive.
         """
         super().__init__()
         if isinstance(coupling_map, Target) and not isinstance(coupling_map, _FakeTarget):
@@ -174,20 +187,27 @@ class SabreLayout(TransformationPass):
             raise TranspilerError(
                 "The 'routing_pass' argument cannot be set alongside 'swap_trials' or 'layout_trials'."
             )
+        if time_budget is not None:
+            if routing_pass is not None:
+                raise TranspilerError(
+                    "The 'routing_pass' argument cannot be set alongside 'time_budget'."
+                )
+            if time_budget <= 0:
+                raise TranspilerError(f"'time_budget' must be positive, not {time_budget}.")
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
         self.swap_trials = default_num_processes() if swap_trials is None else swap_trials
         self.layout_trials = default_num_processes() if layout_trials is None else layout_trials
         self.skip_routing = skip_routing
+        self.time_budget = time_budget
 
     @property
     def coupling_map(self):
         # This property is not intended to be public API, it just keeps backwards compatibility.
         if self._coupling_map is None:
-            self._coupling_map = self.target.build_coupling_map()
-            if self._coupling_map is not None:
-                self._coupling_map.make_symmetric()
+            # Shared with other passes through the target, so this must not be mutated.
+            self._coupling_map = self.target._cached_analysis(_symmetric_coupling_map)
         return self._coupling_map
 
     def run(self, dag):
@@ -273,17 +293,22 @@ class SabreLayout(TransformationPass):
         )
         sabre_start = time.perf_counter()
         # If `skip_routing`, then `out_dag` and `final` are meaningless but well-typed.
-        out_dag, initial, final = sabre_layout_and_routing(
-            dag,
-            self.target,
-            heuristic,
-            max_iterations=self.max_iterations,
-            num_swap_trials=self.swap_trials or 1,
-            num_random_trials=self.layout_trials,
-            seed=self.seed,
-            partial_layouts=starting_layouts,
-            skip_routing=self.skip_routing,
-        )
+        if self.time_budget is None:
+            out_dag, initial, final = sabre_layout_and_routing(
+                dag,
+                self.target,
+                heuristic,
+                max_iterations=self.max_iterations,
+                num_swap_trials=self.swap_trials or 1,
+                num_random_trials=self.layout_trials,
+                seed=self.seed,
+                partial_layouts=starting_layouts,
+                skip_routing=self.skip_routing,
+            )
+        else:
+            out_dag, initial, final = self._run_with_time_budget(
+                dag, heuristic, starting_layouts, sabre_start
+            )
         sabre_stop = time.perf_counter()
         logger.debug(
             "Sabre layout algorithm execution for all components complete in: %s sec.",
@@ -335,6 +360,50 @@ class SabreLayout(TransformationPass):
             )
         return out_dag
 
+    def _run_with_time_budget(self, dag, heuristic, starting_layouts, start):
+        """Run rounds of layout trials until the time budget is spent, keeping the best result.
+
+        Each round is a full call to the Rust layout and routing with a new seed, and the results
+        are compared by the number of swaps in the routed circuit.  The trials inside a round
+        cannot be interrupted, so a new round is only started if the average duration of the
+        previous rounds still fits in the remaining budget.  The starting layouts from the
+        property set are only tried in the first round.
+        """
+        rng = np.random.default_rng(self.seed)
+        seed = self.seed
+        best = None
+        best_swaps = None
+        rounds = 0
+        while True:
+            result = sabre_layout_and_routing(
+                dag,
+                self.target,
+                heuristic,
+                max_iterations=self.max_iterations,
+                num_swap_trials=self.swap_trials or 1,
+                num_random_trials=self.layout_trials,
+                seed=seed,
+                partial_layouts=starting_layouts if rounds == 0 else [],
+                # The routed circuit is needed to compare the rounds, even if it is discarded.
+                skip_routing=False,
+            )
+            rounds += 1
+            swaps = result[0].count_ops().get("swap", 0)
+            if best is None or swaps < best_swaps:
+                best, best_swaps = result, swaps
+            elapsed = time.perf_counter() - start
+            logger.debug(
+                "Sabre layout round %d needed %d swaps (best %d) after %s sec.",
+                rounds,
+                swaps,
+                best_swaps,
+                elapsed,
+            )
+            # No round can improve on a layout that needs no swaps at all.
+            if best_swaps == 0 or elapsed + elapsed / rounds > self.time_budget:
+                return best
+            seed = int(rng.integers(np.iinfo(np.int64).max))
+
     def _layout_and_route_passmanager(self, initial_layout):
         """Return a passmanager for a full layout and routing.
 
@@ -363,3 +432,10 @@ class SabreLayout(TransformationPass):
         qubit_map = Layout.combine_into_edge_map(initial_layout, trivial_layout)
         final_layout = {v: pass_final_layout._v2p[qubit_map[v]] for v in initial_layout._v2p}
         return Layout(final_layout)
+
+
+def _symmetric_coupling_map(target):
+    coupling_map = target.build_coupling_map()
+    if coupling_map is not None:
+        coupling_map.make_symmetric()
+    return coupling_map
@@ -131,13 +131,13 @@ class VF2Layout(AnalysisPass):
         if self.target is None and self.coupling_map is None:
             raise TranspilerError("coupling_map or target must be specified.")
         if self.coupling_map is None:
-            target, coupling_map = self.target, self.target.build_coupling_map()
+            target, coupling_map = self.target, self.target._cached_analysis(_coupling_map)
         elif self.target is None:
             coupling_map = self.coupling_map
             target = _build_dummy_target(coupling_map)
         else:
             # We have both, but may need to override the target if it has no connectivity.
-            coupling_map = self.target.build_coupling_map()
+            coupling_map = self.target._cached_analysis(_coupling_map)
             if coupling_map is None:
                 target = _build_dummy_target(self.coupling_map)
                 coupling_map = self.coupling_map
@@ -180,3 +180,7 @@ def _build_dummy_target(coupling_map) -> Target:
     return Target.from_configuration(
         basis_gates=["u", "cx"], num_qubits=coupling_map.size(), coupling_map=coupling_map
     )
+
+
+def _coupling_map(target):
+    return target.build_coupling_map()
@@ -12,6 +12,7 @@
 
 """Routing via SWAP insertion using the SABRE method from Li et al."""
 
+import dataclasses
 import functools
 import logging
 import time
@@ -61,6 +62,22 @@ class SabreSwap(TransformationPass):
     determined by the trial with the least amount of SWAPs inserted, will
     be selected from the random trials.
 
+    If ``checkpoint_interval`` is set, the circuit is routed in consecutive segments of that many
+    operations (in topological order), each starting from the layout the previous one ended with,
+    and the routed segments are recorded as a ``SabreCheckpoint`` in the
+    ``sabre_checkpoint`` field of the property set.  If that field already holds a checkpoint
+    when the pass runs, for example from routing an earlier circuit to the same target with the
+    same heuristic, seed and number of trials, then the leading segments whose input operations
+    are identical to those of the new circuit are reused as they are, and only the remaining
+    suffix of the circuit is routed.  Routing in segments limits how far ahead the heuristic can
+    look, so this can insert a few more swaps than routing the whole circuit at once.
+
+    Segments are matched on the topological order of the whole circuit, so operations appended to
+    a shared prefix can change the order of the prefix itself and prevent reuse.  For example, a
+    new operation on a qubit that is idle at the end of the prefix can be ordered before some of
+    the prefix operations.  Ending the shared prefix with a :class:`.Barrier` across all qubits
+    ensures that none of the following operations are ordered inside it.
+
     **References:**
 
     [1] Henry Zou and Matthew Treinish and Kevin Hartman and Alexander Ivrii and Jake Lishman.
@@ -71,7 +88,15 @@ class SabreSwap(TransformationPass):
     `arXiv:1809.02573 <https://arxiv.org/pdf/1809.02573.pdf>`_
     """
 
-    def __init__(self, coupling_map, heuristic="basic", seed=None, fake_run=False, trials=None):
+    def __init__(
+        self,
+        coupling_map,
+        heuristic="basic",
+        seed=None,
+        fake_run=False,
+        trials=None,
+        checkpoint_interval=None,
+    ):
         r"""SabreSwap initializer.
 
         Args:
@@ -87,9 +112,12 @@ class SabreSwap(TransformationPass):
                 CPUs on the local system. For reproducible results it is recommended
                 that you set this explicitly, as the output will be deterministic for
                 a fixed number of trials.
+            checkpoint_interval (int): If set, the number of operations of the circuit to route
+                in each checkpointed segment.  See the class documentation for details.
 
         Raises:
-            TranspilerError: If the specified heuristic is not valid.
+            TranspilerError: If the specified heuristic is not valid, or if
+                ``checkpoint_interval`` is not a positive integer.
 
         Additional Information:
 
@@ -157,6 +185,11 @@ class SabreSwap(TransformationPass):
         self.seed = seed
         self.trials = default_num_processes() if trials is None else trials
         self.fake_run = fake_run
+        if checkpoint_interval is not None and checkpoint_interval < 1:
+            raise TranspilerError(
+                f"'checkpoint_interval' must be a positive integer, not {checkpoint_interval}."
+            )
+        self.checkpoint_interval = checkpoint_interval
 
     @functools.cached_property
     def dist_matrix(self):
@@ -186,7 +219,10 @@ class SabreSwap(TransformationPass):
         if self.target is None:
             raise TranspilerError("SabreSwap cannot run with coupling_map=None")
         if self._routing_target is None:
-            self._routing_target = RoutingTarget.from_target(self.target)
+            # The distance matrix is expensive to build, so share it between passes.
+            self._routing_target = self.target._cached_analysis(
+                RoutingTarget.from_target, key=RoutingTarget
+            )
         if len(dag.qregs) != 1 or dag.qregs.get("q", None) is None:
             raise TranspilerError("Sabre swap runs on physical circuits only.")
         num_dag_qubits = len(dag.qubits)
@@ -232,9 +268,12 @@ class SabreSwap(TransformationPass):
 
         initial_layout = NLayout.generate_trivial_layout(num_dag_qubits)
         sabre_start = time.perf_counter()
-        dag, final_layout = sabre_routing(
-            dag, self._routing_target, heuristic, initial_layout, self.trials, self.seed
-        )
+        if self.checkpoint_interval is None:
+            dag, final_layout = sabre_routing(
+                dag, self._routing_target, heuristic, initial_layout, self.trials, self.seed
+            )
+        else:
+            dag, final_layout = self._route_with_checkpoints(dag, heuristic, initial_layout)
         sabre_stop = time.perf_counter()
         LOG.debug("Sabre swap algorithm execution complete in: %s", sabre_stop - sabre_start)
         permutation = [
@@ -252,3 +291,115 @@ class SabreSwap(TransformationPass):
             else prev.compose(layout, dag.qubits)
         )
         return dag
+
+    def _route_with_checkpoints(self, dag, heuristic, initial_layout):
+        """Route ``dag`` in segments, reusing the matching leading segments of a checkpoint.
+
+        Returns the routed DAG and the final layout, like ``sabre_routing``, and stores the new
+        checkpoint in the property set.
+        """
+        qubits = dag.qubits
+        clbits = dag.clbits
+        qubit_indices = {bit: i for i, bit in enumerate(qubits)}
+        clbit_indices = {bit: i for i, bit in enumerate(clbits)}
+        instructions = [
+            (
+                node.op,
+                tuple(qubit_indices[bit] for bit in node.qargs),
+                tuple(clbit_indices[bit] for bit in node.cargs),
+            )
+            for node in dag.topological_op_nodes()
+        ]
+        coupling = self._routing_target.coupling_list()
+
+        segments = []
+        layout = initial_layout
+        position = 0
+        previous = self.property_set["sabre_checkpoint"]
+        if (
+            previous is not None
+            and previous.num_qubits == len(qubits)
+            and previous.coupling == coupling
+            and previous.heuristic == heuristic
+            and previous.seed == self.seed
+            and previous.trials == self.trials
+        ):
+            for segment in previous.segments:
+                end = position + len(segment.instructions)
+                if instructions[position:end] != segment.instructions:
+                    break
+                segments.append(segment)
+                layout = segment.final_layout
+                position = end
+        LOG.debug(
+            "Reusing %d of %d operations from a Sabre routing checkpoint.",
+            position,
+            len(instructions),
+        )
+
+        while position < len(instructions):
+            end = position + self.checkpoint_interval
+            segment_dag = dag.copy_empty_like()
+            segment_dag.global_phase = 0
+            for op, qargs, cargs in instructions[position:end]:
+                segment_dag.apply_operation_back(
+                    op, [qubits[q] for q in qargs], [clbits[c] for c in cargs], check=False
+                )
+            routed_dag, layout = sabre_routing(
+                segment_dag, self._routing_target, heuristic, layout, self.trials, self.seed
+            )
+            routed = [
+                (
+                    node.op,
+                    tuple(qubit_indices[bit] for bit in node.qargs),
+                    tuple(clbit_indices[bit] for bit in node.cargs),
+                )
+                for node in routed_dag.topological_op_nodes()
+            ]
+            segments.append(_CheckpointSegment(instructions[position:end], routed, layout))
+            position = end
+
+        out = dag.copy_empty_like()
+        for segment in segments:
+            for op, qargs, cargs in segment.routed:
+                out.apply_operation_back(
+                    op, [qubits[q] for q in qargs], [clbits[c] for c in cargs], check=False
+                )
+        self.property_set["sabre_checkpoint"] = SabreCheckpoint(
+            len(qubits), coupling, heuristic, self.seed, self.trials, segments
+        )
+        return out, layout
+
+
+@dataclasses.dataclass(frozen=True)
+class _CheckpointSegment:
+    """A routed segment of a circuit.
+
+    The instructions are ``(operation, qubit indices, clbit indices)`` triples.
+    """
+
+    instructions: list
+    """The input instructions of the segment, in topological order."""
+    routed: list
+    """The routed instructions of the segment, including the inserted swaps."""
+    final_layout: NLayout
+    """The layout of virtual to physical qubits at the end of the segment."""
+
+
+@dataclasses.dataclass(frozen=True)
+class SabreCheckpoint:
+    """The routed segments of a circuit written by :class:`.SabreSwap` with a
+    ``checkpoint_interval``, which can be reused to route circuits with the same prefix."""
+
+    num_qubits: int
+    """The number of physical qubits the checkpoint was routed for."""
+    coupling: list
+    """The coupling edges of the routing target the checkpoint was routed for."""
+    heuristic: Heuristic
+    """The heuristic the checkpoint was routed with."""
+    seed: int | None
+    """The seed the checkpoint was routed with."""
+    trials: int
+    """The number of routing trials the checkpoint was routed with."""
+    segments: list
+    """The routed segments, in circuit order."""
@@ -73,6 +73,8 @@ class BasePadding(TransformationPass):
         super().__init__()
         self.target = target
         self.durations = durations
+        # Durations of operations by name and qubit indices, cleared at the start of each run.
+        self._duration_cache: dict[tuple[str, tuple[int, ...]], int | float | None] = {}
 
     def get_duration(self, node, dag):
         """Get duration of a given node in the circuit."""
@@ -82,13 +84,19 @@ class BasePadding(TransformationPass):
             return 0
         if not self.target and not self.durations:
             return None
-        indices = [dag.find_bit(qarg).index for qarg in node.qargs]
-
+        key = (node.name, tuple(dag.find_bit(qarg).index for qarg in node.qargs))
+        try:
+            return self._duration_cache[key]
+        except KeyError:
+            duration = self._duration_cache[key] = self._lookup_duration(*key)
+            return duration
+
+    def _lookup_duration(self, name: str, indices: tuple[int, ...]) -> int | float | None:
         if self.target:
-            props_dict = self.target.get(node.name)
+            props_dict = self.target.get(name)
             if not props_dict:
                 return None
-            props = props_dict.get(tuple(indices))
+            props = props_dict.get(indices)
             if not props:
                 return None
             if self.target.dt is None:
@@ -97,7 +105,7 @@ class BasePadding(TransformationPass):
                 res = self.target.seconds_to_dt(props.duration)
                 return res
 
-        return self.durations.get(node.name, indices)
+        return self.durations.get(name, list(indices))
 
     def run(self, dag: DAGCircuit):
         """Run the padding pass on ``dag``.
@@ -112,6 +120,7 @@ class BasePadding(TransformationPass):
             TranspilerError: When a particular node is not scheduled, likely some transform pass
                 is inserted before this node is called.
         """
+        self._duration_cache.clear()
         self._pre_runhook(dag)
 
         node_start_time = self.property_set["node_start_time"].copy()
@@ -133,6 +142,11 @@ class BasePadding(TransformationPass):
         new_dag.global_phase = dag.global_phase
 
         idle_after = dict.fromkeys(dag.qubits, 0)
+        # Whether each qubit can be padded does not change during the run, so it is only looked up
+        # in the target once per qubit.
+        delay_supported = {
+            bit: self.__delay_supported(index) for index, bit in enumerate(dag.qubits)
+        }
 
         # Compute fresh circuit duration from the node start time dictionary and op duration.
         # Note that pre-scheduled duration may change within the alignment passes, i.e.
@@ -155,7 +169,7 @@ class BasePadding(TransformationPass):
 
                 for bit in node.qargs:
                     # Fill idle time with some sequence
-                    if t0 - idle_after[bit] > 0 and self.__delay_supported(dag.find_bit(bit).index):
+                    if t0 - idle_after[bit] > 0 and delay_supported[bit]:
                         # Find previous node on the wire, i.e. always the latest node on the wire
                         prev_node = next(new_dag.predecessors(new_dag.output_map[bit]))
                         self._pad(
@@ -178,9 +192,7 @@ class BasePadding(TransformationPass):
 
         # Add delays until the end of circuit.
         for bit in new_dag.qubits:
-            if circuit_duration - idle_after[bit] > 0 and self.__delay_supported(
-                dag.find_bit(bit).index
-            ):
+            if circuit_duration - idle_after[bit] > 0 and delay_supported[bit]:
                 node = new_dag.output_map[bit]
                 prev_node = next(new_dag.predecessors(node))
                 self._pad(
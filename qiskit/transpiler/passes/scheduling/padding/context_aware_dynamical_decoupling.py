@@ -15,6 +15,7 @@
 from __future__ import annotations
 from enum import Enum
 
+import bisect
 import itertools
 import logging
 
@@ -149,7 +150,9 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
         self._skip_reset_qubits = skip_reset_qubits
         self._skip_dd_threshold = skip_dd_threshold
         self._target = target
-        self._coupling_map = target.build_coupling_map()  # build once and reuse for performance
+        # The coupling map and the device neighbors of each qubit are built once per target and
+        # shared between pass instances.
+        self._coupling_map, self._neighbors = target._cached_analysis(_coupling_tables)
         self._pulse_alignment = (
             target.pulse_alignment if pulse_alignment is None else pulse_alignment
         )
@@ -188,22 +191,27 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
         # CX or ECR gates) and get the DD sequence
         all_delays = set()  # keep a list of all delays to iterate over them easily later
 
+        # The CX and ECR gates on each wire and the DD sequences are shared by all the delays, so
+        # they are collected once rather than for each multi-qubit delay.
+        two_qubit_timelines = self._get_two_qubit_timelines(dag, qubit_map)
+        checked_durations_cache = set()
+        dd_sequence_cache = {}
+
         for merged_delay in merged_delays:
             all_delays.update(merged_delay.ops)
 
             # get coloring inside the n-qubit delay
-            coloring = self._get_wire_coloring(dag, merged_delay)
+            coloring = self._get_wire_coloring(dag, merged_delay, two_qubit_timelines)
 
             # get the DD sequence on the qubit
             duration = merged_delay.end - merged_delay.start
-            checked_durations_cache = set()
             for op in merged_delay.ops:
-                dd_circuit, start_times = self._get_dd_sequence(
-                    coloring[op.index],
-                    op.index,
-                    duration,
-                    checked_durations_cache,
-                )
+                key = (coloring[op.index], op.index, duration)
+                if (layout := dd_sequence_cache.get(key)) is None:
+                    layout = dd_sequence_cache[key] = self._get_dd_layout(
+                        *key, checked_durations_cache
+                    )
+                dd_circuit, start_times = _layout_to_circuit(layout)
                 op.replacement.compose(dd_circuit, inplace=True, copy=False)
                 if len(op.start_times) == 0:
                     op.start_times += start_times
@@ -273,7 +281,34 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
 
         return sorted_events
 
-    def _get_wire_coloring(self, dag: DAGCircuit, merged_delay: MultiDelayOp) -> dict[int, int]:
+    def _get_two_qubit_timelines(
+        self, dag: DAGCircuit, qubit_map: dict[Qubit, int]
+    ) -> dict[int, tuple[list[int], list[int], list[int]]]:
+        """Collect the CX and ECR gates on each wire, for the coloring of spectator qubits.
+
+        Returns a dictionary ``{index: (starts, ends, colors)}`` with the start and end times of
+        the gates in wire order, and the color of the wire in each gate (0 if control, 1 if
+        target).  Gates on the same wire do not overlap, so both times are sorted.
+        """
+        timelines = {}
+        node_start_time = self.property_set["node_start_time"]
+        for op_node in dag.op_nodes():
+            if not isinstance(op_node.op, (CXGate, ECRGate)):
+                continue
+            op_start = node_start_time[op_node]
+            op_end = op_start + self._duration(op_node, qubit_map)
+            for color, bit in enumerate(op_node.qargs):
+                timelines.setdefault(qubit_map[bit], []).append((op_start, op_end, color))
+        return {
+            index: tuple(map(list, zip(*sorted(timeline)))) for index, timeline in timelines.items()
+        }
+
+    def _get_wire_coloring(
+        self,
+        dag: DAGCircuit,
+        merged_delay: MultiDelayOp,
+        two_qubit_timelines: dict[int, tuple[list[int], list[int], list[int]]] | None = None,
+    ) -> dict[int, int]:
         """Find a wire coloring for a multi-delay operation.
 
         This function returns a dictionary that includes the coloring (as int) for the indices in the
@@ -281,20 +316,15 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
         neighboring qubits with a CX or ECR a color (0 if control, 1 if target) and including them
         in the coloring problem.
         """
+        if two_qubit_timelines is None:
+            qubit_map = {bit: index for index, bit in enumerate(dag.qubits)}
+            two_qubit_timelines = self._get_two_qubit_timelines(dag, qubit_map)
+
         # get neighboring wires, for which we will give initial colors
         neighbors = set()
-        index_map = dict(enumerate(dag.qubits))
-        qubit_map = {bit: index for index, bit in enumerate(dag.qubits)}
-
         for delay_op in merged_delay.ops:
-            # use coupling_map.graph.neighbors_undirected once Qiskit/rustworkx#1254 is in a release
-            new_neighbors = {
-                i
-                for i in range(dag.num_qubits())
-                if self._coupling_map.distance(i, delay_op.index) == 1
-            }
             # do not add indices that are already in the merged delay
-            neighbors.update(new_neighbors.difference(merged_delay.indices))
+            neighbors.update(self._neighbors[delay_op.index].difference(merged_delay.indices))
 
         # build a subgraph we will apply the coloring function on
         wires = sorted(neighbors.union(merged_delay.indices))
@@ -304,21 +334,15 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
 
         # find the neighbor wires and check if ctrl/tgt spectator
         for wire in neighbors:
-            for op_node in dag.nodes_on_wire(dag.qubits[wire], only_ops=True):
-                # check if the operation occurs during the delay
-                op_start = self.property_set["node_start_time"][op_node]
-                op_end = op_start + self._duration(op_node, qubit_map)
-                if (
-                    isinstance(op_node.op, (CXGate, ECRGate))
-                    and op_start < merged_delay.end
-                    and op_end > merged_delay.start
-                ):
-                    # set coloring to 0 if ctrl, and to 1 if tgt
-                    ctrl, tgt = op_node.qargs
-                    if index_map[wire] == ctrl:
-                        preset_coloring[glob2loc[wire]] = 0
-                    if index_map[wire] == tgt:
-                        preset_coloring[glob2loc[wire]] = 1
+            if (timeline := two_qubit_timelines.get(wire)) is None:
+                continue
+            starts, ends, colors = timeline
+            # The last gate starting before the end of the delay is the last one in wire order
+            # that can overlap with it, and it does so if it ends after the delay starts.
+            last = bisect.bisect_left(starts, merged_delay.end) - 1
+            if last >= 0 and ends[last] > merged_delay.start:
+                # set coloring to 0 if ctrl, and to 1 if tgt
+                preset_coloring[glob2loc[wire]] = colors[last]
 
         local_coloring = rx.graph_greedy_color(
             subgraph,
@@ -348,6 +372,21 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
         we've already checked to match the pulse alignment. Returns the DD sequence and the
         node start times as list.
         """
+        return _layout_to_circuit(
+            self._get_dd_layout(order, index, duration, checked_durations_cache)
+        )
+
+    def _get_dd_layout(
+        self,
+        order: int,
+        index: int,
+        duration: int,
+        checked_durations_cache: set[int],
+    ) -> list[tuple[Gate | None, int | float, int | float]]:
+        """Get the layout of a DD sequence as a list of ``(gate, delay, start_time)`` entries.
+
+        ``gate`` is ``None`` for a delay of length ``delay``.  See :meth:`_get_dd_sequence`.
+        """
         instruction_durations = self._target.durations()
         # check the X gate on the active qubit is compatible with pulse alignment
         if index not in checked_durations_cache:
@@ -366,9 +405,7 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
         slack = duration - dd_sequence_duration
         slack_fraction = slack / duration
         if 1 - slack_fraction >= self._skip_dd_threshold:  # dd doesn't fit
-            seq = QuantumCircuit(1)
-            seq.delay(duration, 0)
-            return seq, [0]
+            return [(None, duration, 0)]
 
         # compute actual spacings in between the delays, taking into account
         # the pulse alignment restriction of the hardware
@@ -376,20 +413,17 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
 
         # apply the DD gates
         # tau has one more entry than the gate sequence
-        start_times = []
+        layout = []
         time = 0  # track the node start time
-        seq = QuantumCircuit(1)  # if the DD sequence has a global phase, add it here
         for tau, gate in itertools.zip_longest(taus, dd_sequence):
             if tau > 0:
-                seq.delay(tau, 0)
-                start_times.append(time)
+                layout.append((None, tau, time))
                 time += tau
             if gate is not None:
-                seq.append(gate, [0])
-                start_times.append(time)
+                layout.append((gate, 0, time))
                 time += instruction_durations.get(gate, index)
 
-        return seq, start_times
+        return layout
 
     def _constrain_spacing(self, spacing, slack):
         def _constrained_length(values):
@@ -424,6 +458,14 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
         """
         open_delay_blocks = []
         closed_delay_blocks = []
+        # The qubits at distance at most one from each qubit on the device.
+        qubits = list(qubit_map)
+        neighborhoods = {
+            bit: {bit}.union(
+                qubits[neighbor] for neighbor in self._neighbors[index] if neighbor < len(qubits)
+            )
+            for bit, index in qubit_map.items()
+        }
 
         def _open_delay_block(delay_event):
             open_delay_blocks.append(
@@ -460,19 +502,11 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
                 survivor.events.sort(key=DelayEvent.sort_key)  # Maintain sorted event order
 
         for delay_event in sorted_delay_events:
-            # This could be avoided by keeping a map of device qubit to open
-            # block and only considering neighbors of current event.
-            # use coupling_map.graph.neighbors_undirected once Qiskit/rustworkx#1254 is in a release
+            neighborhood = neighborhoods[delay_event.op_node.qargs[0]]
             adjacent_open_delay_blocks = [
                 open_delay
                 for open_delay in open_delay_blocks
-                if any(
-                    self._coupling_map.distance(
-                        qubit_map[delay_event.op_node.qargs[0]], qubit_map[open_delay_qubit]
-                    )
-                    <= 1
-                    for open_delay_qubit in open_delay.active_qubits
-                )
+                if not neighborhood.isdisjoint(open_delay.active_qubits)
             ]
 
             if delay_event.type == EventType.BEGIN:
@@ -550,20 +584,22 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
         active_delays = {}  # {window: [group1, group2]} where each group = (index1, index2, ..)
         op_map = {}  # {(qubit_index, window): delay operation as DAGOpNode}
         windows = list(zip(breakpoints[:-1], breakpoints[1:]))
-        for window in windows:
-            active = []
-
-            # check which delays are active during the window
-            # this could be e.g. [0, 1, 2, 5, 6, 9]
-            for index, delays in all_delays.items():
-                for delay in delays:
-                    # since the windows are atomic, we have three cases:
-                    # (1) the delay starts at the time window, (2) it ends with it, (3) it contains it
-                    if delay.start <= window[0] and delay.end >= window[1]:
-                        active.append(index)
-                        delay.add_window(window)
-                        op_map[(index, window)] = delay
 
+        # Since the windows are atomic, each delay is active during a contiguous range of them,
+        # bounded by the breakpoints at its start and end.  This could be e.g. [0, 1, 2, 5, 6, 9].
+        active_per_window = [[] for _ in windows]
+        for index, delays in all_delays.items():
+            for delay in delays:
+                if delay.end is None:
+                    raise ValueError("Cannot add a window if DelayOp.end is None. Please set it.")
+                first = bisect.bisect_left(breakpoints, delay.start)
+                last = bisect.bisect_left(breakpoints, delay.end)
+                delay.breakpoints = breakpoints[first + 1 : last]
+                for window_index in range(first, last):
+                    active_per_window[window_index].append(index)
+                    op_map[(index, windows[window_index])] = delay
+
+        for window, active in zip(windows, active_per_window):
             # check which are adjacent
             # on a linear topology, we would get [[0, 1, 2], [5, 6], [9]]
             visited = defaultdict(lambda: False)
@@ -573,7 +609,7 @@ class ContextAwareDynamicalDecoupling(TransformationPass):
                     continue
 
                 active_neighbors = {start_index}
-                _dfs(start_index, self._coupling_map, active_neighbors, active)
+                _dfs(start_index, self._neighbors, active_neighbors, active)
 
                 for index in active_neighbors:
                     visited[index] = True
@@ -763,14 +799,42 @@ class AdjacentDelayBlock:
                     )
 
 
-def _dfs(qubit, cmap: CouplingMap, visited, active_qubits):
+def _dfs(qubit, neighbors: list[set[int]], visited, active_qubits):
     """Depth-first search to get the widest group of idle qubits during a given time frame."""
+    active_qubits = set(active_qubits)
+    stack = [qubit]
+    while stack:
+        for neighbor in neighbors[stack.pop()].intersection(active_qubits):
+            if neighbor not in visited:
+                visited.add(neighbor)
+                stack.append(neighbor)
+
+
+def _coupling_tables(target: Target) -> tuple[CouplingMap | None, list[set[int]]]:
+    """Get the coupling map of the target and the set of undirected neighbors of each qubit."""
+    coupling_map = target.build_coupling_map()
+    if coupling_map is None:
+        return coupling_map, []
     # use coupling_map.graph.neighbors_undirected once Qiskit/rustworkx#1254 is in a release
-    neighbors = {other for other in active_qubits if cmap.distance(qubit, other) == 1}
-    for neighbor in neighbors:
-        if neighbor in active_qubits and neighbor not in visited:
-            visited.add(neighbor)
-            _dfs(neighbor, cmap, visited, active_qubits)
+    neighbors = [set() for _ in range(coupling_map.size())]
+    for first, second in coupling_map.get_edges():
+        if first != second:
+            neighbors[first].add(second)
+            neighbors[second].add(first)
+    return coupling_map, neighbors
+
+
+def _layout_to_circuit(
+    layout: list[tuple[Gate | None, int | float, int | float]],
+) -> tuple[QuantumCircuit, list[int | float]]:
+    """Build the single-qubit DD circuit and its node start times from a DD layout."""
+    seq = QuantumCircuit(1)  # if the DD sequence has a global phase, add it here
+    for gate, delay, _ in layout:
+        if gate is None:
+            seq.delay(delay, 0)
+        else:
+            seq.append(gate, [0])
+    return seq, [start_time for _, _, start_time in layout]
 
 
 class WalshHadamardSequence:
@@ -179,6 +179,9 @@ class PadDynamicalDecoupling(BasePadding):
 
         self._no_dd_qubits: set[int] = set()
         self._dd_sequence_lengths: dict[Qubit, list[int]] = {}
+        self._dd_sequence_durations: dict[Qubit, int] = {}
+        self._dd_intervals: dict[int, np.ndarray] = {}
+        self._qubit_indices: dict[Qubit, int] = {}
         self._sequence_phase = 0
         if target is not None:
             # The priority order for instruction durations is: target > standalone.
@@ -201,6 +204,8 @@ class PadDynamicalDecoupling(BasePadding):
         # Check if physical circuit is given
         if len(dag.qregs) != 1 or dag.qregs.get("q", None) is None:
             raise TranspilerError("DD runs on physical circuits only.")
+        self._qubit_indices = {qubit: index for index, qubit in enumerate(dag.qubits)}
+        self._dd_intervals = {}
 
         # Set default spacing otherwise validate user input
         if self._spacing is None:
@@ -247,6 +252,7 @@ class PadDynamicalDecoupling(BasePadding):
                 self._dd_sequence[index] = gate
                 gate.duration = gate_length
             self._dd_sequence_lengths[qubit] = sequence_lengths
+            self._dd_sequence_durations[qubit] = np.sum(sequence_lengths)
 
     def __gate_supported(self, gate: Gate, qarg: int) -> bool:
         """A gate is supported on the qubit (qarg) or not."""
@@ -307,7 +313,7 @@ class PadDynamicalDecoupling(BasePadding):
                 f"between {_format_node(prev_node)} and {_format_node(next_node)}."
             )
 
-        if not self.__is_dd_qubit(dag.qubits.index(qubit)):
+        if not self.__is_dd_qubit(self._qubit_indices[qubit]):
             # Target physical qubit is not the target of this DD sequence.
             self._apply_scheduled_op(dag, t_start, Delay(time_interval, dag._unit), qubit)
             return
@@ -319,7 +325,7 @@ class PadDynamicalDecoupling(BasePadding):
             self._apply_scheduled_op(dag, t_start, Delay(time_interval, dag._unit), qubit)
             return
 
-        slack = time_interval - np.sum(self._dd_sequence_lengths[qubit])
+        slack = time_interval - self._dd_sequence_durations[qubit]
         sequence_gphase = self._sequence_phase
 
         if slack <= 0:
@@ -353,6 +359,31 @@ class PadDynamicalDecoupling(BasePadding):
                 self._apply_scheduled_op(dag, t_start, Delay(time_interval, dag._unit), qubit)
                 return
 
+        # The delays only depend on the slack, which is shared by all the idle periods of the
+        # same length on qubits with the same sequence durations.
+        if (taus := self._dd_intervals.get(slack)) is None:
+            taus = self._dd_intervals[slack] = self._compute_dd_intervals(slack)
+
+        # (3) Construct DD sequence with delays
+        num_elements = max(len(self._dd_sequence), len(taus))
+        idle_after = t_start
+        for dd_ind in range(num_elements):
+            if dd_ind < len(taus):
+                tau = taus[dd_ind]
+                if tau > 0:
+                    self._apply_scheduled_op(dag, idle_after, Delay(tau, dag._unit), qubit)
+                    # Cast tau to int from np.float64 to avoid type changes
+                    idle_after += int(tau)
+            if dd_ind < len(self._dd_sequence):
+                gate = self._dd_sequence[dd_ind]
+                gate_length = self._dd_sequence_lengths[qubit][dd_ind]
+                self._apply_scheduled_op(dag, idle_after, gate, qubit)
+                idle_after += gate_length
+        dag.global_phase = dag.global_phase + sequence_gphase
+
+    def _compute_dd_intervals(self, slack):
+        """Compute the delays around the gates of the DD sequence that fill ``slack``."""
+
         def _constrained_length(values):
             return self._alignment * np.floor(values / self._alignment)
 
@@ -378,23 +409,7 @@ class PadDynamicalDecoupling(BasePadding):
             raise TranspilerError(
                 f"Option extra_slack_distribution = {self._extra_slack_distribution} is invalid."
             )
-
-        # (3) Construct DD sequence with delays
-        num_elements = max(len(self._dd_sequence), len(taus))
-        idle_after = t_start
-        for dd_ind in range(num_elements):
-            if dd_ind < len(taus):
-                tau = taus[dd_ind]
-                if tau > 0:
-                    self._apply_scheduled_op(dag, idle_after, Delay(tau, dag._unit), qubit)
-                    # Cast tau to int from np.float64 to avoid type changes
-                    idle_after += int(tau)
-            if dd_ind < len(self._dd_sequence):
-                gate = self._dd_sequence[dd_ind]
-                gate_length = self._dd_sequence_lengths[qubit][dd_ind]
-                self._apply_scheduled_op(dag, idle_after, gate, qubit)
-                idle_after += gate_length
-        dag.global_phase = dag.global_phase + sequence_gphase
+        return taus
 
     @staticmethod
     def _resolve_params(gate: Gate) -> tuple:
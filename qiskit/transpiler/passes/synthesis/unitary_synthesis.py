@@ -244,19 +244,19 @@ class UnitarySynthesis(TransformationPass):
             if method.supports_pulse_optimize:
                 kwargs["pulse_optimize"] = self._pulse_optimize
             if method.supports_gate_lengths:
-                _gate_lengths = _gate_lengths or _build_gate_lengths(self._target)
+                _gate_lengths = _gate_lengths or _target_analysis(self._target, _build_gate_lengths)
                 kwargs["gate_lengths"] = _gate_lengths
             if method.supports_gate_errors:
-                _gate_errors = _gate_errors or _build_gate_errors(self._target)
+                _gate_errors = _gate_errors or _target_analysis(self._target, _build_gate_errors)
                 kwargs["gate_errors"] = _gate_errors
             if method.supports_gate_lengths_by_qubit:
-                _gate_lengths_by_qubit = _gate_lengths_by_qubit or _build_gate_lengths_by_qubit(
-                    self._target
+                _gate_lengths_by_qubit = _gate_lengths_by_qubit or _target_analysis(
+                    self._target, _build_gate_lengths_by_qubit
                 )
                 kwargs["gate_lengths_by_qubit"] = _gate_lengths_by_qubit
             if method.supports_gate_errors_by_qubit:
-                _gate_errors_by_qubit = _gate_errors_by_qubit or _build_gate_errors_by_qubit(
-                    self._target
+                _gate_errors_by_qubit = _gate_errors_by_qubit or _target_analysis(
+                    self._target, _build_gate_errors_by_qubit
                 )
                 kwargs["gate_errors_by_qubit"] = _gate_errors_by_qubit
             supported_bases = method.supported_bases
@@ -372,6 +372,16 @@ class UnitarySynthesis(TransformationPass):
         return out_dag
 
 
+def _target_analysis(target, build):
+    """Get ``build(target)``, memoized on the target so it is shared between pass instances.
+
+    The tables are passed to plugins, which may modify them, so each call returns a copy of the
+    memoized table, whose values are copied one level deep."""
+    if target is None:
+        return build(None)
+    return {key: value.copy() for key, value in target._cached_analysis(build).items()}
+
+
 def _build_gate_lengths(target=None):
     """Builds a ``gate_lengths`` dictionary from ``target`` (BackendV2).
 
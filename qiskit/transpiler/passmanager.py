@@ -18,18 +18,20 @@ import io
 import re
 from collections.abc import Iterator, Iterable, Callable
 from functools import wraps
-from typing import Any, TypeVar
+from typing import Any, Literal, TypeVar
 
 from qiskit.circuit import QuantumCircuit
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.passmanager.passmanager import BasePassManager
+from qiskit.passmanager.executor import PassManagerExecutor
 from qiskit.passmanager.base_tasks import Task
 from qiskit.passmanager.flow_controllers import FlowControllerLinear
 from qiskit.passmanager.exceptions import PassManagerError
 from .basepasses import BasePass
 from .exceptions import TranspilerError
 from .layout import TranspileLayout
+from .target import Target
 
 _CircuitsT = TypeVar("_CircuitsT", bound=list[QuantumCircuit] | QuantumCircuit)
 
@@ -131,6 +133,7 @@ class PassManager(BasePassManager):
         num_processes: int | None = None,
         *,
         property_set: dict[str, object] | None = None,
+        parallel_mode: Literal["process", "thread"] = "process",
     ) -> _CircuitsT:
         """Run all the passes on the specified ``circuits``.
 
@@ -186,6 +189,11 @@ class PassManager(BasePassManager):
                 another, in cases where you know the analysis is safe to share.  Beware that some
                 analysis will be specific to the input circuit and the particular :class:`.Target`,
                 so you should take a lot of care when using this argument.
+            parallel_mode: How to transpile multiple circuits in parallel.  The default
+                ``"process"`` uses separate processes, subject to :func:`.should_run_in_parallel`.
+                ``"thread"`` uses up to ``num_processes`` threads in this process, which share one
+                copy of the :class:`.Target` and never serialize the circuits; see
+                :class:`.PassManagerExecutor` for when this is beneficial.
 
         Returns:
             The transformed circuit(s).
@@ -199,8 +207,118 @@ class PassManager(BasePassManager):
             output_name=output_name,
             num_processes=num_processes,
             property_set=property_set,
+            parallel_mode=parallel_mode,
         )
 
+    def run_iter(  # pylint:disable=arguments-renamed,arguments-differ
+        self,
+        circuits: Iterable[QuantumCircuit],
+        output_name: str | None = None,
+        callback: Callable | None = None,
+        num_processes: int | None = None,
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        property_set: dict[str, object] | None = None,
+        parallel_mode: Literal["process", "thread"] = "process",
+    ) -> Iterator[QuantumCircuit]:
+        """Lazily run all the passes on each of the circuits in ``circuits``.
+
+        This is a streaming form of :meth:`run`.  It accepts any iterable of circuits (including a
+        generator), and yields each transpiled circuit as soon as it is ready.  Circuits are only
+        taken from ``circuits`` as worker processes become free, so the whole batch never needs to
+        be held in memory, and the outputs can be consumed while later circuits are still being
+        transpiled.  For example::
+
+            for transpiled in pass_manager.run_iter(circuit_generator, ordered=False):
+                submit(transpiled)
+
+        Args:
+            circuits: Any iterable of circuits to transform.
+            output_name: The output circuit name.  See :meth:`run`.
+            callback: A callback function that will be called after each pass execution.  See
+                :meth:`run`.
+            num_processes: The maximum number of parallel processes to launch if parallel
+                execution is enabled.  See :meth:`run`.
+            ordered: If ``True`` (the default), the circuits are yielded in the same order as the
+                inputs.  If ``False``, the circuits are yielded in the order they complete, which
+                can improve throughput when circuits take very different times to transpile.
+            max_in_flight: The maximum number of circuits being transpiled that have not yet been
+                yielded.  Defaults to twice the number of worker processes.
+            property_set: If given, the initial value to use as the :class:`.PropertySet` for the
+                pass manager pipeline.  See :meth:`run`.
+            parallel_mode: Whether to use worker processes or threads.  See :meth:`run`.
+
+        Yields:
+            QuantumCircuit: the transformed circuits.
+        """
+        with self.executor(num_processes=num_processes, mode=parallel_mode) as executor:
+            yield from executor.run_iter(
+                circuits,
+                output_name,
+                callback,
+                ordered=ordered,
+                max_in_flight=max_in_flight,
+                property_set=property_set,
+            )
+
+    def executor(
+        self,
+        num_processes: int | None = None,
+        *,
+        mode: Literal["process", "thread"] = "process",
+    ) -> PassManagerExecutor:
+        """Create a reusable pool of workers to run this pass manager.
+
+        The returned executor ships this pass manager to its worker processes only once, and then
+        reuses them for every call to its ``run`` method, which accepts the same arguments as
+        :meth:`run` (except ``num_processes``).  This avoids paying the process start-up and pass
+        manager serialization costs of :meth:`run` for every batch, when transpiling many small
+        batches of circuits::
+
+            with pass_manager.executor(num_processes=8) as executor:
+                for batch in batches:
+                    transpiled = executor.run(batch)
+
+        The executor captures the pass manager as it is at the time of this call.
+
+        Args:
+            num_processes: The maximum number of workers to use.  This has the same meaning as the
+                same argument to :meth:`run`.
+            mode: Whether the workers are processes (``"process"``) or threads (``"thread"``).  See
+                :class:`.PassManagerExecutor` for the differences.
+
+        Returns:
+            PassManagerExecutor: an executor, which should be shut down after use, for example by
+            using it as a context manager.
+        """
+        return _CircuitPassManagerExecutor(self, num_processes=num_processes, mode=mode)
+
+    def _passmanager_ir_size(self, passmanager_ir: DAGCircuit) -> int | None:
+        if isinstance(passmanager_ir, DAGCircuit):
+            return passmanager_ir.size(recurse=True)
+        return None
+
+    def _thread_shared_objects(self) -> Iterable[Any]:
+        # The `Target` is the largest object held by the preset passes, and passes only read from
+        # it, so all the copies of the pass manager made for worker threads can share it.
+        shared = {}
+        seen = set()
+        stack = list(self._flatten_tasks(self._tasks))
+        while stack:
+            task = stack.pop()
+            if id(task) in seen:
+                continue
+            seen.add(id(task))
+            for value in getattr(task, "__dict__", {}).values():
+                if isinstance(value, Target):
+                    shared[id(value)] = value
+                elif isinstance(value, Task):
+                    stack.append(value)
+                elif isinstance(value, (list, tuple)):
+                    stack.extend(item for item in value if isinstance(item, Task))
+        return shared.values()
+
     def draw(self, filename=None, style=None, raw=False):
         """Draw the pass manager.
 
@@ -414,9 +532,26 @@ class StagedPassManager(PassManager):
         num_processes: int | None = None,
         *,
         property_set: dict[str, object] | None = None,
+        parallel_mode: Literal["process", "thread"] = "process",
     ) -> _CircuitsT:
         self._update_passmanager()
-        return super().run(circuits, output_name, callback, num_processes=num_processes)
+        return super().run(
+            circuits,
+            output_name,
+            callback,
+            num_processes=num_processes,
+            property_set=property_set,
+            parallel_mode=parallel_mode,
+        )
+
+    def executor(
+        self,
+        num_processes: int | None = None,
+        *,
+        mode: Literal["process", "thread"] = "process",
+    ) -> PassManagerExecutor:
+        self._update_passmanager()
+        return super().executor(num_processes=num_processes, mode=mode)
 
     def to_flow_controller(self) -> FlowControllerLinear:
         self._update_passmanager()
@@ -472,6 +607,60 @@ for _name, _method in inspect.getmembers(PassManager, predicate=inspect.isfuncti
     setattr(PassManager, _name, _wrapped)
 
 
+class _CircuitPassManagerExecutor(PassManagerExecutor):
+    """An executor for :class:`.PassManager` whose ``run`` method matches :meth:`.PassManager.run`."""
+
+    def run(  # pylint:disable=arguments-renamed,arguments-differ
+        self,
+        circuits: _CircuitsT,
+        output_name: str | None = None,
+        callback: Callable | None = None,
+        *,
+        property_set: dict[str, object] | None = None,
+    ) -> _CircuitsT:
+        if callback is not None:
+            callback = _legacy_style_callback(callback)
+        try:
+            return super().run(
+                circuits,
+                callback=callback,
+                output_name=output_name,
+                property_set=property_set,
+            )
+        except TranspilerError:
+            raise
+        except PassManagerError as ex:
+            raise TranspilerError(ex.message) from ex
+
+    def run_iter(  # pylint:disable=arguments-renamed,arguments-differ
+        self,
+        circuits: Iterable[QuantumCircuit],
+        output_name: str | None = None,
+        callback: Callable | None = None,
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+        property_set: dict[str, object] | None = None,
+    ) -> Iterator[QuantumCircuit]:
+        if callback is not None:
+            callback = _legacy_style_callback(callback)
+        # The error translation of `PassManager` methods can't reach inside a generator, so it has
+        # to be done here.
+        try:
+            yield from super().run_iter(
+                circuits,
+                callback=callback,
+                ordered=ordered,
+                max_in_flight=max_in_flight,
+                output_name=output_name,
+                property_set=property_set,
+            )
+        except TranspilerError:
+            raise
+        except PassManagerError as ex:
+            raise TranspilerError(ex.message) from ex
+
+
 def _legacy_style_callback(callback: Callable):
     def _wrapped_callable(task, passmanager_ir, property_set, running_time, count):
         callback(
@@ -664,7 +664,8 @@ def _parse_common_options(
     if coupling_map is None:
         coupling_map = target.build_coupling_map()
     if basis_gates is None and len(target.operation_names) > 0:
-        basis_gates = target.operation_names
+        # Materialize the view, since passes hold onto it and must be copyable.
+        basis_gates = list(target.operation_names)
     if instruction_durations is None:
         instruction_durations = target.durations()
     if timing_constraints is None:
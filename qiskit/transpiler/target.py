@@ -232,6 +232,7 @@ class Target(BaseTarget):
     """
 
     __slots__ = (
+        "_analysis_cache",
         "_coupling_graph",
         "_gate_map",
         "_instruction_durations",
@@ -318,8 +319,39 @@ class Target(BaseTarget):
         out._instruction_schedule_map = None
         out._non_global_basis = None
         out._non_global_basis_strict = None
+        out._analysis_cache = {}
         return out
 
+    def _cached_analysis(self, build, key=None):
+        """Get the result of an analysis of the target, memoized on the target.
+
+        Transpiler passes use this to share data derived from the target, such as gate-length
+        tables, between pass instances and ``transpile`` calls, rather than recomputing it every
+        time they run.  The cached results are discarded when the instructions, their properties
+        or ``dt`` are modified through :meth:`add_instruction`, :meth:`update_instruction_properties`
+        or the ``dt`` setter.  Modifying an :class:`.InstructionProperties` object in place, such
+        as with ``target["cx"][(0, 1)].error = 0.1``, is not detected, and leaves stale results
+        in the cache.  The results are shared, so callers must not mutate them, and must copy them
+        before handing them to code outside Qiskit.
+
+        Args:
+            build (Callable[[Target], Any]): the function computing the analysis from the target.
+            key (Hashable): the key the result is cached under.  Defaults to ``build`` itself.
+
+        Returns:
+            The (possibly cached) return value of ``build(self)``.
+        """
+        key = build if key is None else key
+        try:
+            return self._analysis_cache[key]
+        except KeyError:
+            out = self._analysis_cache[key] = build(self)
+            return out
+
+    def _invalidate_analysis(self):
+        """Discard the cached analyses of the target, after it has been modified."""
+        self._analysis_cache = {}
+
     def get_non_global_operation_names(self, strict_direction=False):
         """Return the non-global operation names for the target
 
@@ -359,6 +391,7 @@ class Target(BaseTarget):
         """Set dt and invalidate instruction duration cache"""
         self._dt = dt
         self._instruction_durations = None
+        self._invalidate_analysis()
 
     def add_instruction(self, instruction, properties=None, name=None, *, angle_bounds=None):
         """Add a new instruction to the :class:`~qiskit.transpiler.Target`
@@ -461,6 +494,7 @@ class Target(BaseTarget):
         self._instruction_schedule_map = None
         self._non_global_basis_strict = None
         self._non_global_basis = None
+        self._invalidate_analysis()
 
     def update_instruction_properties(self, instruction, qargs, properties):
         """Update the property object for an instruction qarg pair already in the Target.
@@ -482,6 +516,7 @@ class Target(BaseTarget):
         self._gate_map[instruction][qargs] = properties
         self._instruction_durations = None
         self._instruction_schedule_map = None
+        self._invalidate_analysis()
 
     def qargs_for_operation_name(self, operation):
         """Get the qargs for a given operation name
@@ -766,6 +801,7 @@ class Target(BaseTarget):
         self._coupling_graph = state["coupling_graph"]
         self._instruction_durations = state["instruction_durations"]
         self._instruction_schedule_map = state["instruction_schedule_map"]
+        self._analysis_cache = {}
         super().__setstate__(state["base"])
 
     def seconds_to_dt(self, duration: float) -> int:
@@ -0,0 +1,371 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Content-addressed cache of transpiled circuits."""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from qiskit.circuit import QuantumCircuit
+from qiskit.version import VERSION as _QISKIT_VERSION
+from .coupling import CouplingMap
+from .target import Target
+
+logger = logging.getLogger(__name__)
+
+_KEY_CIRCUIT_NAME = "circuit"
+
+
+class _Uncacheable(Exception):
+    """Internal signal that a transpilation request cannot be reliably keyed."""
+
+
+class TranspileCache:
+    """A content-addressed cache of transpiled circuits.
+
+    Transpiling the same circuit against the same :class:`.Target` with the same options always
+    gives the same output (when a seed is fixed), so repeated transpilations of identical circuits
+    can be answered from a cache.  This class stores transpiled circuits keyed on a hash of:
+
+    * the full content of the input circuit other than its name, as serialized by :mod:`.qpy`,
+      including its metadata and the identities of any unbound :class:`.Parameter` objects;
+    * the content of the :class:`.Target` (its instructions, their properties, and the qubit and
+      timing properties of the target);
+    * the transpiler options, including the seed;
+    * the version of Qiskit.
+
+    Pass an instance to the ``cache`` argument of :func:`.transpile`, or use :meth:`run` to cache
+    the output of an arbitrary :class:`.PassManager`.  A cache hit returns a copy of the stored
+    circuit, including its :attr:`~.QuantumCircuit.layout`, without running any passes.
+
+    The in-memory store holds at most ``max_size`` circuits, evicting the least recently used
+    first.  If a ``directory`` is given, every stored circuit is also written to it as a QPY file,
+    and entries missing from memory are looked for there, so the cache persists across processes
+    and sessions.  Circuits with scheduling information (``op_start_times``) are only kept in
+    memory, since this is not represented in QPY.
+
+    Computing the key of a circuit serializes it to QPY, so every lookup, hit or miss, costs time
+    linear in the size of the circuit.  This is far cheaper than transpiling, but means the cache
+    does not help with circuits that are cheap to transpile.  The fingerprint of a
+    :class:`.Target` is memoized on the target, and recomputed only after it is modified with
+    :meth:`.Target.add_instruction` or :meth:`.Target.update_instruction_properties`.  Editing an
+    :class:`.InstructionProperties` of the target in place is not detected, and would cause stale
+    results to be returned.
+
+    Requests that cannot be keyed reliably are transpiled as normal without touching the cache.
+    This includes calls with a ``callback``, and options that are not plain data (such as an
+    explicit :class:`.Layout` object or an :class:`.HLSConfig`).
+
+    .. note::
+
+        If ``seed_transpiler`` is not set, the first output produced for a given input is reused
+        for every subsequent request, rather than each call making its own random choices.
+    """
+
+    def __init__(self, max_size: int = 1024, directory: str | os.PathLike | None = None):
+        """
+        Args:
+            max_size: The maximum number of circuits held in memory.
+            directory: If given, a directory to persist transpiled circuits to, as QPY files.  It
+                is created if it does not exist.
+        """
+        if max_size < 0:
+            raise ValueError(f"max_size must be non-negative, not {max_size}")
+        self._max_size = max_size
+        self._directory = None if directory is None else os.fspath(directory)
+        if self._directory is not None:
+            os.makedirs(self._directory, exist_ok=True)
+        self._entries: collections.OrderedDict[str, QuantumCircuit] = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """The maximum number of circuits held in memory."""
+        return self._max_size
+
+    @property
+    def directory(self) -> str | None:
+        """The directory that transpiled circuits are persisted to, if any."""
+        return self._directory
+
+    @property
+    def hits(self) -> int:
+        """The number of circuits that have been answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of cacheable circuits that were not found in the cache."""
+        return self._misses
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Remove all circuits from the in-memory store.  Files in :attr:`directory` are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def run(
+        self,
+        pass_manager,
+        circuits: QuantumCircuit | list[QuantumCircuit],
+        *,
+        key: str,
+        **run_kwargs,
+    ) -> QuantumCircuit | list[QuantumCircuit]:
+        """Run a pass manager, reusing cached outputs for circuits that have been seen before.
+
+        The pass manager itself cannot be inspected to decide whether two pass managers would
+        produce the same output, so the caller must supply a ``key`` that uniquely identifies the
+        pass-manager configuration, including its target and seed.  Outputs are only shared between
+        calls that use the same ``key``.
+
+        Args:
+            pass_manager: The :class:`.PassManager` to run on the circuits that miss the cache.
+            circuits: The circuit or circuits to transform.
+            key: A string that uniquely identifies the configuration of ``pass_manager``.  The
+                fingerprint returned by :meth:`target_fingerprint` can be used as part of this.
+            run_kwargs: Further keyword arguments to :meth:`.PassManager.run`.
+
+        Returns:
+            The transformed circuit(s), in the same form as :meth:`.PassManager.run`.
+        """
+        if run_kwargs.get("callback") is not None:
+            return pass_manager.run(circuits, **run_kwargs)
+        is_list = isinstance(circuits, list)
+        config = _digest(("pass-manager", key, _QISKIT_VERSION))
+        out = self._run(
+            circuits if is_list else [circuits],
+            config,
+            lambda missing: pass_manager.run(missing, **run_kwargs),
+            run_kwargs.get("output_name"),
+        )
+        return out if is_list else out[0]
+
+    @staticmethod
+    def target_fingerprint(target: Target) -> str:
+        """Get a stable fingerprint of the content of a :class:`.Target`.
+
+        Two targets with the same instructions, instruction properties, qubit properties and timing
+        constraints have the same fingerprint, even in different processes.
+
+        Args:
+            target: The target to fingerprint.
+
+        Returns:
+            A hexadecimal digest.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(
+            repr(
+                (
+                    target.num_qubits,
+                    target.dt,
+                    target.granularity,
+                    target.min_length,
+                    target.pulse_alignment,
+                    target.acquire_alignment,
+                    target.concurrent_measurements,
+                )
+            ).encode()
+        )
+        for qubit_properties in target.qubit_properties or ():
+            hasher.update(
+                repr(
+                    None
+                    if qubit_properties is None
+                    else (qubit_properties.t1, qubit_properties.t2, qubit_properties.frequency)
+                ).encode()
+            )
+        # Walking every instruction and qarg is the expensive part, so it is memoized on the target
+        # and recomputed only after the target's instructions or their properties are modified.
+        hasher.update(target._cached_analysis(_instructions_fingerprint).encode())
+        return hasher.hexdigest()
+
+    def _transpile_config(self, target: Target | None, options: dict[str, Any]) -> str | None:
+        """Get the configuration digest for a call to :func:`.transpile`, or ``None`` if the call
+        cannot be cached."""
+        try:
+            return _digest(
+                (
+                    "transpile",
+                    _QISKIT_VERSION,
+                    None if target is None else self.target_fingerprint(target),
+                    sorted((name, _stable(value)) for name, value in options.items()),
+                )
+            )
+        except _Uncacheable as exc:
+            logger.debug("Not using the transpile cache: %s", exc)
+            return None
+
+    def _run(
+        self,
+        circuits: Sequence[QuantumCircuit],
+        config: str,
+        compute: Callable[[list[QuantumCircuit]], list[QuantumCircuit]],
+        output_name: str | None = None,
+    ) -> list[QuantumCircuit]:
+        """Look up each circuit, computing and storing all the misses in a single batch.
+
+        The name of a circuit is not part of its key, so hits are renamed to ``output_name``, or
+        to the name of the input circuit if that is not given."""
+        keys = [_circuit_key(circuit, config) for circuit in circuits]
+        out = [None if key is None else self._get(key) for key in keys]
+        for circuit, hit in zip(circuits, out):
+            if hit is not None:
+                hit.name = circuit.name if output_name is None else output_name
+        missing = [i for i, circuit in enumerate(out) if circuit is None]
+        with self._lock:
+            self._hits += len(circuits) - len(missing)
+            self._misses += sum(keys[i] is not None for i in missing)
+        if missing:
+            computed = compute([circuits[i] for i in missing])
+            for i, circuit in zip(missing, computed):
+                out[i] = circuit
+                if keys[i] is not None:
+                    self._put(keys[i], circuit)
+        return out
+
+    def _get(self, key: str) -> QuantumCircuit | None:
+        with self._lock:
+            circuit = self._entries.get(key)
+            if circuit is not None:
+                self._entries.move_to_end(key)
+        if circuit is None and self._directory is not None:
+            circuit = self._load(key)
+            if circuit is not None:
+                self._insert(key, circuit)
+        # Hand out copies so that the caller can't mutate the stored circuit.
+        return None if circuit is None else circuit.copy()
+
+    def _put(self, key: str, circuit: QuantumCircuit) -> None:
+        self._insert(key, circuit.copy())
+        if self._directory is not None and circuit._op_start_times is None:
+            self._store(key, circuit)
+
+    def _insert(self, key: str, circuit: QuantumCircuit) -> None:
+        with self._lock:
+            self._entries[key] = circuit
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.qpy")
+
+    def _load(self, key: str) -> QuantumCircuit | None:
+        from qiskit import qpy
+
+        try:
+            with open(self._path(key), "rb") as fd:
+                return qpy.load(fd)[0]
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            # A corrupt file, or one from an incompatible Qiskit version, is just a miss.
+            logger.warning("Ignoring unreadable transpile cache entry '%s': %s", key, exc)
+            return None
+
+    def _store(self, key: str, circuit: QuantumCircuit) -> None:
+        from qiskit import qpy
+
+        # Write to a temporary file and atomically move it into place, so concurrent readers never
+        # see a partially written entry.
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file_obj:
+                qpy.dump(circuit, file_obj)
+            os.replace(tmp_path, self._path(key))
+        except Exception as exc:
+            logger.warning("Could not persist transpile cache entry '%s': %s", key, exc)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(repr(value).encode()).hexdigest()
+
+
+def _circuit_key(circuit: QuantumCircuit, config: str) -> str | None:
+    """Get the cache key of a circuit, or ``None`` if it cannot be serialized.
+
+    This serializes the whole circuit to QPY, so it costs time linear in the circuit size on every
+    lookup, whether or not the lookup hits."""
+    from qiskit import qpy
+
+    hasher = hashlib.sha256(config.encode())
+    buffer = io.BytesIO()
+    try:
+        # Unnamed circuits get a globally unique name, so the name can't be part of the key.
+        qpy.dump(circuit.copy(name=_KEY_CIRCUIT_NAME), buffer)
+    except Exception as exc:
+        logger.debug("Not caching circuit '%s', which QPY cannot serialize: %s", circuit.name, exc)
+        return None
+    hasher.update(buffer.getbuffer())
+    return hasher.hexdigest()
+
+
+def _instructions_fingerprint(target: Target) -> str:
+    hasher = hashlib.sha256()
+    for name in sorted(target.operation_names):
+        hasher.update(repr((name, _operation_key(target.operation_from_name(name)))).encode())
+        properties = target[name]
+        for qargs in sorted(properties, key=lambda q: (q is not None, q or ())):
+            props = properties[qargs]
+            hasher.update(
+                repr((qargs, None if props is None else (props.duration, props.error))).encode()
+            )
+    return hasher.hexdigest()
+
+
+def _operation_key(operation: Any) -> tuple:
+    if isinstance(operation, type):
+        # A globally defined variadic operation.
+        return ("class", operation.__module__, operation.__qualname__)
+    return (
+        type(operation).__qualname__,
+        operation.name,
+        operation.num_qubits,
+        operation.num_clbits,
+        tuple(repr(param) for param in getattr(operation, "params", ())),
+    )
+
+
+def _stable(value: Any) -> Any:
+    """Convert a transpiler option into a form whose ``repr`` is stable between processes."""
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_stable(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted(repr(_stable(item)) for item in value)))
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted((repr(_stable(k)), _stable(v)) for k, v in value.items())))
+    if isinstance(value, CouplingMap):
+        return ("coupling", value.size(), tuple(sorted(value.get_edges())))
+    raise _Uncacheable(f"option of type '{type(value).__name__}' cannot be fingerprinted")
@@ -3041,6 +3041,101 @@ class TestTranspileParallel(QiskitTestCase):
         for circ in res:
             self.assertIsInstance(circ, QuantumCircuit)
 
+    @data(0, 1, 2, 3)
+    def test_parallel_executor(self, opt_level):
+        """Test that a reusable executor gives the same output as running the pass manager."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure_all()
+        pm = generate_preset_pass_manager(
+            opt_level, backend=GenericBackendV2(num_qubits=4, seed=42), seed_transpiler=42
+        )
+        expected = pm.run([qc, qc])
+        with pm.executor(num_processes=2) as executor:
+            for _ in range(3):
+                self.assertEqual(executor.run([qc, qc]), expected)
+
+    @data(0, 1, 2, 3)
+    def test_parallel_run_iter(self, opt_level):
+        """Test that streaming transpilation gives the same output as a batch run."""
+        circuits = []
+        for num_qubits in range(2, 5):
+            qc = QuantumCircuit(num_qubits)
+            qc.h(0)
+            for i in range(1, num_qubits):
+                qc.cx(0, i)
+            qc.measure_all()
+            circuits.append(qc)
+        pm = generate_preset_pass_manager(
+            opt_level, backend=GenericBackendV2(num_qubits=4, seed=42), seed_transpiler=42
+        )
+        expected = pm.run(circuits)
+        out = list(pm.run_iter(iter(circuits), num_processes=2, max_in_flight=2))
+        self.assertEqual(out, expected)
+
+    @data(0, 1, 2, 3)
+    def test_parallel_thread_mode(self, opt_level):
+        """Test that thread-based parallel transpilation matches the serial output."""
+        circuits = []
+        for num_qubits in range(2, 5):
+            qc = QuantumCircuit(num_qubits)
+            qc.h(0)
+            for i in range(1, num_qubits):
+                qc.cx(0, i)
+            qc.measure_all()
+            circuits.append(qc)
+        target = GenericBackendV2(num_qubits=5, seed=42).target
+        with should_run_in_parallel.override(False):
+            expected = transpile(
+                circuits, target=target, optimization_level=opt_level, seed_transpiler=42
+            )
+        out = transpile(
+            circuits,
+            target=target,
+            optimization_level=opt_level,
+            seed_transpiler=42,
+            num_processes=2,
+            parallel_mode="thread",
+        )
+        self.assertEqual(out, expected)
+
+    def test_preset_pass_manager_thread_mode(self):
+        """Test that a preset pass manager can be run on threads, with a callback."""
+        circuits = []
+        for num_qubits in range(2, 5):
+            qc = QuantumCircuit(num_qubits)
+            qc.h(0)
+            for i in range(1, num_qubits):
+                qc.cx(0, i)
+            qc.measure_all()
+            circuits.append(qc)
+        pm = generate_preset_pass_manager(
+            2, target=GenericBackendV2(num_qubits=5, seed=42).target, seed_transpiler=42
+        )
+        with should_run_in_parallel.override(False):
+            expected = pm.run(circuits)
+        with pm.executor(num_processes=2, mode="thread") as executor:
+            self.assertEqual(executor.run(circuits), expected)
+
+        passes = []
+        out = pm.run(
+            circuits,
+            output_name="out",
+            callback=lambda **kwargs: passes.append(kwargs["pass_"]),
+            num_processes=2,
+            parallel_mode="thread",
+        )
+        self.assertEqual([circuit.name for circuit in out], ["out"] * len(circuits))
+        self.assertEqual(out, expected)
+        self.assertTrue(passes)
+
+    def test_thread_mode_shares_target(self):
+        """Test that the preset pass managers declare their target as shareable between threads."""
+        target = GenericBackendV2(num_qubits=5, seed=42).target
+        pm = generate_preset_pass_manager(2, target=target)
+        self.assertTrue(any(obj is target for obj in pm._thread_shared_objects()))
+
     @data(0, 1, 2, 3)
     def test_parallel_with_target(self, opt_level):
         """Test that parallel dispatch works with a manual target."""
@@ -13,10 +13,18 @@
 
 """Pass manager test cases."""
 
+import json
+
 from test.python.passmanager import PassManagerTestCase
 
-from qiskit.passmanager import GenericPass, BasePassManager
+from qiskit.passmanager import (
+    GenericPass,
+    BasePassManager,
+    PassManagerError,
+    PassManagerProfiler,
+)
 from qiskit.passmanager.flow_controllers import DoWhileController, ConditionalController
+from qiskit.utils import should_run_in_parallel
 
 
 class RemoveFive(GenericPass):
@@ -41,6 +49,9 @@ class ToyPassManager(BasePassManager):
     def _passmanager_backend(self, passmanager_ir, in_program, **kwargs):
         return int(passmanager_ir)
 
+    def _passmanager_ir_size(self, passmanager_ir):
+        return len(passmanager_ir)
+
 
 class TestPassManager(PassManagerTestCase):
     def test_single_task(self):
@@ -167,3 +178,178 @@ class TestPassManager(PassManagerTestCase):
 
         pm = IntPassManager([ZeroPass()])
         self.assertEqual(pm.run(5), 0)
+
+
+class TestPassManagerExecutor(PassManagerTestCase):
+    """Tests of the reusable pass-manager executor."""
+
+    def setUp(self):
+        super().setUp()
+
+        # Force parallel execution so the executor starts worker processes.
+        cm = should_run_in_parallel.override(True)
+        cm.__enter__()
+        self.addCleanup(cm.__exit__, None, None, None)
+
+    def test_run_many_batches(self):
+        """Test that the executor can be reused for several batches."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        with pm.executor(num_processes=2) as executor:
+            self.assertTrue(executor.parallel)
+            self.assertEqual(executor.run([12345, 555, 51]), [12340, 0, 10])
+            self.assertEqual(executor.run([5, 15]), [0, 10])
+            self.assertEqual(executor.run(1235), 1230)
+
+    def test_matches_serial_run(self):
+        """Test that the executor gives the same results as the pass manager."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        programs = list(range(40, 60))
+        with pm.executor(num_processes=2) as executor:
+            self.assertEqual(executor.run(programs), pm.run(programs, num_processes=1))
+
+    def test_serial_fallback(self):
+        """Test that no processes are started if parallelism is disabled."""
+        pm = ToyPassManager([RemoveFive()])
+        with should_run_in_parallel.override(False), pm.executor(num_processes=2) as executor:
+            self.assertFalse(executor.parallel)
+            self.assertEqual(executor.run([125, 51]), [12, 1])
+
+    def test_run_iter_ordered(self):
+        """Test that the streaming interface consumes a generator and preserves order."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        expected = pm.run(list(range(100)), num_processes=1)
+        out = pm.run_iter((x for x in range(100)), num_processes=2, max_in_flight=3)
+        self.assertEqual(list(out), expected)
+
+    def test_run_iter_unordered(self):
+        """Test that the unordered streaming interface returns every output."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        expected = pm.run(list(range(100)), num_processes=1)
+        with pm.executor(num_processes=2) as executor:
+            out = executor.run_iter(iter(range(100)), ordered=False)
+            self.assertEqual(sorted(out), sorted(expected))
+
+    def test_run_iter_is_lazy(self):
+        """Test that the streaming interface only consumes a bounded number of inputs."""
+        consumed = []
+
+        def programs():
+            for x in range(100):
+                consumed.append(x)
+                yield x
+
+        pm = ToyPassManager([AddDigit()])
+        with pm.executor(num_processes=2) as executor:
+            out = executor.run_iter(programs(), max_in_flight=4)
+            self.assertEqual(next(out), 0)
+            self.assertLessEqual(len(consumed), 5)
+            out.close()
+
+    def test_thread_mode(self):
+        """Test that the thread-based executor matches the serial output."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        programs = list(range(40, 60))
+        expected = pm.run(programs, num_processes=1)
+        with pm.executor(num_processes=3, mode="thread") as executor:
+            self.assertTrue(executor.parallel)
+            self.assertEqual(executor.mode, "thread")
+            self.assertEqual(executor.run(programs), expected)
+            self.assertEqual(list(executor.run_iter(iter(programs))), expected)
+        self.assertEqual(pm.run(programs, num_processes=3, parallel_mode="thread"), expected)
+
+    def test_thread_mode_ignores_process_settings(self):
+        """Test that thread mode doesn't depend on the process-parallelism settings."""
+        pm = ToyPassManager([RemoveFive()])
+        with should_run_in_parallel.override(False), pm.executor(2, mode="thread") as executor:
+            self.assertTrue(executor.parallel)
+            self.assertEqual(executor.run([125, 51]), [12, 1])
+
+    def test_invalid_mode(self):
+        """Test that an unknown parallel mode is rejected."""
+        pm = ToyPassManager([RemoveFive()])
+        with self.assertRaisesRegex(ValueError, "unknown"):
+            pm.executor(2, mode="fibers")
+        with self.assertRaisesRegex(ValueError, "unknown"):
+            pm.run([1, 2], parallel_mode="fibers")
+
+    def test_run_after_shutdown(self):
+        """Test that using an executor after it has been shut down raises."""
+        pm = ToyPassManager([RemoveFive()])
+        executor = pm.executor(num_processes=2)
+        executor.shutdown()
+        with self.assertRaises(PassManagerError):
+            executor.run([1, 2])
+
+
+class TestPassManagerProfiler(PassManagerTestCase):
+    """Tests of the pass-manager profiler."""
+
+    def test_records_every_execution(self):
+        """Test that every pass execution is recorded, including loop iterations."""
+
+        def _condition(property_set):
+            return property_set["ndigits"] < 7
+
+        pm = ToyPassManager(
+            [RemoveFive(), DoWhileController([AddDigit(), CountDigits()], do_while=_condition)]
+        )
+        with PassManagerProfiler() as profiler:
+            self.assertEqual(pm.run(12345), 1234000)
+        self.assertEqual(
+            [record.name for record in profiler.records],
+            [
+                "RemoveFive",
+                "AddDigit",
+                "CountDigits",
+                "AddDigit",
+                "CountDigits",
+                "AddDigit",
+                "CountDigits",
+            ],
+        )
+        first = profiler.records[0]
+        self.assertEqual((first.size_before, first.size_after), (5, 4))
+        summary = profiler.summary()
+        self.assertEqual(summary["AddDigit"]["count"], 3)
+        self.assertEqual(summary["AddDigit"]["size_change"], 3)
+        self.assertEqual(summary["CountDigits"]["size_change"], 0)
+
+    def test_inactive_profiler_records_nothing(self):
+        """Test that nothing is recorded outside the profiler context."""
+        pm = ToyPassManager([RemoveFive()])
+        profiler = PassManagerProfiler()
+        with profiler:
+            pm.run(1)
+        pm.run(2)
+        self.assertEqual(len(profiler.records), 1)
+
+    def test_parallel_processes(self):
+        """Test that records are gathered from worker processes."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        with should_run_in_parallel.override(True), PassManagerProfiler() as profiler:
+            pm.run(list(range(10)), num_processes=2)
+            with pm.executor(num_processes=2) as executor:
+                executor.run(list(range(10)))
+                list(executor.run_iter(range(10), ordered=False))
+        self.assertEqual(len(profiler.records), 60)
+
+    def test_parallel_threads(self):
+        """Test that records are gathered from worker threads."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        with PassManagerProfiler() as profiler:
+            pm.run(list(range(10)), num_processes=2, parallel_mode="thread")
+        self.assertEqual(len(profiler.records), 20)
+
+    def test_exports(self):
+        """Test the JSON and Chrome-trace exports."""
+        pm = ToyPassManager([RemoveFive(), AddDigit()])
+        with PassManagerProfiler() as profiler:
+            pm.run([15, 25])
+        data = json.loads(profiler.to_json())
+        self.assertEqual(len(data["records"]), 4)
+        self.assertEqual(data["summary"]["RemoveFive"]["count"], 2)
+        trace = profiler.to_chrome_trace()
+        self.assertEqual(len(trace["traceEvents"]), 4)
+        for event in trace["traceEvents"]:
+            self.assertEqual(event["ph"], "X")
+            self.assertGreaterEqual(event["dur"], 0)
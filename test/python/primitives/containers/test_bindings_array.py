@@ -114,6 +114,53 @@ class BindingsArrayTestCase(QiskitTestCase):
         for idx in np.ndindex((2, 3)):
             self.assertEqual(bound_circuits[idx], self.circuit.assign_parameters(vals[idx]))
 
+    def test_bind_all_names(self):
+        """Test binding all values given by parameter names, in a different order"""
+        vals = np.linspace(0, 1, 300).reshape((2, 3, 50))
+        names = tuple(param.name for param in self.circuit.parameters)
+        bound_circuits = BindingsArray({names[::-1]: vals[..., ::-1]}).bind_all(self.circuit)
+        for idx in np.ndindex((2, 3)):
+            self.assertEqual(bound_circuits[idx], self.circuit.assign_parameters(vals[idx]))
+
+    def test_evaluate_parameters(self):
+        """Test evaluating parameter expressions for all values at once"""
+        a, b = Parameter("a"), Parameter("b")
+        expressions = [
+            a,
+            2 * a + b,
+            a - b,
+            1 - a,
+            2 / (b + 3),
+            b**2 - a / 4,
+            (a + 1) ** b,
+            (a * b).sin() + a.cos(),
+            (b / 3).arctan() - (a / 2).arcsin(),
+            (a + 2).log() * (-b).exp(),
+            abs(a - 0.5) + a.sign(),
+        ]
+        circuit = QuantumCircuit(1, global_phase=a - b)
+        for expression in expressions:
+            circuit.rz(expression, 0)
+        circuit.x(0)
+        circuit.u(a, 0.5, b, 0)
+
+        rng = np.random.default_rng(5)
+        vals = rng.uniform(0.1, 0.9, size=(4, 5, 2))
+        bindings = BindingsArray({(a, b): vals})
+        global_phase, values = bindings.evaluate_parameters(circuit)
+        self.assertEqual(global_phase.shape, (4, 5))
+        self.assertEqual(
+            set(values), {(index, 0) for index in range(len(expressions))} | {(12, 0), (12, 2)}
+        )
+        for idx in np.ndindex((4, 5)):
+            bound = bindings.bind(circuit, idx)
+            self.assertAlmostEqual(global_phase[idx], float(bound.global_phase))
+            for (instruction, index), value in values.items():
+                self.assertAlmostEqual(value[idx], float(bound.data[instruction].params[index]))
+
+        with self.assertRaises(ValueError):
+            BindingsArray({a: vals[..., 0]}).evaluate_parameters(circuit)
+
     def test_ravel(self):
         """Test ravel"""
         vals = np.linspace(0, 1, 300).reshape((2, 3, 50))
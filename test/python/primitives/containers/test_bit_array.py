@@ -12,15 +12,19 @@
 
 """Unit tests for BitArray."""
 
+import os
+import tempfile
 from itertools import product
 from test import QiskitTestCase
+from unittest.mock import patch
 
 import ddt
 import numpy as np
 
 from qiskit.primitives.containers import BitArray
-from qiskit.quantum_info import Pauli, SparsePauliOp
-from qiskit.result import Counts
+from qiskit.primitives.containers import bit_array as bit_array_module
+from qiskit.quantum_info import Pauli, SparseObservable, SparsePauliOp
+from qiskit.result import Counts, sampled_expectation_value
 
 
 def u_8(arr):
@@ -852,3 +856,57 @@ class BitArrayTestCase(QiskitTestCase):
                 with self.subTest(dataname + "_" + name):
                     with self.assertRaises(error):
                         bit_array.postselect(indices, selection)
+
+    def test_from_file(self):
+        """Test memory-mapped bit arrays and chunked reductions."""
+        rng = np.random.default_rng(1234)
+        bool_array = rng.integers(0, 2, size=(2, 3, 40, 70), dtype=bool)
+        bit_array = BitArray.from_bool_array(bool_array)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "bits.bin")
+            bit_array.to_file(filename)
+            mapped = BitArray.from_file(filename, 70, shape=(2, 3))
+            self.assertIsInstance(mapped.array, np.memmap)
+            self.assertEqual(mapped, bit_array)
+
+            with patch.object(bit_array_module, "_CHUNK_BYTES", 45):
+                self.assertEqual(mapped.get_counts(), bit_array.get_counts())
+                self.assertEqual(mapped.get_int_counts((1, 2)), bit_array.get_int_counts((1, 2)))
+                np.testing.assert_array_equal(mapped.bitcount(), bool_array.sum(axis=-1))
+                self.assertEqual(mapped.slice_bits([0, 69, 3]), bit_array.slice_bits([0, 69, 3]))
+                np.testing.assert_allclose(
+                    mapped.expectation_values("Z" * 70), bit_array.expectation_values("Z" * 70)
+                )
+            del mapped
+
+            bit_array[0, 0].to_file(filename)
+            bit_array[1, 2].to_file(filename, append=True)
+            mapped = BitArray.from_file(filename, 70)
+            self.assertEqual(mapped.num_shots, 80)
+            self.assertEqual(mapped, BitArray.concatenate_shots([bit_array[0, 0], bit_array[1, 2]]))
+            del mapped
+
+            with self.assertRaisesRegex(ValueError, "whole number of shots"):
+                BitArray.from_file(filename, 70, shape=(3,))
+
+    def test_expectation_values_many_terms(self):
+        """Test expectation values of observables with many diagonal terms."""
+        rng = np.random.default_rng(42)
+        num_bits = 70
+        bit_array = BitArray.from_bool_array(rng.integers(0, 2, size=(2, 100, num_bits)) > 0)
+        terms = [
+            (
+                "".join(rng.choice(list("IZ01"), size=num_bits, p=[0.6, 0.38, 0.01, 0.01])),
+                rng.normal(),
+            )
+            for _ in range(50)
+        ]
+        observable = SparseObservable.from_list(terms)
+        expvals = bit_array.reshape(2, 1).expectation_values(
+            [observable, SparseObservable.identity(num_bits)]
+        )
+        for loc in range(2):
+            counts = bit_array.get_counts(loc)
+            expected = sampled_expectation_value(counts, observable)
+            self.assertAlmostEqual(expvals[loc, 0], expected)
+            self.assertAlmostEqual(expvals[loc, 1], 1)
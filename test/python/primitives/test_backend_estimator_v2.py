@@ -528,6 +528,29 @@ class TestBackendEstimatorV2(QiskitTestCase):
             {"target_precision": 0.1, "shots": 100, "circuit_metadata": qc2.metadata},
         )
 
+    def test_measurement_circuits_shared(self):
+        """Test that measurement bases are grouped and transpiled once per run."""
+        theta = Parameter("θ")
+        qc = QuantumCircuit(2)
+        qc.ry(theta, 0)
+        qc.cx(0, 1)
+        observable = SparsePauliOp(["ZZ", "ZI", "XX", "YY"], [1.0, 0.5, -1.0, 0.25])
+        values = np.linspace(0, np.pi, 10)
+        backend = BasicSimulator()
+        estimator = BackendEstimatorV2(backend=backend, options=self._options)
+        with patch.object(
+            estimator._passmanager, "run", wraps=estimator._passmanager.run
+        ) as mock_run:
+            result = estimator.run(
+                [(qc, observable, values[:, None]), (qc, ["XX", "ZZ"], values[:3, None, None])],
+                precision=0.05,
+            ).result()
+        self.assertEqual(mock_run.call_count, 1)
+        self.assertEqual(len(mock_run.call_args.args[0]), 3)
+        expected = StatevectorEstimator().run([(qc, observable, values[:, None])]).result()
+        np.testing.assert_allclose(result[0].data.evs, expected[0].data.evs, atol=0.3)
+        self.assertEqual(result[1].data.evs.shape, (3, 2))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -25,7 +25,11 @@ from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.circuit import Parameter
 from qiskit.circuit.library import real_amplitudes, UnitaryGate
 from qiskit.primitives import PrimitiveResult, PubResult, StatevectorSampler
-from qiskit.primitives.backend_sampler_v2 import BackendSamplerV2
+from qiskit.primitives.backend_sampler_v2 import (
+    BackendSamplerV2,
+    _memory_array,
+    _register_bytes,
+)
 from qiskit.primitives.containers import BitArray
 from qiskit.primitives.containers.data_bin import DataBin
 from qiskit.primitives.containers.sampler_pub import SamplerPub
@@ -913,6 +917,25 @@ class TestBackendSamplerV2(QiskitTestCase):
         self.assertEqual(result[0].metadata, {"shots": 10, "circuit_metadata": qc.metadata})
         self.assertEqual(result[1].metadata, {"shots": 20, "circuit_metadata": qc2.metadata})
 
+    def test_memory_to_registers(self):
+        """Test decoding hexadecimal and pre-packed memory into register bit arrays."""
+        num_bits = 21
+        rng = np.random.default_rng(self._seed)
+        values = rng.integers(0, 2**num_bits, size=(2, 7)).tolist()
+        values[0][0] = 0
+        memory = [[hex(value) for value in row] for row in values]
+        num_bytes = 3
+        unpacked = _memory_array(memory, 7, num_bytes)
+        self.assertEqual(unpacked.shape, (2, 7, num_bytes))
+        for start, size in [(0, 21), (0, 5), (3, 8), (5, 13), (9, 12), (20, 1)]:
+            with self.subTest(start=start, size=size):
+                bit_array = BitArray(_register_bytes(unpacked, start, size), size)
+                for i, row in enumerate(values):
+                    expected = [format((value >> start) % 2**size, f"0{size}b") for value in row]
+                    self.assertEqual(bit_array.get_bitstrings(i), expected)
+        packed = [unpacked[0], np.pad(unpacked[1], ((0, 0), (2, 0)))]
+        np.testing.assert_array_equal(_memory_array(packed, 7, num_bytes), unpacked)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -13,6 +13,8 @@
 """Tests for Estimator."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 from test import QiskitTestCase
 
 import numpy as np
@@ -315,6 +317,90 @@ class TestStatevectorEstimator(QiskitTestCase):
             result[1].metadata, {"target_precision": 0.1, "circuit_metadata": qc2.metadata}
         )
 
+    def test_batched_matches_elementwise(self):
+        """Test that batched simulation agrees with simulating each element separately."""
+        a, b = Parameter("a"), Parameter("b")
+        inner = QuantumCircuit(2)
+        inner.rzz(a - b, 0, 1)
+        inner.crx(2 * b, 1, 0)
+        qc = QuantumCircuit(3)
+        qc.h(range(3))
+        qc.append(real_amplitudes(num_qubits=2, reps=1), [2, 0])
+        qc.append(inner.to_gate(), [1, 2])
+        qc.ry(a, 1)
+        qc.barrier()
+        qc.cswap(0, 1, 2)
+        rng = np.random.default_rng(5)
+        values = rng.uniform(-np.pi, np.pi, size=(4, 1, qc.num_parameters))
+        values[2, 0] = values[0, 0]
+        observables = [
+            SparsePauliOp(["XYZ", "ZZI", "III"], [0.5, -1.0, 0.25]),
+            "YIX",
+            {"ZIZ": 2.0, "XXX": 1.5},
+        ]
+        pub = EstimatorPub.coerce((qc, observables, values), precision=0)
+        rng = np.random.default_rng(0)
+        batched = StatevectorEstimator._batched_expectation_values(pub)
+        elementwise = StatevectorEstimator._elementwise_expectation_values(pub, rng)
+        self.assertEqual(batched.shape, (4, 3))
+        np.testing.assert_allclose(batched, elementwise, atol=1e-10)
+
+    def test_batched_chunks(self):
+        """Test that simulating the parameter sets in several chunks gives the same values."""
+        theta, phi = Parameter("θ"), Parameter("φ")
+        qc = QuantumCircuit(3)
+        qc.ry(theta, 0)
+        qc.cx(0, 1)
+        qc.rx(phi, 2)
+        qc.cz(1, 2)
+        values = np.random.default_rng(3).uniform(-np.pi, np.pi, size=(5, 1, 2))
+        pub = EstimatorPub.coerce((qc, ["ZZI", "XIY", "IIZ"], values))
+        expected = StatevectorEstimator._batched_expectation_values(pub)
+        # Each chunk holds two 3-qubit statevectors.
+        with patch("qiskit.primitives.utils._MAX_BATCH_AMPLITUDES", 16):
+            chunked = StatevectorEstimator._batched_expectation_values(pub)
+        np.testing.assert_allclose(chunked, expected, atol=1e-12)
+
+    def test_batched_projectors(self):
+        """Test that observables with projectors are supported."""
+        theta = Parameter("θ")
+        qc = QuantumCircuit(1)
+        qc.ry(theta, 0)
+        values = np.linspace(0, np.pi, 5)
+        estimator = StatevectorEstimator()
+        result = estimator.run([(qc, ["0", "Z"], values[:, None, None])]).result()
+        evs = result[0].data.evs
+        self.assertEqual(evs.shape, (5, 2))
+        np.testing.assert_allclose(evs[:, 0], (1 + evs[:, 1]) / 2, atol=1e-12)
+        np.testing.assert_allclose(evs[:, 1], np.cos(values), atol=1e-12)
+
+    def test_executor(self):
+        """Test that running on an executor gives the same results as running serially."""
+        theta = Parameter("θ")
+        qc = QuantumCircuit(2)
+        qc.ry(theta, 0)
+        qc.cx(0, 1)
+        values = np.linspace(0, np.pi, 6).reshape(3, 2, 1)
+        pubs = [
+            (qc, ["ZZ", "XX"], values),
+            (qc, [["ZI"], ["IZ"], ["XY"]], values),
+            (qc, "ZZ", [0.5]),
+            (self.ansatz, self.observable, [[0, 1, 1, 2, 3, 5]] * 4),
+        ]
+        expected = StatevectorEstimator().run(pubs).result()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for max_parallel_slices in (1, 2, 4):
+                with self.subTest(max_parallel_slices=max_parallel_slices):
+                    estimator = StatevectorEstimator(
+                        executor=executor, max_parallel_slices=max_parallel_slices
+                    )
+                    result = estimator.run(pubs).result()
+                    self.assertEqual(len(result), len(expected))
+                    for actual_pub, expected_pub in zip(result, expected):
+                        np.testing.assert_allclose(actual_pub.data.evs, expected_pub.data.evs)
+                        self.assertEqual(actual_pub.data.stds.shape, expected_pub.data.evs.shape)
+                        self.assertEqual(actual_pub.metadata, expected_pub.metadata)
+
     def test_reset(self):
         """Test for circuits with reset."""
         qc = QuantumCircuit(2)
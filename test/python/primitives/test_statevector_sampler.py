@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
 
 import numpy as np
 from numpy.typing import NDArray
@@ -28,6 +30,7 @@ from qiskit.primitives.containers.data_bin import DataBin
 from qiskit.primitives.containers.sampler_pub import SamplerPub
 from qiskit.primitives.statevector_sampler import StatevectorSampler
 from qiskit.providers import JobStatus
+from qiskit.quantum_info import Statevector
 from test import QiskitTestCase
 
 
@@ -661,6 +664,87 @@ class TestStatevectorSampler(QiskitTestCase):
         self.assertEqual(result[0].metadata, {"shots": 10, "circuit_metadata": qc.metadata})
         self.assertEqual(result[1].metadata, {"shots": 20, "circuit_metadata": qc2.metadata})
 
+    def test_bit_packing(self):
+        """Test that outcomes are packed into the right bits of wide, permuted registers."""
+        qc = QuantumCircuit(QuantumRegister(10), ClassicalRegister(13, "c"))
+        qc.x([0, 3, 4, 9])
+        qc.barrier()
+        mapping = {0: 12, 1: 0, 3: 8, 4: 7, 5: 1, 9: 3}
+        for qubit, clbit in mapping.items():
+            qc.measure(qubit, clbit)
+        expected = ["0"] * 13
+        for qubit, clbit in mapping.items():
+            if qubit in (0, 3, 4, 9):
+                expected[-1 - clbit] = "1"
+        sampler = StatevectorSampler(seed=self._seed)
+        result = sampler.run([qc], shots=5).result()
+        self.assertEqual(result[0].data.c.get_bitstrings(), ["".join(expected)] * 5)
+
+    def test_matches_sample_memory(self):
+        """Test that the samples are those of ``Statevector.sample_memory`` with the same seed."""
+        param = Parameter("x")
+        qc = QuantumCircuit(3)
+        qc.h(0)
+        qc.ry(param, 1)
+        qc.cx(1, 2)
+        qc.measure_all()
+        values = [[0.3], [1.2], [0.3]]
+        sampler = StatevectorSampler(seed=self._seed)
+        result = sampler.run([(qc, values)], shots=100).result()
+        bound = qc.remove_final_measurements(inplace=False)
+        for index, value in enumerate(values):
+            state = Statevector(bound.assign_parameters(value))
+            state.seed(self._seed)
+            expected = list(state.sample_memory(100))
+            self.assertEqual(result[0].data.meas.get_bitstrings(index), expected)
+
+    def test_probabilities_in_chunks(self):
+        """Test that reducing the states to probabilities in several chunks gives the same
+        samples."""
+        param = Parameter("x")
+        qc = QuantumCircuit(3, 2)
+        qc.h(0)
+        qc.ry(param, 1)
+        qc.cx(1, 2)
+        qc.measure([2, 0], [0, 1])
+        values = [[0.3], [1.2], [2.5], [0.3], [-0.7]]
+        expected = StatevectorSampler(seed=self._seed).run([(qc, values)], shots=50).result()
+        # Each chunk holds two 3-qubit statevectors.
+        with patch("qiskit.primitives.utils._MAX_BATCH_AMPLITUDES", 16):
+            chunked = StatevectorSampler(seed=self._seed).run([(qc, values)], shots=50).result()
+        self.assertEqual(chunked[0].data.c, expected[0].data.c)
+
+    def test_executor(self):
+        """Test that running on an executor gives the same results as running serially."""
+        param = Parameter("x")
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.ry(param, 1)
+        qc.cx(0, 1)
+        qc.measure_all()
+        values = np.linspace(0, np.pi, 10).reshape(5, 2, 1)
+        pubs = [(qc, values), (qc, [0.5], 30), (qc, values[0])]
+        expected = StatevectorSampler(seed=self._seed).run(pubs, shots=50).result()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for max_parallel_slices in (1, 2, 5, 8):
+                with self.subTest(max_parallel_slices=max_parallel_slices):
+                    sampler = StatevectorSampler(
+                        seed=self._seed,
+                        executor=executor,
+                        max_parallel_slices=max_parallel_slices,
+                    )
+                    result = sampler.run(pubs, shots=50).result()
+                    self.assertEqual(len(result), len(expected))
+                    for actual_pub, expected_pub in zip(result, expected):
+                        self.assertEqual(actual_pub.data.shape, expected_pub.data.shape)
+                        self.assertEqual(actual_pub.data.meas, expected_pub.data.meas)
+                        self.assertEqual(actual_pub.metadata, expected_pub.metadata)
+
+    def test_invalid_max_parallel_slices(self):
+        """Test that a non-positive number of slices is rejected."""
+        with self.assertRaises(ValueError):
+            StatevectorSampler(max_parallel_slices=0)
+
 
 if __name__ == "__main__":
     unittest.main()
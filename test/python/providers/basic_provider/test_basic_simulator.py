@@ -189,6 +189,96 @@ class TestBasicSimulator(QiskitTestCase, BasicProviderBackendTestMixin):
         for mem in memory:
             self.assertIn(mem, ["10 00", "10 11"])
 
+    def test_memory_matches_counts(self):
+        """Test that sampled memory agrees with the counts, and that counts do not need memory."""
+        qr = QuantumRegister(3, "qr")
+        cr = ClassicalRegister(70, "cr")
+        circ = QuantumCircuit(qr, cr)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.ry(0.4, qr[2])
+        circ.measure(qr[0], cr[0])
+        circ.measure(qr[2], cr[69])
+        circ.measure(qr[1], cr[3])
+        circ.measure(qr[2], cr[3])
+        shots = 200
+        with_memory = self.backend.run(circ, shots=shots, seed_simulator=self.seed, memory=True)
+        result = with_memory.result()
+        memory = result.get_memory()
+        self.assertEqual(len(memory), shots)
+        counts = {}
+        for mem in memory:
+            counts[mem] = counts.get(mem, 0) + 1
+        self.assertEqual(result.get_counts(), counts)
+        for mem in memory:
+            # cr[3] is overwritten by the last measurement of qr[2], which is also in cr[69].
+            self.assertEqual(len(mem), 70)
+            self.assertEqual(mem[0], mem[-4])
+            self.assertEqual(mem.count("1"), 2 * int(mem[0]) + int(mem[-1]))
+
+        without_memory = self.backend.run(circ, shots=shots, seed_simulator=self.seed, memory=False)
+        result = without_memory.result()
+        self.assertEqual(result.get_counts(), counts)
+        self.assertNotIn("memory", result.data(0))
+
+    def test_fused_gates(self):
+        """Test that fusing runs of gates does not change the simulated state."""
+        # pylint: disable=import-outside-toplevel
+        from qiskit.circuit.random import random_circuit
+        from qiskit.quantum_info import Operator
+
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                circ = random_circuit(4, 8, max_operands=3, seed=seed)
+                inverse = QuantumCircuit(4)
+                for instruction in reversed(circ.data):
+                    adjoint = Operator(instruction.operation).adjoint()
+                    inverse.unitary(adjoint, instruction.qubits)
+                circ.compose(inverse, inplace=True)
+                circ.measure_all()
+                counts = self.backend.run(circ, shots=16, seed_simulator=seed).result().get_counts()
+                self.assertEqual(counts, {"0000": 16})
+
+    def test_gates_not_fused_across_reset(self):
+        """Test that gates on either side of a mid-circuit reset are applied in order."""
+        circ = QuantumCircuit(2, 2)
+        circ.h(0)
+        circ.cx(0, 1)
+        circ.reset(0)
+        circ.x(0)
+        circ.cx(0, 1)
+        circ.measure(0, 0)
+        circ.measure(1, 1)
+        counts = self.backend.run(circ, shots=64, seed_simulator=self.seed).result().get_counts()
+        self.assertEqual(set(counts), {"01", "11"})
+        self.assertEqual(sum(counts.values()), 64)
+
+    def test_mid_circuit_measurement_trajectories(self):
+        """Test the distribution and memory of a circuit with mid-circuit measurements and resets."""
+        circ = QuantumCircuit(2, 3)
+        circ.h(0)
+        circ.measure(0, 0)
+        circ.cx(0, 1)
+        circ.reset(0)
+        circ.ry(2 * np.arccos(np.sqrt(0.8)), 0)
+        circ.measure(0, 1)
+        circ.measure(1, 2)
+        shots = 4000
+        result = self.backend.run(circ, shots=shots, seed_simulator=self.seed, memory=True).result()
+        counts = result.get_counts()
+        memory = result.get_memory()
+        self.assertEqual(len(memory), shots)
+        self.assertEqual(sum(counts.values()), shots)
+        self.assertEqual(counts, {key: memory.count(key) for key in set(memory)})
+        # The first and last measurements are always equal.
+        self.assertEqual({key[0] == key[2] for key in counts}, {True})
+        target = {"000": 0.4, "010": 0.1, "101": 0.4, "111": 0.1}
+        self.assertDictAlmostEqual(
+            {key: value / shots for key, value in counts.items()}, target, 0.03
+        )
+        # The shots of each outcome are not grouped together in the memory.
+        self.assertNotEqual(memory, sorted(memory))
+
     def test_unitary(self):
         """Test unitary gate instruction"""
         max_qubits = 4
@@ -445,6 +535,24 @@ class TestBasicSimulator(QiskitTestCase, BasicProviderBackendTestMixin):
         # Should have valid counts
         self.assertEqual(sum(counts.values()), shots)
 
+    def test_clifford_unmeasured_clbits_after_trajectories(self):
+        """Test that the unmeasured clbits of a Clifford circuit read 0, even if it runs after a
+        circuit with mid-circuit measurements in the same job."""
+        mid = QuantumCircuit(1, 2)
+        mid.x(0)
+        mid.measure(0, 0)
+        mid.measure(0, 1)
+        # A non-Clifford gate after the measurements forces per-trajectory simulation.
+        mid.t(0)
+
+        clifford = QuantumCircuit(1, 2)
+        clifford.x(0)
+        clifford.measure(0, 0)
+
+        result = self.backend.run([mid, clifford], shots=10, seed_simulator=self.seed).result()
+        self.assertEqual(result.get_counts(0), {"11": 10})
+        self.assertEqual(result.get_counts(1), {"01": 10})
+
         # --- Qubit Limit & Pathway Tests ---
 
     def test_statevector_qubit_limit_exceeded(self):
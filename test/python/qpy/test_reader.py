@@ -0,0 +1,133 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the lazy QPY reader."""
+
+import gzip
+import io
+import os
+import tempfile
+from unittest import mock
+
+from qiskit import qpy
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.exceptions import QiskitError
+from test import QiskitTestCase
+
+
+class TestQpyReader(QiskitTestCase):
+    """Test qpy.open and QpyReader."""
+
+    def setUp(self):
+        super().setUp()
+        theta = Parameter("θ")
+        self.circuits = []
+        for i in range(6):
+            qc = QuantumCircuit(i + 1, name=f"circuit_{i}", metadata={"index": i})
+            qc.h(0)
+            for j in range(i):
+                qc.cx(j, j + 1)
+            qc.rz(theta * i, 0)
+            qc.measure_all()
+            self.circuits.append(qc)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "circuits.qpy")
+        with open(self.path, "wb") as fd:
+            qpy.dump(self.circuits, fd)
+
+    def test_index_and_slice(self):
+        """Test random access by index and slice."""
+        with qpy.open(self.path) as reader:
+            self.assertEqual(len(reader), 6)
+            self.assertEqual(reader.qpy_version, qpy.QPY_VERSION)
+            self.assertEqual(reader[3], self.circuits[3])
+            self.assertEqual(reader[-1], self.circuits[-1])
+            self.assertEqual(reader[1:5:2], self.circuits[1:5:2])
+            self.assertEqual(reader[::-1], self.circuits[::-1])
+            self.assertEqual(list(reader), self.circuits)
+            self.assertEqual(reader[2].metadata, {"index": 2})
+            with self.assertRaises(IndexError):
+                reader[6]
+            with self.assertRaises(TypeError):
+                reader["0"]
+
+    def test_decodes_only_requested(self):
+        """Test that accessing one circuit does not deserialize the others."""
+        # pylint: disable=import-outside-toplevel
+        from qiskit.qpy import reader as reader_module
+
+        with qpy.open(self.path) as reader:
+            with mock.patch.object(
+                reader_module._qpy, "load", wraps=reader_module._qpy.load
+            ) as mock_load:
+                self.assertEqual(reader[4], self.circuits[4])
+        self.assertEqual(mock_load.call_count, 1)
+        payload = mock_load.call_args.args[0].getvalue()
+        self.assertLess(len(payload), os.path.getsize(self.path))
+
+    def test_matches_load(self):
+        """Test that the reader agrees with qpy.load."""
+        with open(self.path, "rb") as fd:
+            expected = qpy.load(fd)
+        with qpy.open(self.path) as reader:
+            self.assertEqual(reader[:], expected)
+
+    def test_file_objects(self):
+        """Test reading from open file objects, including ones that cannot be memory mapped."""
+        with open(self.path, "rb") as fd:
+            reader = qpy.open(fd)
+            self.assertEqual(reader[0], self.circuits[0])
+            reader.close()
+            self.assertFalse(fd.closed)
+        with open(self.path, "rb") as fd:
+            data = fd.read()
+        self.assertEqual(qpy.open(io.BytesIO(data))[5], self.circuits[5])
+        buffer = io.BytesIO()
+        with gzip.GzipFile(fileobj=buffer, mode="wb") as fd:
+            fd.write(data)
+        buffer.seek(0)
+        with gzip.GzipFile(fileobj=buffer, mode="rb") as fd:
+            self.assertEqual(qpy.open(fd)[2], self.circuits[2])
+
+    def test_offset_in_stream(self):
+        """Test a QPY payload that does not start at the beginning of the file."""
+        with open(self.path, "wb") as fd:
+            fd.write(b"prefix")
+            qpy.dump(self.circuits, fd)
+        with open(self.path, "rb") as fd:
+            fd.seek(6)
+            with qpy.open(fd) as reader:
+                self.assertEqual(reader[1:4], self.circuits[1:4])
+
+    def test_old_version(self):
+        """Test that files without a circuit table are loaded in full on first access."""
+        with open(self.path, "wb") as fd:
+            qpy.dump(self.circuits, fd, version=15)
+        with qpy.open(self.path) as reader:
+            self.assertEqual(reader.qpy_version, 15)
+            self.assertEqual(len(reader), 6)
+            self.assertEqual(reader[2], self.circuits[2])
+            self.assertEqual(reader[-2:], self.circuits[-2:])
+
+    def test_closed(self):
+        """Test that a closed reader cannot be read."""
+        reader = qpy.open(self.path)
+        reader.close()
+        self.assertTrue(reader.closed)
+        with self.assertRaises(ValueError):
+            reader[0]
+
+    def test_invalid_file(self):
+        """Test that a file that is not QPY is rejected."""
+        with self.assertRaises(QiskitError):
+            qpy.open(io.BytesIO(b"not a qpy file at all"))
@@ -0,0 +1,130 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the ArrayCounts class."""
+
+import numpy as np
+
+from qiskit.exceptions import QiskitError
+from qiskit.primitives import BitArray
+from qiskit.result import ArrayCounts, Counts, Result, marginal_counts, models
+from test import QiskitTestCase
+
+
+class TestArrayCounts(QiskitTestCase):
+    """Test the ArrayCounts class."""
+
+    def setUp(self):
+        super().setUp()
+        self.raw_counts = {"0x0": 4, "0x1": 7, "0x2": 10, "0x6": 5, "0x9": 11, "0xD": 9, "0xE": 8}
+        self.creg_sizes = [["c0", 1], ["c1", 3]]
+
+    def test_construction(self):
+        """Test that outcomes are sorted and duplicates combined."""
+        counts = ArrayCounts([5, 1, 5, 3], [1, 2, 3, 4], num_bits=3)
+        self.assertEqual(counts.outcomes.tolist(), [1, 3, 5])
+        self.assertEqual(counts.counts.tolist(), [2, 4, 4])
+        self.assertEqual(counts.shots(), 10)
+        self.assertEqual(len(counts), 3)
+        self.assertEqual(counts[5], 4)
+        self.assertEqual(counts["101"], 4)
+        self.assertEqual(counts["0x3"], 4)
+        self.assertEqual(counts[0], 0)
+        with self.assertRaises(ValueError):
+            ArrayCounts([8], [1], num_bits=3)
+        with self.assertRaises(ValueError):
+            ArrayCounts([1, 2], [1], num_bits=3)
+
+    def test_matches_counts(self):
+        """Test conversion to and from Counts."""
+        expected = Counts(self.raw_counts, creg_sizes=self.creg_sizes, memory_slots=4)
+        counts = ArrayCounts.from_counts(self.raw_counts, 4, self.creg_sizes)
+        self.assertEqual(counts.to_counts(), expected)
+        self.assertEqual(counts.int_outcomes(), expected.int_outcomes())
+        self.assertEqual(counts.hex_outcomes(), expected.hex_outcomes())
+        self.assertEqual(counts.most_frequent(), expected.most_frequent())
+        self.assertEqual(ArrayCounts.from_counts(expected), counts)
+        self.assertEqual(ArrayCounts.from_counts(expected.int_outcomes()).num_bits, 4)
+
+    def test_result(self):
+        """Test getting array counts from a Result."""
+        header = {"creg_sizes": self.creg_sizes, "memory_slots": 4}
+        # Separate experiments, since marginal_counts modifies each one in its copy of the result.
+        exp_results = [
+            models.ExperimentResult(
+                shots=54,
+                success=True,
+                data=models.ExperimentResultData(counts=self.raw_counts),
+                header=dict(header),
+            )
+            for _ in range(2)
+        ]
+        result = Result(
+            backend_name="test_backend",
+            backend_version="1.0.0",
+            job_id="job-123",
+            success=True,
+            results=exp_results,
+        )
+        counts = result.get_array_counts(0)
+        self.assertEqual(counts.to_counts(), result.get_counts(0))
+        self.assertEqual(len(result.get_array_counts()), 2)
+        marginal = counts.marginalize([0, 2])
+        self.assertEqual(marginal.to_counts(), marginal_counts(result, [0, 2]).get_counts(0))
+        self.assertEqual(marginal.creg_sizes, [["c0", 1], ["c1", 1]])
+
+    def test_merge(self):
+        """Test merging two sets of counts."""
+        first = ArrayCounts([0, 2, 7], [1, 2, 3], num_bits=3)
+        second = ArrayCounts([1, 2, 6], [4, 5, 6], num_bits=3)
+        merged = first.merge(second)
+        self.assertEqual(merged.int_outcomes(), {0: 1, 1: 4, 2: 7, 6: 6, 7: 3})
+        self.assertEqual(first + second, merged)
+        with self.assertRaises(ValueError):
+            first.merge(ArrayCounts([0], [1], num_bits=4))
+
+    def test_most_frequent_ties(self):
+        """Test that ties and empty counts are rejected by most_frequent."""
+        with self.assertRaises(QiskitError):
+            ArrayCounts([1, 2], [3, 3], num_bits=2).most_frequent()
+        with self.assertRaises(QiskitError):
+            ArrayCounts([], [], num_bits=2).most_frequent()
+
+    def test_wide_outcomes(self):
+        """Test outcomes of more than 64 bits."""
+        big = (1 << 99) | 5
+        counts = ArrayCounts([big, 3, big, 1 << 70], [1, 2, 3, 4], num_bits=100)
+        self.assertEqual(counts.int_outcomes(), {3: 2, 1 << 70: 4, big: 4})
+        self.assertEqual(counts.outcomes.shape, (3, 13))
+        self.assertEqual(counts[big], 4)
+        with self.assertRaises(QiskitError):
+            counts.most_frequent()
+        self.assertEqual(
+            ArrayCounts([big, 3], [2, 1], num_bits=100).most_frequent(), format(big, "0100b")
+        )
+        marginal = counts.marginalize([0, 2, 99])
+        self.assertEqual(marginal.num_bits, 3)
+        self.assertEqual(marginal.int_outcomes(), {0b001: 2, 0b000: 4, 0b111: 4})
+        wide_marginal = counts.marginalize(range(1, 100))
+        self.assertEqual(wide_marginal.int_outcomes(), {1: 2, 1 << 69: 4, big >> 1: 4})
+
+    def test_bit_array(self):
+        """Test conversion to and from BitArray."""
+        rng = np.random.default_rng(3)
+        for num_bits in (6, 70):
+            bit_array = BitArray.from_bool_array(rng.integers(0, 2, size=(2, 50, num_bits)) > 0)
+            counts = ArrayCounts.from_bit_array(bit_array, 1)
+            self.assertEqual(counts.int_outcomes(), bit_array.get_int_counts(1))
+            self.assertEqual(ArrayCounts.from_bit_array(bit_array).shots(), 100)
+            round_trip = counts.to_bit_array()
+            self.assertEqual(round_trip.num_shots, 50)
+            self.assertEqual(round_trip.get_int_counts(), bit_array.get_int_counts(1))
@@ -14,7 +14,9 @@
 
 import numpy as np
 
+from qiskit.primitives import BitArray
 from qiskit.result import models
+from qiskit.result import marginal_arrays
 from qiskit.result import marginal_counts
 from qiskit.result import marginal_distribution
 from qiskit.result import Result
@@ -369,6 +371,57 @@ class TestResultOperations(QiskitTestCase):
         )
         self.assertEqual(marginal_counts_result.get_counts(0), expected_marginal_counts)
 
+    def test_marginal_arrays_result(self):
+        """Test marginalizing every experiment of a Result into integer arrays."""
+        raw_counts_1 = {"0x0": 4, "0x1": 7, "0x2": 10, "0x6": 5, "0x9": 11, "0xD": 9, "0xE": 8}
+        data_1 = models.ExperimentResultData(counts=raw_counts_1)
+        exp_result_1 = models.ExperimentResult(
+            shots=54, success=True, data=data_1, header={"memory_slots": 4}
+        )
+        result = Result(
+            results=[exp_result_1, self.generate_qiskit_result().results[0]],
+            **self.base_result_args,
+        )
+
+        for max_workers in (1, 2):
+            marginals = marginal_arrays(result, [2, 0], memory=True, max_workers=max_workers)
+            self.assertEqual(len(marginals), 2)
+            self.assertEqual(marginals[0].outcomes.tolist(), [0, 1, 2, 3])
+            self.assertEqual(marginals[0].counts.tolist(), [14, 18, 13, 9])
+            self.assertEqual(marginals[0].num_bits, 2)
+            self.assertIsNone(marginals[0].memory)
+            expected_memory = [(ii & 1) | ((ii >> 2) & 1) << 1 for ii in range(8)]
+            self.assertEqual(marginals[1].memory.tolist(), expected_memory)
+            self.assertEqual(marginals[1].counts.tolist(), [2, 2, 2, 2])
+
+        marginals = marginal_arrays(result, [[3], None])
+        self.assertEqual(marginals[0].counts.tolist(), [26, 28])
+        self.assertEqual(marginals[1].outcomes.tolist(), list(range(8)))
+        self.assertEqual(marginals[1].num_bits, 4)
+        with self.assertRaises(QiskitError):
+            marginal_arrays(result, [0, 4])
+        with self.assertRaises(ValueError):
+            marginal_arrays(result, [[0]])
+
+    def test_marginal_arrays_bit_array(self):
+        """Test marginalizing a BitArray into integer arrays."""
+        rng = np.random.default_rng(12)
+        for num_bits in (5, 70):
+            bit_array = BitArray.from_bool_array(rng.integers(0, 2, size=(2, 3, 40, num_bits)) > 0)
+            indices = [num_bits - 1, 1, 2, 4]
+            marginals = marginal_arrays(bit_array, indices, memory=True)
+            self.assertEqual(len(marginals), 6)
+            sliced = bit_array.slice_bits(sorted(indices))
+            for marginal, location in zip(marginals, np.ndindex(bit_array.shape)):
+                self.assertEqual(
+                    dict(zip(marginal.outcomes.tolist(), marginal.counts.tolist())),
+                    sliced.get_int_counts(location),
+                )
+                self.assertEqual(
+                    marginal.memory.tolist(),
+                    [int(bits, 2) for bits in sliced.get_bitstrings(location)],
+                )
+
     def test_marginal_counts_result_format(self):
         """Test that marginal_counts with format_marginal true properly formats output."""
         raw_counts_1 = {"0x0": 4, "0x1": 7, "0x2": 10, "0x6": 5, "0x9": 11, "0xD": 9, "0x12": 8}
@@ -0,0 +1,140 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the CompiledTemplate class."""
+
+import numpy as np
+
+from qiskit.circuit import Parameter, ParameterVector, QuantumCircuit
+from qiskit.circuit.library import RGate, U2Gate, UGate
+from qiskit.primitives import BindingsArray
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.quantum_info import Operator
+from qiskit.transpiler import CompiledTemplate
+from test import QiskitTestCase
+
+
+class TestCompiledTemplate(QiskitTestCase):
+    """Test the CompiledTemplate class."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=3, basis_gates=["cx", "rz", "sx", "x"], seed=7)
+        theta = ParameterVector("θ", 4)
+        qc = QuantumCircuit(2)
+        qc.rx(theta[0], 0)
+        qc.ry(theta[1], 1)
+        qc.cx(0, 1)
+        qc.ry(2 * theta[2], 0)
+        qc.rx(theta[3], 1)
+        qc.rz(theta[3] - theta[2], 1)
+        self.circuit = qc
+        self.template = CompiledTemplate.from_circuit(
+            qc, self.backend, optimization_level=3, seed_transpiler=0
+        )
+
+    def assertEquivalentToTemplate(self, bound, values):
+        """Assert that a bound circuit is equivalent to the template bound with ``values``."""
+        expected = self.template.circuit.assign_parameters(values)
+        self.assertEqual(bound.layout, expected.layout)
+        self.assertEqual(Operator(bound), Operator(expected))
+        self.assertLessEqual(len(bound), len(expected))
+        self.assertLessEqual(set(bound.count_ops()), {"cx", "rz", "sx", "x", "measure"})
+
+    def test_assign_parameters(self):
+        """Test binding a single set of values."""
+        self.assertGreater(self.template.num_resynthesized_runs, 0)
+        values = [0.1, -0.4, 1.3, 2.2]
+        bound = self.template.assign_parameters(values)
+        self.assertEqual(bound.num_parameters, 0)
+        self.assertEquivalentToTemplate(bound, values)
+        by_name = dict(zip((p.name for p in self.template.parameters), values))
+        self.assertEqual(self.template.assign_parameters(by_name), bound)
+
+    def test_bind_all(self):
+        """Test binding a bindings array gives an array of the same shape."""
+        rng = np.random.default_rng(0)
+        vals = rng.uniform(-np.pi, np.pi, size=(2, 3, 4))
+        bindings = BindingsArray({tuple(self.template.parameters): vals})
+        bound = self.template.bind_all(bindings)
+        self.assertEqual(bound.shape, (2, 3))
+        for idx in np.ndindex(bound.shape):
+            self.assertEquivalentToTemplate(bound[idx], vals[idx])
+
+    def test_simplifies_trivial_bindings(self):
+        """Test that runs that become the identity on binding are removed."""
+        bound = self.template.assign_parameters([0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(
+            Operator(bound), Operator(self.template.circuit.assign_parameters([0] * 4))
+        )
+        self.assertEqual(bound.count_ops().get("sx", 0), 0)
+
+    def test_keeps_runs_that_do_not_improve(self):
+        """Test that a run is only replaced if the resynthesis has a lower error."""
+        theta = Parameter("θ")
+        qc = QuantumCircuit(1)
+        qc.rz(theta, 0)
+        qc.sx(0)
+        template = CompiledTemplate(qc, basis_gates=["rz", "sx", "x"])
+        self.assertEqual(template.num_resynthesized_runs, 1)
+        for value in (0.3, -1.2, 2.5):
+            self.assertEqual(template.assign_parameters([value]), qc.assign_parameters([value]))
+
+    def test_other_gates(self):
+        """Test that the vectorized matrices of other parametrized gates are correct."""
+        a, b, c = Parameter("a"), Parameter("b"), Parameter("c")
+        qc = QuantumCircuit(1, global_phase=a)
+        qc.append(UGate(a, b, c), [0])
+        qc.append(RGate(b, a), [0])
+        qc.p(c, 0)
+        qc.append(U2Gate(a, b), [0])
+        qc.h(0)
+        template = CompiledTemplate(qc, basis_gates=["u"])
+        self.assertEqual(template.num_resynthesized_runs, 1)
+        values = [0.3, -1.2, 2.5]
+        bound = template.assign_parameters(values)
+        self.assertEqual(Operator(bound), Operator(qc.assign_parameters(values)))
+        self.assertEqual(bound.count_ops(), {"u": 1})
+
+    def test_parameters_outside_runs(self):
+        """Test binding parameters of multi-qubit, custom and global-phase parameters, which are
+        substituted directly rather than resynthesized."""
+        a, b = Parameter("a"), Parameter("b")
+        inner = QuantumCircuit(1)
+        inner.rx(2 * b, 0)
+        qc = QuantumCircuit(2, global_phase=a - b)
+        qc.rzz(a, 0, 1)
+        qc.append(inner.to_gate(label="custom"), [1])
+        qc.cx(0, 1)
+        qc.crx(b + 1, 1, 0)
+        template = CompiledTemplate(qc, basis_gates=["rzz", "crx", "cx", "u"])
+        self.assertEqual(template.num_resynthesized_runs, 0)
+        for values in ([0.3, -1.2], [2.0, 0.5]):
+            bound = template.assign_parameters(values)
+            self.assertEqual(bound.num_parameters, 0)
+            self.assertEqual(Operator(bound), Operator(qc.assign_parameters(values)))
+        self.assertEqual(template.circuit.num_parameters, 2)
+
+    def test_no_parameters(self):
+        """Test that a template without parameters is returned unchanged."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.cx(0, 1)
+        template = CompiledTemplate(qc)
+        self.assertEqual(template.num_resynthesized_runs, 0)
+        self.assertEqual(template.assign_parameters([]), qc)
+        self.assertEqual(template.bind_all(BindingsArray(shape=(2,)))[1], qc)
+
+    def test_wrong_number_of_values(self):
+        """Test that the wrong number of values is rejected."""
+        with self.assertRaises(ValueError):
+            self.template.assign_parameters([1.0])
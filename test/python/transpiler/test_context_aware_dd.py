@@ -587,6 +587,36 @@ class TestContextAwareDD(QiskitTestCase):
         # or if there are more than len(snake) - 2 layers of multi delay operations
         self.assertEqual(num_x, circuit.count_ops().get("x", 0))
 
+    def test_reuse_pass_instance(self):
+        """Test the neighbor tables cached on the pass give the same result across runs."""
+        circuit = QuantumCircuit(5)
+        circuit.sx(circuit.qubits)
+        circuit.barrier()
+        circuit.cx(1, 2)
+        circuit.barrier()
+        circuit.cx(0, 1)
+        circuit.cx(3, 4)
+
+        target = get_toy_target(num_qubits=5, t_cx=self.t_cx)
+        dd = ContextAwareDynamicalDecoupling(target)
+
+        coupling_map = target.build_coupling_map()
+        for qubit in range(target.num_qubits):
+            with self.subTest(qubit=qubit):
+                expected = {
+                    other
+                    for other in range(target.num_qubits)
+                    if coupling_map.distance(qubit, other) == 1
+                }
+                self.assertEqual(expected, dd._neighbors[qubit])
+
+        pm = _get_schedule_pm(target, list(range(circuit.num_qubits)))
+        pm.append(dd)
+        first = pm.run(circuit)
+        second = pm.run(circuit)
+        self.assertEqual(first, second)
+        self.assertGreater(first.count_ops().get("x", 0), 0)
+
     def test_min_duration(self):
         """Test cutting off short peaks below the joinable duration.
 
@@ -769,6 +769,39 @@ class TestPadDynamicalDecoupling(QiskitTestCase):
 
         self.assertEqual(ghz4_dd, expected)
 
+    def test_insert_dd_repeated_idle_periods(self):
+        """Test that idle periods of the same length all get the same DD sequence."""
+        circuit = QuantumCircuit(2)
+        for _ in range(3):
+            for _ in range(10):
+                circuit.u(pi, 0, pi, 0)
+            circuit.cx(0, 1)
+
+        dd_sequence = [XGate(), XGate()]
+        pm = PassManager(
+            [
+                ALAPScheduleAnalysis(self.durations),
+                PadDynamicalDecoupling(self.durations, dd_sequence),
+            ]
+        )
+        circuit_dd = pm.run(circuit)
+
+        expected = QuantumCircuit(2)
+        # The first idle period follows the start of the circuit, so it is not decoupled.
+        expected.delay(1000, 1)
+        for block in range(3):
+            if block:
+                expected.delay(225, 1)
+                expected.x(1)
+                expected.delay(450, 1)
+                expected.x(1)
+                expected.delay(225, 1)
+            for _ in range(10):
+                expected.u(pi, 0, pi, 0)
+            expected.cx(0, 1)
+
+        self.assertEqual(circuit_dd, expected)
+
     def test_dd_can_sequentially_called(self):
         """Test if sequentially called DD pass can output the same circuit.
 
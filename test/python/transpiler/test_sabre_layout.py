@@ -15,6 +15,7 @@
 import unittest
 
 import math
+from unittest.mock import patch
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit import library as lib, Parameter
@@ -26,7 +27,9 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag
 from qiskit.compiler.transpiler import transpile
 from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler.passes.layout import sabre_layout
 from qiskit.transpiler.passes.layout.sabre_pre_layout import SabrePreLayout
+from qiskit._accelerate.sabre import sabre_layout_and_routing
 from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
 from test import QiskitTestCase, slow_test
 
@@ -169,6 +172,13 @@ class TestSabreLayout(QiskitTestCase):
         layout = pass_.property_set["layout"]
         self.assertEqual([layout[q] for q in circuit.qubits], [7, 8, 11, 12, 13, 6])
 
+    def test_coupling_map_shared_through_target(self):
+        """Test that passes on the same target share its symmetric coupling map."""
+        target = GenericBackendV2(num_qubits=20, coupling_map=self.cmap20).target
+        coupling_map = SabreLayout(target, seed=0).coupling_map
+        self.assertTrue(coupling_map.is_symmetric)
+        self.assertIs(coupling_map, SabreLayout(target, seed=1).coupling_map)
+
     def test_layout_with_classical_bits(self):
         """Test sabre layout with classical bits recreate from issue #8635."""
         qc = QuantumCircuit.from_qasm_str(
@@ -351,6 +361,42 @@ barrier q18585[5],q18585[2],q18585[8],q18585[3],q18585[6];
         _ = pm.run(qc)
         self.assertIsNotNone(pm.property_set.get("layout"))
 
+    def test_time_budget(self):
+        """Test that rounds run until the time budget is spent, and the best round is kept."""
+        qc = Unroll3qOrMore()(quantum_volume(10, seed=42))
+        clock = [0.0]
+        round_swaps = []
+
+        def one_second_round(*args, **kwargs):
+            result = sabre_layout_and_routing(*args, **kwargs)
+            clock[0] += 1.0
+            round_swaps.append(result[0].count_ops().get("swap", 0))
+            return result
+
+        pass_ = SabreLayout(
+            CouplingMap(self.cmap20), seed=42, swap_trials=2, layout_trials=2, time_budget=4.5
+        )
+        with (
+            patch.object(sabre_layout, "sabre_layout_and_routing", side_effect=one_second_round),
+            patch.object(sabre_layout, "time") as mock_time,
+        ):
+            mock_time.perf_counter.side_effect = lambda: clock[0]
+            out = pass_(qc)
+        # After four one-second rounds, a fifth would be expected to overrun the budget.
+        self.assertEqual(len(round_swaps), 4)
+        self.assertEqual(out.count_ops().get("swap", 0), min(round_swaps))
+
+    def test_invalid_time_budget(self):
+        """Test the time budget is validated."""
+        with self.assertRaisesRegex(TranspilerError, "must be positive"):
+            SabreLayout(CouplingMap(self.cmap20), time_budget=0)
+        with self.assertRaisesRegex(TranspilerError, "time_budget"):
+            SabreLayout(
+                CouplingMap(self.cmap20),
+                routing_pass=BasicSwap(CouplingMap(self.cmap20)),
+                time_budget=1,
+            )
+
     def test_all_to_all(self):
         """An implicitly all-to-all backend should just become physical with the trivial layout."""
         qc = QuantumCircuit(QuantumRegister(5, "virtuals"))
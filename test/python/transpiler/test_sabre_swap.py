@@ -386,6 +386,68 @@ class TestSabreSwap(QiskitTestCase):
         # Check that a re-run with the same seed produces the same circuit in the exact same order.
         self.assertEqual(normalize_nodes(dag_0), normalize_nodes(pass_0.run(dag)))
 
+    def test_checkpoint_reuse(self):
+        """Test that routing a circuit with the same prefix reuses the checkpointed segments."""
+        prefix = QuantumCircuit(QuantumRegister(6, "q"))
+        for i, j in itertools.combinations(range(6), 2):
+            prefix.cx(i, j)
+        prefix.barrier()
+        first = prefix.copy()
+        first.h(0)
+        first.cx(0, 5)
+        second = prefix.copy()
+        second.cx(5, 0)
+        second.cx(2, 4)
+
+        coupling = CouplingMap.from_line(6)
+        pass_ = SabreSwap(coupling, "lookahead", seed=0, trials=1, checkpoint_interval=4)
+        property_set = {}
+        routed_first = pass_(first, property_set=property_set)
+        checkpoint = property_set["sabre_checkpoint"]
+        self.assertEqual(len(checkpoint.segments), 5)
+
+        property_set = {"sabre_checkpoint": checkpoint}
+        routed_second = pass_(second, property_set=property_set)
+        new_checkpoint = property_set["sabre_checkpoint"]
+        self.assertEqual(len(new_checkpoint.segments), 5)
+        for old, new in zip(checkpoint.segments[:4], new_checkpoint.segments[:4]):
+            self.assertIs(old, new)
+        self.assertIsNot(checkpoint.segments[4], new_checkpoint.segments[4])
+
+        num_reused = sum(len(segment.routed) for segment in checkpoint.segments[:4])
+        self.assertEqual(routed_first.data[:num_reused], routed_second.data[:num_reused])
+        for routed in (routed_first, routed_second):
+            check_map = CheckMap(coupling)
+            check_map(routed)
+            self.assertTrue(check_map.property_set["is_swap_mapped"])
+
+    def test_checkpoint_not_reused_with_other_settings(self):
+        """Test that a checkpoint is not reused with a different heuristic, seed or trials."""
+        qc = QuantumCircuit(QuantumRegister(6, "q"))
+        for i, j in itertools.combinations(range(6), 2):
+            qc.cx(i, j)
+        coupling = CouplingMap.from_line(6)
+        property_set = {}
+        SabreSwap(coupling, "lookahead", seed=0, trials=1, checkpoint_interval=4)(
+            qc, property_set=property_set
+        )
+        checkpoint = property_set["sabre_checkpoint"]
+        for heuristic, seed, trials in [("decay", 0, 1), ("lookahead", 1, 1), ("lookahead", 0, 2)]:
+            with self.subTest(heuristic=heuristic, seed=seed, trials=trials):
+                property_set = {"sabre_checkpoint": checkpoint}
+                pass_ = SabreSwap(
+                    coupling, heuristic, seed=seed, trials=trials, checkpoint_interval=4
+                )
+                pass_(qc, property_set=property_set)
+                new_checkpoint = property_set["sabre_checkpoint"]
+                for old, new in zip(checkpoint.segments, new_checkpoint.segments):
+                    self.assertIsNot(old, new)
+
+    def test_invalid_checkpoint_interval(self):
+        """Test that the checkpoint interval is validated."""
+        with self.assertRaisesRegex(TranspilerError, "must be a positive integer"):
+            SabreSwap(CouplingMap.from_line(4), checkpoint_interval=0)
+
     def test_rejects_too_many_qubits(self):
         """Test that a sensible Python-space error message is emitted if the DAG has an incorrect
         number of qubits."""
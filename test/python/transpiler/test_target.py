@@ -817,6 +817,35 @@ class TestTarget(QiskitTestCase):
         self.assertEqual(self.aqt_target["rxx"][(0, 1)].duration, 1e-6)
         self.assertEqual(self.aqt_target["rxx"][(0, 1)].error, 1e-5)
 
+    def test_cached_analysis(self):
+        """Test that analyses are memoized on the target and discarded when it is modified."""
+        calls = []
+
+        def build(target):
+            calls.append(target)
+            return {name: dict(target[name]) for name in target.operation_names}
+
+        target = self.aqt_target
+        first = target._cached_analysis(build)
+        self.assertIs(first, target._cached_analysis(build))
+        self.assertEqual(len(calls), 1)
+
+        target.update_instruction_properties(
+            "rxx", (0, 1), InstructionProperties(duration=1e-6, error=1e-5)
+        )
+        second = target._cached_analysis(build)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(second["rxx"][(0, 1)].error, 1e-5)
+
+        target.add_instruction(CZGate(), {(0, 1): None})
+        self.assertIn("cz", target._cached_analysis(build))
+        target.dt = 1e-9
+        target._cached_analysis(build)
+        self.assertEqual(len(calls), 4)
+
+        # The cache is not pickled, so an unpickled target recomputes its analyses.
+        self.assertEqual(len(loads(dumps(target))._analysis_cache), 0)
+
     def test_update_instruction_properties_invalid_instruction(self):
         with self.assertRaises(KeyError):
             self.ibm_target.update_instruction_properties("rxx", (0, 1), None)
@@ -0,0 +1,222 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2026.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at https://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the TranspileCache class."""
+
+import os
+import tempfile
+from unittest.mock import patch
+
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.circuit.library import CXGate
+from qiskit.compiler import transpile
+from qiskit.providers.fake_provider import GenericBackendV2
+from qiskit.transpiler import (
+    InstructionProperties,
+    Layout,
+    PassManager,
+    StagedPassManager,
+    TranspileCache,
+)
+from qiskit.transpiler import transpile_cache
+from qiskit.transpiler.passes import Optimize1qGates
+from test import QiskitTestCase
+
+
+def _ghz(num_qubits):
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for i in range(1, num_qubits):
+        qc.cx(0, i)
+    qc.measure_all()
+    return qc
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Test the TranspileCache class."""
+
+    def setUp(self):
+        super().setUp()
+        self.backend = GenericBackendV2(num_qubits=5, seed=42)
+
+    def test_hit_skips_transpilation(self):
+        """Test that a second identical transpilation is answered from the cache."""
+        cache = TranspileCache()
+        expected = transpile(_ghz(4), self.backend, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+        with patch.object(StagedPassManager, "run", side_effect=AssertionError("ran")):
+            actual = transpile(_ghz(4), self.backend, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(actual, expected)
+        self.assertEqual(actual.layout, expected.layout)
+
+    def test_hit_returns_copy(self):
+        """Test that mutating a returned circuit does not affect the cache."""
+        cache = TranspileCache()
+        first = transpile(_ghz(3), self.backend, seed_transpiler=0, cache=cache)
+        expected = first.copy()
+        first.x(0)
+        self.assertEqual(transpile(_ghz(3), self.backend, seed_transpiler=0, cache=cache), expected)
+
+    def test_key_ignores_name(self):
+        """Test that circuits that only differ in name share a key, and hits keep their name."""
+        cache = TranspileCache()
+        first = _ghz(3)
+        first.name = "first"
+        second = _ghz(3)
+        second.name = "second"
+        transpile(first, self.backend, seed_transpiler=0, cache=cache)
+        out = transpile(second, self.backend, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(out.name, "second")
+
+    def test_key_depends_on_options(self):
+        """Test that different seeds, optimization levels and circuits are all misses."""
+        cache = TranspileCache()
+        transpile(_ghz(3), self.backend, seed_transpiler=0, cache=cache)
+        transpile(_ghz(3), self.backend, seed_transpiler=1, cache=cache)
+        transpile(_ghz(3), self.backend, seed_transpiler=0, optimization_level=0, cache=cache)
+        transpile(_ghz(4), self.backend, seed_transpiler=0, cache=cache)
+        transpile(_ghz(3), self.backend, seed_transpiler=0, initial_layout=[4, 3, 2], cache=cache)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 5, 5))
+
+    def test_key_depends_on_target(self):
+        """Test that a change in the target's instruction properties is a miss."""
+        cache = TranspileCache()
+        target = GenericBackendV2(num_qubits=3, seed=1).target
+        transpile(_ghz(3), target=target, seed_transpiler=0, cache=cache)
+        transpile(_ghz(3), target=target, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+        transpile(_ghz(3), target=target, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_target_fingerprint(self):
+        """Test that equal targets have equal fingerprints."""
+        target_a = GenericBackendV2(num_qubits=3, seed=1).target
+        target_b = GenericBackendV2(num_qubits=3, seed=1).target
+        self.assertEqual(
+            TranspileCache.target_fingerprint(target_a), TranspileCache.target_fingerprint(target_b)
+        )
+        target_b.add_instruction(CXGate(), {(2, 0): None}, name="cx_rev")
+        self.assertNotEqual(
+            TranspileCache.target_fingerprint(target_a), TranspileCache.target_fingerprint(target_b)
+        )
+
+    def test_target_fingerprint_memoized(self):
+        """Test that the instructions of a target are only walked again after they change."""
+        target = GenericBackendV2(num_qubits=3, seed=1).target
+        with patch.object(
+            transpile_cache, "_operation_key", wraps=transpile_cache._operation_key
+        ) as operation_key:
+            first = TranspileCache.target_fingerprint(target)
+            walked = operation_key.call_count
+            self.assertGreater(walked, 0)
+            self.assertEqual(first, TranspileCache.target_fingerprint(target))
+            self.assertEqual(operation_key.call_count, walked)
+            target.update_instruction_properties("cx", (0, 1), InstructionProperties(error=0.5))
+            self.assertNotEqual(first, TranspileCache.target_fingerprint(target))
+            self.assertEqual(operation_key.call_count, 2 * walked)
+
+    def test_list_with_partial_hits(self):
+        """Test that only the circuits that miss the cache are transpiled."""
+        cache = TranspileCache()
+        transpile([_ghz(2), _ghz(3)], self.backend, seed_transpiler=0, cache=cache)
+        with patch.object(StagedPassManager, "run") as mock_run:
+            mock_run.side_effect = lambda circuits, **_: [QuantumCircuit(5) for _ in circuits]
+            out = transpile(
+                [_ghz(3), _ghz(4), _ghz(2)], self.backend, seed_transpiler=0, cache=cache
+            )
+        self.assertEqual(len(mock_run.call_args.args[0]), 1)
+        self.assertEqual(len(out), 3)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+    def test_parameters(self):
+        """Test that circuits with unbound parameters are cached by parameter identity."""
+        cache = TranspileCache()
+        theta = Parameter("θ")
+        qc = QuantumCircuit(1)
+        qc.rx(theta, 0)
+        first = transpile(qc, self.backend, seed_transpiler=0, cache=cache)
+        second = transpile(qc, self.backend, seed_transpiler=0, cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(first.parameters, second.parameters)
+        other = QuantumCircuit(1)
+        other.rx(Parameter("θ"), 0)
+        transpile(other, self.backend, seed_transpiler=0, cache=cache)
+        self.assertEqual(cache.hits, 1)
+
+    def test_uncacheable(self):
+        """Test that callbacks and unfingerprintable options bypass the cache."""
+        cache = TranspileCache()
+        qc = _ghz(2)
+        layout = Layout.from_intlist([0, 1], *qc.qregs)
+        for _ in range(2):
+            transpile(qc, self.backend, initial_layout=layout, seed_transpiler=0, cache=cache)
+            transpile(qc, self.backend, callback=lambda **_: None, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 0, 0))
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = TranspileCache(max_size=2)
+        for num_qubits in (2, 3, 2, 4):
+            transpile(_ghz(num_qubits), self.backend, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (1, 3, 2))
+        transpile(_ghz(2), self.backend, seed_transpiler=0, cache=cache)
+        transpile(_ghz(3), self.backend, seed_transpiler=0, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_directory(self):
+        """Test that the on-disk store persists between cache instances."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = TranspileCache(directory=directory)
+            expected = transpile(_ghz(4), self.backend, seed_transpiler=0, cache=cache)
+            self.assertEqual(len([f for f in os.listdir(directory) if f.endswith(".qpy")]), 1)
+
+            new_cache = TranspileCache(directory=directory)
+            actual = transpile(_ghz(4), self.backend, seed_transpiler=0, cache=new_cache)
+            self.assertEqual((new_cache.hits, new_cache.misses), (1, 0))
+            self.assertEqual(actual, expected)
+            self.assertEqual(actual.layout, expected.layout)
+
+    def test_corrupt_file_is_miss(self):
+        """Test that an unreadable cache file is treated as a miss."""
+        with tempfile.TemporaryDirectory() as directory:
+            transpile(
+                _ghz(2), self.backend, seed_transpiler=0, cache=TranspileCache(directory=directory)
+            )
+            for filename in os.listdir(directory):
+                with open(os.path.join(directory, filename), "wb") as fd:
+                    fd.write(b"not qpy")
+            cache = TranspileCache(directory=directory)
+            with self.assertLogs("qiskit.transpiler.transpile_cache", level="WARNING"):
+                transpile(_ghz(2), self.backend, seed_transpiler=0, cache=cache)
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_run(self):
+        """Test caching the output of an arbitrary pass manager."""
+        cache = TranspileCache()
+        qc = QuantumCircuit(1)
+        qc.h(0)
+        qc.h(0)
+        pm = PassManager([Optimize1qGates(["u3"])])
+        expected = pm.run(qc)
+        self.assertEqual(cache.run(pm, qc, key="optimize"), expected)
+        self.assertEqual(cache.run(pm, [qc, qc], key="optimize"), [expected, expected])
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        cache.run(pm, qc, key="other")
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+
+    def test_invalid_size(self):
+        """Test that a negative size is rejected."""
+        with self.assertRaises(ValueError):
+            TranspileCache(max_size=-1)
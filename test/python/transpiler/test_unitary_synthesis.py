@@ -28,6 +28,11 @@ from qiskit.circuit.library import quantum_volume
 from qiskit.circuit.parameterexpression import ParameterValueType
 from qiskit.converters import circuit_to_dag, dag_to_circuit
 from qiskit.transpiler.passes import UnitarySynthesis
+from qiskit.transpiler.passes.synthesis.unitary_synthesis import (
+    _build_gate_errors,
+    _build_gate_errors_by_qubit,
+    _target_analysis,
+)
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info import random_unitary
 from qiskit.quantum_info import get_clifford_gate_names
@@ -1192,6 +1197,20 @@ class TestUnitarySynthesisTarget(QiskitTestCase):
 
         _ = UnitarySynthesis(basis_gates=["cx", "u"])(circuit)
 
+    def test_plugins_get_copies_of_target_tables(self):
+        """Test that the gate tables handed to plugins are not the ones memoized on the target, so
+        a plugin modifying them does not affect later runs."""
+        target = FakeBackend5QV2().target
+        for build in (_build_gate_errors, _build_gate_errors_by_qubit):
+            with self.subTest(build=build.__name__):
+                expected = build(target)
+                first = _target_analysis(target, build)
+                self.assertEqual(first, expected)
+                for value in first.values():
+                    value.clear()
+                first.clear()
+                self.assertEqual(_target_analysis(target, build), expected)
+
 
 if __name__ == "__main__":
     unittest.main()